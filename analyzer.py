@@ -9,14 +9,174 @@ Contains the BikeShareSystem class that orchestrates:
 Students should implement the cleaning logic and at least 10 analytics methods.
 """
 
+import calendar
+import functools
+
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
 from pathlib import Path
+from typing import TextIO
 
 
 DATA_DIR = Path(__file__).resolve().parent / "data"
 OUTPUT_DIR = Path(__file__).resolve().parent / "output"
 
+# Column types for the raw CSVs, applied by the pyarrow CSV reader at read
+# time. Only these columns are materialized (``include_columns``).
+TRIPS_SCHEMA = {
+    "trip_id": pa.string(),
+    "user_id": pa.string(),
+    "user_type": pa.string(),
+    "bike_id": pa.string(),
+    "bike_type": pa.string(),
+    "start_station_id": pa.string(),
+    "end_station_id": pa.string(),
+    "start_time": pa.timestamp("ns"),
+    "end_time": pa.timestamp("ns"),
+    "duration_minutes": pa.float64(),
+    "distance_km": pa.float64(),
+    "status": pa.string(),
+}
+
+STATIONS_SCHEMA = {
+    "station_id": pa.string(),
+    "station_name": pa.string(),
+    "capacity": pa.int64(),
+    "latitude": pa.float64(),
+    "longitude": pa.float64(),
+}
+
+MAINTENANCE_SCHEMA = {
+    "record_id": pa.string(),
+    "bike_id": pa.string(),
+    "bike_type": pa.string(),
+    "date": pa.timestamp("ns"),
+    "maintenance_type": pa.string(),
+    "cost": pa.float64(),
+    "description": pa.string(),
+}
+
+# Arrow strings stay Arrow-backed in pandas; numbers and timestamps become
+# plain NumPy columns.
+_TYPES_MAPPER = {pa.string(): pd.StringDtype("pyarrow")}.get
+
+
+def _read_csv(name: str, schema: dict[str, pa.DataType]) -> pd.DataFrame:
+    """Read ``data/<name>.csv`` with pyarrow's multi-threaded CSV reader.
+
+    Column types come from *schema*, so nothing is inferred and numbers and
+    timestamps are parsed once, during I/O. Only the columns in *schema*
+    are read; any others in the file are dropped.
+
+    Arrow rejects the whole file on a single malformed value. In that case
+    the file is re-read with every column as a string and the typed columns
+    are coerced by pandas, so bad values become NaT/NaN and ``clean_data``
+    drops their rows.
+    """
+    path = DATA_DIR / f"{name}.csv"
+    options = dict(
+        include_columns=list(schema),
+        null_values=["", "NA", "NaN", "nan", "null"],
+        strings_can_be_null=True,
+    )
+    try:
+        table = pa_csv.read_csv(
+            path, convert_options=pa_csv.ConvertOptions(column_types=schema, **options)
+        )
+    except pa.ArrowInvalid:
+        as_strings = {col: pa.string() for col in schema}
+        table = pa_csv.read_csv(
+            path, convert_options=pa_csv.ConvertOptions(column_types=as_strings, **options)
+        )
+        df = table.to_pandas(types_mapper=_TYPES_MAPPER)
+        for col, dtype in schema.items():
+            if pa.types.is_timestamp(dtype):
+                df[col] = pd.to_datetime(df[col], errors="coerce").astype(dtype.to_pandas_dtype())
+            elif not pa.types.is_string(dtype):
+                # Plain NumPy columns as on the fast path; integers widen
+                # to float64 only when a value could not be parsed.
+                numbers = pd.to_numeric(df[col], errors="coerce")
+                df[col] = numbers.astype(np.float64 if numbers.hasnans else dtype.to_pandas_dtype())
+        return df
+    return table.to_pandas(types_mapper=_TYPES_MAPPER)
+
+
+def _clean_cache(name: str) -> Path | None:
+    """Return ``data/<name>_clean.parquet`` if it is newer than ``<name>.csv``."""
+    cached = DATA_DIR / f"{name}_clean.parquet"
+    raw = DATA_DIR / f"{name}.csv"
+    if cached.exists() and cached.stat().st_mtime > raw.stat().st_mtime:
+        return cached
+    return None
+
+
+def _normalize_category(col: pd.Series) -> pd.Series:
+    """Trim and lower-case a string column, then store it as a category.
+
+    The column is dictionary-encoded first, so the string work runs once
+    per distinct value rather than once per row; labels that collapse to
+    the same normalized value share one category; trim and lower-case run
+    as Arrow compute kernels. Missing values stay missing.
+    """
+    codes, uniques = pd.factorize(col)
+    raw = pa.array(np.asarray(uniques, dtype=object), type=pa.string())
+    labels = pd.Index(pd.array(pc.utf8_lower(pc.utf8_trim_whitespace(raw)), dtype="string[pyarrow]"))
+    categories = labels.unique().sort_values()
+    remap = categories.get_indexer(labels)
+    if remap.size:
+        codes = np.where(codes >= 0, remap[codes], -1)
+    return pd.Series(
+        pd.Categorical.from_codes(codes, categories=categories),
+        index=col.index,
+        name=col.name,
+    )
+
+
+def _top_n_indices(counts: np.ndarray, n: int) -> np.ndarray:
+    """Positions of the *n* largest *counts*, largest first.
+
+    Uses ``np.argpartition`` to find the n-th largest value in linear time,
+    then sorts only the candidates. Ties keep position order, exactly as a
+    stable full sort would.
+    """
+    if n <= 0:
+        return np.empty(0, dtype=np.intp)
+    if n < counts.size:
+        threshold = counts[np.argpartition(-counts, n - 1)[n - 1]]
+        candidates = np.flatnonzero(counts >= threshold)
+    else:
+        candidates = np.arange(counts.size)
+    order = np.argsort(-counts[candidates], kind="stable")
+    return candidates[order[:n]]
+
+
+def _write_section(f: TextIO, title: str, table: pd.Series | pd.DataFrame, **kwargs) -> None:
+    """Write a ``--- title ---`` report section with *table* rendered into *f*."""
+    f.write(f"\n--- {title} ---\n")
+    table.to_string(buf=f, **kwargs)
+    f.write("\n")
+
+
+def _memoize(method):
+    """Cache an analytics method's result on the instance.
+
+    Results live in ``self._cache`` keyed by method name and arguments;
+    ``load_data`` and ``clean_data`` clear it whenever the tables change.
+    Callers share the cached object, so treat results as read-only.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        try:
+            return self._cache[key]
+        except KeyError:
+            result = self._cache[key] = method(self, *args, **kwargs)
+            return result
+    return wrapper
+
 
 class BikeShareSystem:
     """Central analysis class — loads, cleans, and analyzes bike-share data.
@@ -31,16 +191,31 @@ class BikeShareSystem:
         self.trips: pd.DataFrame | None = None
         self.stations: pd.DataFrame | None = None
         self.maintenance: pd.DataFrame | None = None
+        self._cache: dict = {}
+        self._station_name: dict[str, str] = {}
 
     # ------------------------------------------------------------------
     # Data loading
     # ------------------------------------------------------------------
 
     def load_data(self) -> None:
-        """Load raw CSV files into DataFrames."""
-        self.trips = pd.read_csv(DATA_DIR / "trips.csv")
-        self.stations = pd.read_csv(DATA_DIR / "stations.csv")
-        self.maintenance = pd.read_csv(DATA_DIR / "maintenance.csv")
+        """Load the trip, station and maintenance tables.
+
+        Prefers the cleaned Parquet files written by ``clean_data`` when
+        they are newer than the raw CSVs. Otherwise the CSVs are read with
+        ``pyarrow.csv`` and explicit schemas (see ``_read_csv``), so numbers
+        and timestamps are parsed once during I/O rather than inferred and
+        re-converted in ``clean_data``.
+        """
+        self._cache.clear()
+        cached = _clean_cache("trips")
+        self.trips = pd.read_parquet(cached) if cached else _read_csv("trips", TRIPS_SCHEMA)
+        cached = _clean_cache("stations")
+        self.stations = pd.read_parquet(cached) if cached else _read_csv("stations", STATIONS_SCHEMA)
+        cached = _clean_cache("maintenance")
+        self.maintenance = (
+            pd.read_parquet(cached) if cached else _read_csv("maintenance", MAINTENANCE_SCHEMA)
+        )
 
         print(f"Loaded trips: {self.trips.shape}")
         print(f"Loaded stations: {self.stations.shape}")
@@ -50,8 +225,13 @@ class BikeShareSystem:
     # Data inspection (provided)
     # ------------------------------------------------------------------
 
-    def inspect_data(self) -> None:
-        """Print basic info about each DataFrame."""
+    def inspect_data(self, sample: int = 10_000) -> None:
+        """Print basic info about each DataFrame.
+
+        Args:
+            sample: Missing values are counted on a random sample of at
+                most this many rows, so large tables are not fully scanned.
+        """
         for name, df in [
             ("Trips", self.trips),
             ("Stations", self.stations),
@@ -61,7 +241,12 @@ class BikeShareSystem:
             print(f"  {name}")
             print(f"{'='*40}")
             print(df.info())
-            print(f"\nMissing values:\n{df.isnull().sum()}")
+            if len(df) > sample:
+                counted = df.sample(sample, random_state=0)
+                label = f"Missing values (sample of {sample} rows)"
+            else:
+                counted, label = df, "Missing values"
+            print(f"\n{label}:\n{counted.isnull().sum()}")
             print(f"\nFirst 3 rows:\n{df.head(3)}")
 
     # ------------------------------------------------------------------
@@ -69,83 +254,100 @@ class BikeShareSystem:
     # ------------------------------------------------------------------
 
     def clean_data(self) -> None:
-        """Clean all DataFrames and export to CSV.
+        """Clean all DataFrames and export them to Parquet.
+
+        Dates and numbers are already typed by ``load_data``'s schemas, so
+        steps 1-3 are pure row filters. Every per-column conversion (step 4,
+        downcasts, derived columns) runs afterwards, on surviving rows only.
 
         Steps implemented:
             1. Remove duplicate rows
-            2. Parse date/datetime columns
-            3. Convert numeric columns stored as strings
-            4. Handle missing values
-            5. Remove invalid entries (e.g., end_time < start_time)
-            6. Standardize categorical values
-            7. Export cleaned data
+            2. Handle missing values
+            3. Remove invalid entries (e.g., end_time < start_time)
+            4. Standardize categorical values
+            5. Export cleaned data
         """
         if self.trips is None or self.stations is None or self.maintenance is None:
             raise RuntimeError("Call load_data() first")
+        self._cache.clear()
 
-        # -------------------------------
-        # 1️⃣ Remove duplicates
-        # -------------------------------
-        self.trips = self.trips.drop_duplicates(subset=["trip_id"])
-        self.stations = self.stations.drop_duplicates(subset=["station_id"])
-        self.maintenance = self.maintenance.drop_duplicates(subset=["record_id"])
-        print(f"After dedup: {self.trips.shape[0]} trips, "
-            f"{self.stations.shape[0]} stations, "
-            f"{self.maintenance.shape[0]} maintenance records")
+        # Steps 1-3 only build NumPy row masks (no index alignment); each
+        # table is materialized once at the end instead of once per step.
 
         # -------------------------------
-        # 2️⃣ Parse date/datetime columns
+        # 1️⃣ Remove duplicates
         # -------------------------------
-        self.trips["start_time"] = pd.to_datetime(self.trips["start_time"], errors="coerce")
-        self.trips["end_time"] = pd.to_datetime(self.trips["end_time"], errors="coerce")
-        self.maintenance["date"] = pd.to_datetime(self.maintenance["date"], errors="coerce")
+        trips_keep = ~self.trips.duplicated(subset=["trip_id"]).to_numpy()
+        stations_keep = ~self.stations.duplicated(subset=["station_id"]).to_numpy()
+        maint_keep = ~self.maintenance.duplicated(subset=["record_id"]).to_numpy()
+        print(f"After dedup: {trips_keep.sum()} trips, "
+            f"{stations_keep.sum()} stations, "
+            f"{maint_keep.sum()} maintenance records")
 
         # -------------------------------
-        # 3️⃣ Convert numeric columns
+        # 2️⃣ Handle missing values
         # -------------------------------
-        numeric_cols = ["duration_minutes", "distance_km"]
-        for col in numeric_cols:
-            self.trips[col] = pd.to_numeric(self.trips[col], errors="coerce")
+        # Trips: drop rows missing critical info
+        trips_keep &= self.trips[["trip_id", "user_id", "bike_id",
+                                  "start_station_id", "end_station_id",
+                                  "start_time", "end_time", "duration_minutes", "distance_km", "status"]].notna().all(axis=1).to_numpy()
 
-        self.maintenance["cost"] = pd.to_numeric(self.maintenance["cost"], errors="coerce")
+        # Maintenance: drop rows missing key info
+        maint_keep &= self.maintenance[["record_id", "bike_id", "date", "maintenance_type", "cost"]].notna().all(axis=1).to_numpy()
 
         # -------------------------------
-        # 4️⃣ Handle missing values
+        # 3️⃣ Remove invalid entries
         # -------------------------------
-        # Trips: drop rows missing critical info
-        self.trips = self.trips.dropna(subset=["trip_id", "user_id", "bike_id",
-                                            "start_station_id", "end_station_id",
-                                            "start_time", "end_time", "duration_minutes", "distance_km", "status"])
+        start = self.trips["start_time"].to_numpy()
+        end = self.trips["end_time"].to_numpy()
+        duration = self.trips["duration_minutes"].to_numpy()
+        distance = self.trips["distance_km"].to_numpy()
+        trips_keep &= (end >= start) & (duration >= 0) & (distance >= 0)
 
-        # Maintenance: drop rows missing key info
-        self.maintenance = self.maintenance.dropna(subset=["record_id", "bike_id", "date", "maintenance_type", "cost"])
+        self.trips = self.trips.take(np.flatnonzero(trips_keep)).reset_index(drop=True)
+        self.stations = self.stations.take(np.flatnonzero(stations_keep)).reset_index(drop=True)
+        self.maintenance = self.maintenance.take(np.flatnonzero(maint_keep)).reset_index(drop=True)
 
         # Stations: fill missing names with "Unknown"
         self.stations["station_name"] = self.stations["station_name"].fillna("Unknown")
+        self._station_name = dict(zip(self.stations["station_id"], self.stations["station_name"]))
 
         # -------------------------------
-        # 5️⃣ Remove invalid entries
+        # 4️⃣ Standardize categorical values
         # -------------------------------
-        self.trips = self.trips[self.trips["end_time"] >= self.trips["start_time"]]
-        self.trips = self.trips[self.trips["duration_minutes"] >= 0]
-        self.trips = self.trips[self.trips["distance_km"] >= 0]
+        cat_cols = [c for c in ("status", "user_type", "bike_type") if c in self.trips.columns]
+        self.trips[cat_cols] = self.trips[cat_cols].apply(_normalize_category)
+
+        for col in ("maintenance_type", "bike_type"):
+            self.maintenance[col] = _normalize_category(self.maintenance[col])
+
+        # Trip/cost magnitudes are far below float32's precision limits;
+        # halving the bytes halves the bandwidth of every aggregation.
+        for col in ("duration_minutes", "distance_km"):
+            self.trips[col] = pd.to_numeric(self.trips[col], downcast="float")
+        self.maintenance["cost"] = pd.to_numeric(self.maintenance["cost"], downcast="float")
+
+        # Time buckets used by the analytics, derived once here rather
+        # than re-extracted from start_time on every call.
+        start = self.trips["start_time"]
+        self.trips["start_hour"] = start.dt.hour.astype("uint8")
+        self.trips["start_dow"] = start.dt.dayofweek.astype("uint8")
+        self.trips["start_month"] = start.to_numpy().astype("datetime64[M]")
+
+        # Station IDs repeat across thousands of trips: dictionary-encode
+        # them so value_counts/groupby hash small integer codes.
+        for col in ("start_station_id", "end_station_id"):
+            self.trips[col] = self.trips[col].astype("category")
 
         # -------------------------------
-        # 6️⃣ Standardize categorical values
-        # -------------------------------
-        cat_cols = ["status", "user_type", "bike_type"]
-        for col in cat_cols:
-            if col in self.trips.columns:
-                self.trips[col] = self.trips[col].str.lower().str.strip()
-
-        self.maintenance["maintenance_type"] = self.maintenance["maintenance_type"].str.lower().str.strip()
-
+        # 5️⃣ Export cleaned datasets
         # -------------------------------
-        # 7️⃣ Export cleaned datasets
-        # -------------------------------
-        self.trips.to_csv(DATA_DIR / "trips_clean.csv", index=False)
-        self.stations.to_csv(DATA_DIR / "stations_clean.csv", index=False)
-        self.maintenance.to_csv(DATA_DIR / "maintenance_clean.csv", index=False)
+        for name, df in [
+            ("trips", self.trips),
+            ("stations", self.stations),
+            ("maintenance", self.maintenance),
+        ]:
+            df.to_parquet(DATA_DIR / f"{name}_clean.parquet", engine="pyarrow", compression="zstd")
 
         print("Cleaning complete.")
         print(f"Cleaned trips: {self.trips.shape[0]}, stations: {self.stations.shape[0]}, maintenance: {self.maintenance.shape[0]}")
@@ -155,6 +357,7 @@ class BikeShareSystem:
     # Analytics — Business Questions
     # ------------------------------------------------------------------
 
+    @_memoize
     def total_trips_summary(self) -> dict:
         """Q1: Total trips, total distance, average duration.
 
@@ -164,89 +367,107 @@ class BikeShareSystem:
         df = self.trips
         return {
             "total_trips": len(df),
-            "total_distance_km": round(df["distance_km"].sum(), 2),
-            "avg_duration_min": round(df["duration_minutes"].mean(), 2),
+            "total_distance_km": round(float(df["distance_km"].sum()), 2),
+            "avg_duration_min": round(float(df["duration_minutes"].mean()), 2),
         }
 
+    @_memoize
     def top_start_stations(self, n: int = 10) -> pd.DataFrame:
-        counts = (
-            self.trips["start_station_id"]
-            .value_counts()
-            .head(n)
-            .reset_index()
-        )
-
-        counts.columns = ["station_id", "trip_count"]
-
-        merged = counts.merge(
-            self.stations[["station_id", "station_name"]],
-            on="station_id",
-            how="left",
-        )
+        station = self.trips["start_station_id"].cat
+        per_station = np.bincount(station.codes.to_numpy(np.int64), minlength=len(station.categories))
+        # Only stations with trips, as value_counts would list
+        used = np.flatnonzero(per_station)
+        top = used[_top_n_indices(per_station[used], n)]
 
-        return merged[["station_name", "trip_count"]]
+        # A dict lookup for the handful of top IDs, not a DataFrame merge.
+        names = [self._station_name.get(sid, "Unknown") for sid in station.categories[top]]
+        return pd.DataFrame({"station_name": names, "trip_count": per_station[top]})
 
 
+    @_memoize
     def peak_usage_hours(self) -> pd.Series:
-        hours = self.trips["start_time"].dt.hour
-        return hours.value_counts().sort_index()
+        # The domain is fixed (0-23): one counting pass, no hashing or sort.
+        counts = np.bincount(self.trips["start_hour"].to_numpy(), minlength=24)
+        return pd.Series(counts, index=pd.RangeIndex(24, name="start_time"), name="count")
 
 
+    @_memoize
     def busiest_day_of_week(self) -> pd.Series:
-        days = self.trips["start_time"].dt.day_name()
-        return days.value_counts()
+        # Count on the integer weekday, then label only the 7 results
+        # rather than building a day-name string for every trip.
+        counts = np.bincount(self.trips["start_dow"].to_numpy(), minlength=7)
+        days = pd.Series(counts, index=pd.Index(list(calendar.day_name), name="start_time"), name="count")
+        return days.sort_values(ascending=False, kind="stable")
 
 
+    @_memoize
     def avg_distance_by_user_type(self) -> pd.Series:
         return (
             self.trips
-            .groupby("user_type")["distance_km"]
+            .groupby("user_type", observed=True)["distance_km"]
             .mean()
             .round(2)
         )
 
 
+    @_memoize
     def monthly_trip_trend(self) -> pd.Series:
-        monthly = (
-            self.trips
-            .set_index("start_time")
-            .resample("ME")
-            .size()
+        # Months since the epoch make a dense integer domain, so the counts
+        # are one bincount; months without trips come out as 0.
+        months = self.trips["start_month"].to_numpy().astype("datetime64[M]").astype(np.int64)
+        if months.size == 0:
+            return pd.Series([], index=pd.DatetimeIndex([], freq="ME", name="start_time"), dtype=np.int64)
+        first = months.min()
+        counts = np.bincount(months - first)
+        index = pd.date_range(
+            start=np.datetime64(int(first), "M").astype("datetime64[ns]"),
+            periods=counts.size, freq="ME", name="start_time",
         )
+        monthly = pd.Series(counts, index=index)
         return monthly
 
 
+    @_memoize
     def top_active_users(self, n: int = 15) -> pd.DataFrame:
-        top_users = (
-            self.trips
-            .groupby("user_id")
-            .size()
-            .sort_values(ascending=False)
-            .head(n)
-            .reset_index(name="trip_count")
-        )
+        codes, users = pd.factorize(self.trips["user_id"])
+        per_user = np.bincount(codes)
+        top = _top_n_indices(per_user, n)
+        top_users = pd.DataFrame({"user_id": users[top], "trip_count": per_user[top]})
         return top_users
 
 
+    @_memoize
     def maintenance_cost_by_bike_type(self) -> pd.Series:
-        self.maintenance["bike_type"] = self.maintenance["bike_type"].str.lower().str.strip()
-        
-        return self.maintenance.groupby("bike_type")["cost"].sum().round(2)
+        return (
+            self.maintenance
+            .groupby("bike_type", observed=True)["cost"]
+            .sum()
+            .astype("float64")
+            .round(2)
+        )
 
 
 
+    @_memoize
     def top_routes(self, n: int = 10) -> pd.DataFrame:
-        routes = (
-            self.trips
-            .groupby(["start_station_id", "end_station_id"])
-            .size()
-            .sort_values(ascending=False)
-            .head(n)
-            .reset_index(name="trip_count")
-        )
+        # Pack each (start, end) pair of category codes into one int64 so
+        # the pairs are counted as a single column.
+        start = self.trips["start_station_id"].cat
+        end = self.trips["end_station_id"].cat
+        width = len(end.categories)
+        keys = start.codes.to_numpy(np.int64) * width + end.codes.to_numpy(np.int64)
+
+        pairs, counts = np.unique(keys, return_counts=True)
+        top = _top_n_indices(counts, n)
+        routes = pd.DataFrame({
+            "start_station_id": start.categories[pairs[top] // width],
+            "end_station_id": end.categories[pairs[top] % width],
+            "trip_count": counts[top],
+        })
 
         return routes
 
+    @_memoize
     def trip_completion_rate(self) -> float:
         if self.trips.empty:
             return 0.0
@@ -255,15 +476,16 @@ class BikeShareSystem:
         return (completed_count / total_count) * 100
 
 
+    @_memoize
     def avg_trips_per_user_by_type(self) -> pd.DataFrame:
         """Average number of trips per user, segmented by user type."""
         if self.trips.empty:
             return pd.DataFrame(columns=["user_type", "avg_trips"])
 
         avg_trips = (
-            self.trips.groupby("user_type")
+            self.trips.groupby("user_type", observed=True)
             .size()
-            .div(self.trips.groupby("user_type")["user_id"].nunique())
+            .div(self.trips.groupby("user_type", observed=True)["user_id"].nunique())
             .reset_index(name="avg_trips")
         )
         return avg_trips
@@ -279,70 +501,53 @@ class BikeShareSystem:
         OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
         report_path = OUTPUT_DIR / "summary_report.txt"
 
-        lines: list[str] = []
-        lines.append("=" * 60)
-        lines.append("  CityBike — Summary Report")
-        lines.append("=" * 60)
-
-        # --- Q1: Overall summary ---
-        summary = self.total_trips_summary()
-        lines.append("\n--- Overall Summary ---")
-        lines.append(f"  Total trips       : {summary['total_trips']}")
-        lines.append(f"  Total distance    : {summary['total_distance_km']} km")
-        lines.append(f"  Avg duration      : {summary['avg_duration_min']} min")
-
-        # --- Q2: Top start stations ---
-        top_stations = self.top_start_stations()
-        lines.append("\n--- Top 10 Start Stations ---")
-        lines.append(top_stations.to_string(index=False))
-
-        # --- Q3: Peak usage hours ---
-        hours = self.peak_usage_hours()
-        lines.append("\n--- Peak Usage Hours ---")
-        lines.append(hours.to_string())
-
-        # --- Q4: Busiest Day of Week ---
-        days = self.busiest_day_of_week()
-        lines.append("\n--- Busiest Day of Week ---")
-        lines.append(days.to_string())
-
-        # --- Q5: Avg Distance by User Type ---
-        avg_dist = self.avg_distance_by_user_type()
-        lines.append("\n--- Avg Distance by User Type ---")
-        lines.append(avg_dist.to_string())
-
-        # --- Q7: Monthly Trip Trend ---
-        monthly = self.monthly_trip_trend()
-        lines.append("\n--- Monthly Trip Trend ---")
-        lines.append(monthly.to_string())
-
-        # --- Q8: Top Active Users ---
-        top_users = self.top_active_users()
-        lines.append("\n--- Top 15 Active Users ---")
-        lines.append(top_users.to_string(index=False))
-
-        # --- Q9: Maintenance Cost by Bike Type ---
-        maint_cost = self.maintenance_cost_by_bike_type()
-        lines.append("\n--- Maintenance Cost by Bike Type ---")
-        lines.append(maint_cost.to_string())
-
-        # --- Q10: Top Routes ---
-        routes = self.top_routes()
-        lines.append("\n--- Top Routes ---")
-        lines.append(routes.to_string(index=False))
-
-        # --- Q11: Trip Completion Rate ---
-        completion_rate = self.trip_completion_rate()
-        lines.append("\n--- Trip Completion Rate ---")
-        lines.append(f"Completed Trips: {completion_rate:.2f}%")
-
-        # --- Q12: Avg Trips per User by Type ---
-        avg_trips = self.avg_trips_per_user_by_type()
-        lines.append("\n--- Average Trips per User (by User Type) ---")
-        lines.append(avg_trips.to_string(index=False))
-
-
-
-        report_text = "\n".join(lines) + "\n"
-        report_path.write_text(report_text)
+        # Sections stream straight into the file; tables are rendered with
+        # to_string(buf=f) rather than built up as strings first.
+        with report_path.open("w") as f:
+            f.write("=" * 60 + "\n")
+            f.write("  CityBike — Summary Report\n")
+            f.write("=" * 60 + "\n")
+
+            # --- Q1: Overall summary ---
+            summary = self.total_trips_summary()
+            f.write("\n--- Overall Summary ---\n")
+            f.write(f"  Total trips       : {summary['total_trips']}\n")
+            f.write(f"  Total distance    : {summary['total_distance_km']} km\n")
+            f.write(f"  Avg duration      : {summary['avg_duration_min']} min\n")
+
+            # --- Q2: Top start stations ---
+            _write_section(f, "Top 10 Start Stations", self.top_start_stations(), index=False)
+
+            # --- Q3: Peak usage hours ---
+            _write_section(f, "Peak Usage Hours", self.peak_usage_hours())
+
+            # --- Q4: Busiest Day of Week ---
+            _write_section(f, "Busiest Day of Week", self.busiest_day_of_week())
+
+            # --- Q5: Avg Distance by User Type ---
+            _write_section(f, "Avg Distance by User Type", self.avg_distance_by_user_type())
+
+            # --- Q7: Monthly Trip Trend ---
+            _write_section(f, "Monthly Trip Trend", self.monthly_trip_trend())
+
+            # --- Q8: Top Active Users ---
+            _write_section(f, "Top 15 Active Users", self.top_active_users(), index=False)
+
+            # --- Q9: Maintenance Cost by Bike Type ---
+            _write_section(f, "Maintenance Cost by Bike Type", self.maintenance_cost_by_bike_type())
+
+            # --- Q10: Top Routes ---
+            _write_section(f, "Top Routes", self.top_routes(), index=False)
+
+            # --- Q11: Trip Completion Rate ---
+            completion_rate = self.trip_completion_rate()
+            f.write("\n--- Trip Completion Rate ---\n")
+            f.write(f"Completed Trips: {completion_rate:.2f}%\n")
+
+            # --- Q12: Avg Trips per User by Type ---
+            _write_section(
+                f, "Average Trips per User (by User Type)",
+                self.avg_trips_per_user_by_type(), index=False,
+            )
+
         print(f"Report saved to {report_path}")
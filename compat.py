@@ -0,0 +1,38 @@
+"""
+Optional-dependency shims for the CityBike platform.
+
+Numba is used to JIT-compile a few hot numeric kernels when it is
+installed. Without it, ``njit`` is a no-op decorator and ``prange`` is
+plain ``range``, so the kernels still import (and run as ordinary
+Python); callers check ``HAS_NUMBA`` to pick their NumPy path instead.
+
+SciPy provides a few C kernels (e.g. condensed pairwise distances) that
+the NumPy code uses when available; check ``HAS_SCIPY`` before calling
+``pdist`` / ``squareform`` / ``coo_matrix``.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+try:
+    from numba import njit, prange
+
+    HAS_NUMBA = True
+except ImportError:  # pragma: no cover - depends on the environment
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args: Any, **kwargs: Any) -> Callable:
+        """Fallback for ``numba.njit`` — returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+try:
+    from scipy.sparse import coo_matrix
+    from scipy.spatial.distance import pdist, squareform
+
+    HAS_SCIPY = True
+except ImportError:  # pragma: no cover - depends on the environment
+    HAS_SCIPY = False
+    coo_matrix = pdist = squareform = None
@@ -3,23 +3,32 @@ Demo script for testing custom sorting and searching algorithms
 on the CityBike trips dataset.
 """
 
-import pandas as pd
+import numpy as np
+import pyarrow.parquet as pq
+
 from algorithms import (
     merge_sort,
+    merge_sort_array,
     insertion_sort,
     binary_search,
+    binary_search_array,
+    galloping_search,
     linear_search,
+    linear_search_array,
     benchmark_sort,
     benchmark_search,
+    benchmark_arrays,
 )
 
 # -----------------------------
-# Load trips data
+# Load trips data (written by main.py)
 # -----------------------------
-trips = pd.read_csv("data/trips_clean.csv")
+# We'll sort/search based on 'duration_minutes' — the only column read.
+durations = pq.read_table("data/trips_clean.parquet", columns=["duration_minutes"]).column(0)
 
-# We'll sort/search based on 'duration_minutes'
-data = trips["duration_minutes"].tolist()
+# Stored as float32; round back to the CSV's 2 decimals for readable output.
+arr = np.round(durations.to_numpy().astype(np.float64), 2)
+data = arr.tolist()
 target_value = data[len(data) // 2]  # Pick a value roughly in the middle
 
 # -----------------------------
@@ -43,13 +52,44 @@ print("\n=== Searching Demo ===")
 # Make sure data is sorted for binary_search
 sorted_data = sorted(data)
 index_bin = binary_search(sorted_data, target_value)
+index_gal = galloping_search(sorted_data, target_value)
 index_lin = linear_search(data, target_value)
 index_builtin = data.index(target_value)
 
+# NumPy's C binary search as the baseline for the hand-written ones.
+sorted_np = np.sort(arr)
+index_np = int(np.searchsorted(sorted_np, target_value))
+if index_np >= sorted_np.size or sorted_np[index_np] != target_value:
+    index_np = -1
+
 print(f"Target {target_value} found at index (binary_search): {index_bin}")
+print(f"Target {target_value} found at index (galloping_search): {index_gal}")
 print(f"Target {target_value} found at index (linear_search): {index_lin}")
 print(f"Target {target_value} found at index (builtin index): {index_builtin}")
+print(f"Target {target_value} found at index (np.searchsorted): {index_np}")
 
 search_bench = benchmark_search(data, target_value)
 print("\nSearching Benchmark (ms):")
 print(search_bench)
+
+# Galloping search shines when lookups cluster near the front of the
+# sorted data — e.g. the short trips that dominate the duration column.
+early_target = sorted_data[len(sorted_data) // 100]
+skewed_bench = benchmark_search(data, early_target)
+print(f"\nSearching Benchmark, early target {early_target} (ms):")
+print(skewed_bench)
+
+# -----------------------------
+# NumPy array demo
+# -----------------------------
+# The same algorithms on the float64 array itself; with Numba installed
+# they run as compiled kernels instead of Python-level comparisons.
+print("\n=== NumPy Array Demo ===")
+sorted_arr = merge_sort_array(arr)
+print(f"First 5 sorted by merge_sort_array: {sorted_arr[:5].tolist()}")
+print(f"Target {target_value} found at index (binary_search_array): {binary_search_array(sorted_arr, target_value)}")
+print(f"Target {target_value} found at index (linear_search_array): {linear_search_array(arr, target_value)}")
+
+array_bench = benchmark_arrays(arr, target_value)
+print("\nNumPy Array Benchmark (ms):")
+print(array_bench)
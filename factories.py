@@ -9,6 +9,13 @@ Students should:
     - Optionally add create_trip() and create_maintenance_record()
 """
 
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from batch_validate import encode_ids, validate_trip_arrays
+from utils import parse_iso_datetime
 from models import (
     Bike,
     ClassicBike,
@@ -40,23 +47,133 @@ def create_bike(data: dict) -> Bike:
         True
     """
     bike_type = data.get("bike_type", "").lower()
+    try:
+        build = _BIKE_BUILDERS[bike_type]
+    except KeyError:
+        raise ValueError(f"Unknown bike_type: {bike_type!r}") from None
+    return build(data)
 
-    if bike_type == "classic":
-        return ClassicBike(
-            bike_id=data["bike_id"],
-            gear_count=int(data.get("gear_count", 7)),
-        )
-    elif bike_type == "electric":
-        return ElectricBike(
-            bike_id=data["bike_id"],
-            battery_level=float(data.get("battery_level", 100.0)),
-            max_range_km=float(data.get("max_range_km", 50.0)),
+
+def _build_classic_bike(data: dict) -> ClassicBike:
+    return ClassicBike(
+        bike_id=data["bike_id"],
+        gear_count=int(data.get("gear_count", 7)),
+    )
+
+
+def _build_electric_bike(data: dict) -> ElectricBike:
+    return ElectricBike(
+        bike_id=data["bike_id"],
+        battery_level=float(data.get("battery_level", 100.0)),
+        max_range_km=float(data.get("max_range_km", 50.0)),
+    )
+
+
+# bike_type -> builder; one dict lookup instead of an if/elif chain per row.
+_BIKE_BUILDERS = {
+    "classic": _build_classic_bike,
+    "electric": _build_electric_bike,
+}
+
+
+def create_bikes_batch(frame: pd.DataFrame, created_at: datetime | None = None) -> list[Bike]:
+    """Create Bikes for every row of a bikes DataFrame.
+
+    Every column is validated in one vectorized pass before any bike is
+    built, so classic bikes skip the constructor's per-object checks
+    (``ClassicBike._unchecked``). Electric bikes still go through their
+    constructor. All bikes share one ``created_at``.
+
+    Args:
+        frame: DataFrame with 'bike_id' and 'bike_type', and optionally
+            'status', 'gear_count', 'battery_level' and 'max_range_km'.
+        created_at: Creation time for every bike; defaults to now.
+
+    Returns:
+        List of ClassicBike / ElectricBike instances, in row order.
+
+    Raises:
+        ValueError: Listing the bikes with an empty id, an unknown
+            bike_type or status, or a non-positive gear_count.
+    """
+    bike_ids = frame["bike_id"]
+    bike_types = frame["bike_type"].str.lower()
+    statuses = _column_or(frame, "status", "available")
+    gear_counts = _column_or(frame, "gear_count", 7).astype(np.int64)
+
+    invalid = (
+        bike_ids.isna()
+        | (bike_ids == "")
+        | ~bike_types.isin(_BIKE_BUILDERS)
+        | ~statuses.isin(Bike.VALID_STATUSES)
+        | ((bike_types == "classic") & (gear_counts <= 0))
+    )
+    if invalid.any():
+        raise ValueError(f"Invalid bikes: {bike_ids[invalid].tolist()}")
+
+    if created_at is None:
+        created_at = datetime.now()
+    classic = ClassicBike._unchecked
+    return [
+        classic(bike_id, gear_count, status, created_at)
+        if bike_type == "classic"
+        else ElectricBike(bike_id, battery_level, max_range_km, status, created_at)
+        for bike_id, bike_type, status, gear_count, battery_level, max_range_km in zip(
+            bike_ids.tolist(),
+            bike_types.tolist(),
+            statuses.tolist(),
+            gear_counts.tolist(),
+            _column_or(frame, "battery_level", 100.0).astype(float).tolist(),
+            _column_or(frame, "max_range_km", 50.0).astype(float).tolist(),
         )
-    else:
-        raise ValueError(f"Unknown bike_type: {bike_type!r}")
+    ]
 
 
-from datetime import datetime
+def _column_or(frame: pd.DataFrame, column: str, default: object) -> pd.Series:
+    """Return *column* with missing values set to *default*, or all *default*."""
+    if column in frame:
+        return frame[column].fillna(default)
+    return pd.Series(default, index=frame.index)
+
+
+def _as_datetime(value: str | datetime | np.datetime64) -> datetime:
+    """Return *value* as a datetime, parsing it only if it is a string.
+
+    Rows taken from a cleaned DataFrame already hold parsed timestamps
+    (``pd.Timestamp`` / ``np.datetime64``); those are converted directly
+    instead of going through an ISO-string round trip.
+    """
+    if isinstance(value, str):
+        return parse_iso_datetime(value)
+    if hasattr(value, "to_pydatetime"):  # pd.Timestamp
+        return value.to_pydatetime()
+    if isinstance(value, np.datetime64):
+        return value.astype("datetime64[us]").item()
+    return value
+
+
+def _to_datetimes(column: pd.Series) -> list[datetime]:
+    """Parse a whole column of timestamps (strings or parsed) at once.
+
+    One ``pd.to_datetime`` pass replaces a ``fromisoformat`` call per row.
+    """
+    return _as_datetimes(pd.to_datetime(column, format="ISO8601", cache=True).to_numpy())
+
+
+def _as_datetimes(values: np.ndarray) -> list[datetime]:
+    """Convert a datetime64 array to ``datetime`` objects in C via NumPy."""
+    return values.astype("datetime64[us]").tolist()
+
+
+def _map_ids(frame: pd.DataFrame, column: str, lookup: dict) -> pd.Series:
+    """Map an id column to entities, raising one error for every unknown id."""
+    mapped = frame[column].map(lookup)
+    missing = mapped.isna()
+    if missing.any():
+        unknown = frame.loc[missing, column].unique().tolist()
+        raise ValueError(f"Unknown {column} values: {unknown}")
+    return mapped
+
 
 def create_user(data: dict) -> User:
     """Create a User (CasualUser or MemberUser) from a data dictionary.
@@ -71,38 +188,50 @@ def create_user(data: dict) -> User:
         ValueError: If user_type is unknown or required fields are missing.
     """
     user_type = data.get("user_type", "").lower()
+    try:
+        build = _USER_BUILDERS[user_type]
+    except KeyError:
+        raise ValueError(f"Unknown user_type: {user_type!r}") from None
+    return build(data)
+
+
+def _build_casual_user(data: dict) -> CasualUser:
+    return CasualUser(
+        user_id=data["user_id"],
+        name=data["name"],
+        email=data["email"],
+        day_pass_count=int(data.get("day_pass_count", 0)),
+    )
 
-    if user_type == "casual":
-        return CasualUser(
-            user_id=data["user_id"],
-            name=data["name"],
-            email=data["email"],
-            day_pass_count=int(data.get("day_pass_count", 0)),
-        )
 
-    elif user_type == "member":
-        # Parse membership dates; assume ISO format if provided
-        start_str = data.get("membership_start")
-        end_str = data.get("membership_end")
+def _build_member_user(data: dict) -> MemberUser:
+    # Parse membership dates; assume ISO format if provided
+    start_str = data.get("membership_start")
+    end_str = data.get("membership_end")
 
-        membership_start = (
-            datetime.fromisoformat(start_str) if start_str else datetime.now()
-        )
-        membership_end = (
-            datetime.fromisoformat(end_str) if end_str else membership_start
-        )
+    membership_start = (
+        parse_iso_datetime(start_str) if start_str else datetime.now()
+    )
+    membership_end = (
+        parse_iso_datetime(end_str) if end_str else membership_start
+    )
 
-        return MemberUser(
-            user_id=data["user_id"],
-            name=data["name"],
-            email=data["email"],
-            membership_start=membership_start,
-            membership_end=membership_end,
-            tier=data.get("tier", "basic").lower(),
-        )
+    return MemberUser(
+        user_id=data["user_id"],
+        name=data["name"],
+        email=data["email"],
+        membership_start=membership_start,
+        membership_end=membership_end,
+        tier=data.get("tier", "basic").lower(),
+    )
+
+
+# user_type -> builder, as for bikes.
+_USER_BUILDERS = {
+    "casual": _build_casual_user,
+    "member": _build_member_user,
+}
 
-    else:
-        raise ValueError(f"Unknown user_type: {user_type!r}")
 
 def create_trip(data: dict, users: dict, bikes: dict, stations: dict) -> Trip:
     """
@@ -110,6 +239,7 @@ def create_trip(data: dict, users: dict, bikes: dict, stations: dict) -> Trip:
 
     Args:
         data: dict with trip info, e.g. 'trip_id', 'user_id', 'bike_id', 'start_station_id', ...
+            'start_time'/'end_time' may be ISO strings, datetimes, pd.Timestamp or np.datetime64
         users: dict mapping user_id -> User instance
         bikes: dict mapping bike_id -> Bike instance
         stations: dict mapping station_id -> Station instance
@@ -125,9 +255,9 @@ def create_trip(data: dict, users: dict, bikes: dict, stations: dict) -> Trip:
     start_station = stations[data["start_station_id"]]
     end_station = stations[data["end_station_id"]]
 
-    # Parse datetime
-    start_time = datetime.fromisoformat(data["start_time"])
-    end_time = datetime.fromisoformat(data["end_time"])
+    # ISO strings or already-parsed timestamps
+    start_time = _as_datetime(data["start_time"])
+    end_time = _as_datetime(data["end_time"])
 
     # Distance
     distance_km = float(data.get("distance_km", 0.0))
@@ -143,7 +273,71 @@ def create_trip(data: dict, users: dict, bikes: dict, stations: dict) -> Trip:
         distance_km=distance_km,
     )
 
-from models import MaintenanceRecord
+
+def create_trips_batch(
+    frame: pd.DataFrame, users: dict, bikes: dict, stations: dict
+) -> list[Trip]:
+    """Create Trips for every row of a trips DataFrame.
+
+    Ids are encoded as integer codes and timestamps parsed in one
+    vectorized pass; ``batch_validate`` then checks every row in a single
+    compiled loop. The per-row work left in Python is the ``Trip``
+    construction itself.
+
+    Args:
+        frame: DataFrame with the same columns as create_trip's dict.
+        users: dict mapping user_id -> User instance
+        bikes: dict mapping bike_id -> Bike instance
+        stations: dict mapping station_id -> Station instance
+
+    Returns:
+        List of Trip instances, in row order.
+
+    Raises:
+        ValueError: Listing unknown ids, or trips with a negative distance
+            or an end before their start.
+    """
+    user_idx = encode_ids(frame["user_id"], users)
+    bike_idx = encode_ids(frame["bike_id"], bikes)
+    start_idx = encode_ids(frame["start_station_id"], stations)
+    end_idx = encode_ids(frame["end_station_id"], stations)
+    start_times = pd.to_datetime(frame["start_time"], format="ISO8601", cache=True).to_numpy()
+    end_times = pd.to_datetime(frame["end_time"], format="ISO8601", cache=True).to_numpy()
+    if "distance_km" in frame:
+        distances = frame["distance_km"].to_numpy(dtype=np.float64)
+    else:
+        distances = np.zeros(len(frame))
+
+    valid, first_invalid = validate_trip_arrays(
+        user_idx, bike_idx, start_idx, end_idx,
+        start_times.view(np.int64), end_times.view(np.int64), distances,
+    )
+    if first_invalid >= 0:
+        # Slow path, only on failure: name the unknown ids if there are any
+        for column, lookup in (
+            ("user_id", users), ("bike_id", bikes),
+            ("start_station_id", stations), ("end_station_id", stations),
+        ):
+            _map_ids(frame, column, lookup)
+        raise ValueError(f"Invalid trips: {frame.loc[~valid, 'trip_id'].tolist()}")
+
+    user_objs = np.array(list(users.values()), dtype=object)
+    bike_objs = np.array(list(bikes.values()), dtype=object)
+    station_objs = np.array(list(stations.values()), dtype=object)
+    return [
+        Trip(*row)
+        for row in zip(
+            frame["trip_id"].tolist(),
+            user_objs[user_idx].tolist(),
+            bike_objs[bike_idx].tolist(),
+            station_objs[start_idx].tolist(),
+            station_objs[end_idx].tolist(),
+            _as_datetimes(start_times),
+            _as_datetimes(end_times),
+            distances.tolist(),
+        )
+    ]
+
 
 def create_maintenance_record(data: dict, bikes: dict) -> MaintenanceRecord:
     """
@@ -151,6 +345,7 @@ def create_maintenance_record(data: dict, bikes: dict) -> MaintenanceRecord:
 
     Args:
         data: dict with record info, e.g. 'record_id', 'bike_id', 'date', 'maintenance_type', 'cost'
+            ('date' as for create_trip's timestamps)
         bikes: dict mapping bike_id -> Bike instance
 
     Returns:
@@ -159,7 +354,7 @@ def create_maintenance_record(data: dict, bikes: dict) -> MaintenanceRecord:
     record_id = data["record_id"]
     bike = bikes[data["bike_id"]]
 
-    date = datetime.fromisoformat(data["date"])
+    date = _as_datetime(data["date"])
     maintenance_type = data["maintenance_type"]
     cost = float(data.get("cost", 0.0))
     description = data.get("description", "")
@@ -172,3 +367,42 @@ def create_maintenance_record(data: dict, bikes: dict) -> MaintenanceRecord:
         cost=cost,
         description=description,
     )
+
+
+def create_maintenance_records_batch(
+    frame: pd.DataFrame, bikes: dict
+) -> list[MaintenanceRecord]:
+    """Create MaintenanceRecords for every row of a maintenance DataFrame.
+
+    Args:
+        frame: DataFrame with the same columns as create_maintenance_record's dict.
+        bikes: dict mapping bike_id -> Bike instance
+
+    Returns:
+        List of MaintenanceRecord instances, in row order.
+
+    Raises:
+        ValueError: Listing unknown bike ids or records with a negative
+            cost; an invalid maintenance_type fails on its record.
+    """
+    record_bikes = _map_ids(frame, "bike_id", bikes)
+    dates = _to_datetimes(frame["date"])
+    costs = frame["cost"].to_numpy(dtype=float) if "cost" in frame else np.zeros(len(frame))
+    if (costs < 0).any():
+        raise ValueError(f"Invalid records: {frame.loc[costs < 0, 'record_id'].tolist()}")
+    if "description" in frame:
+        descriptions = frame["description"].fillna("").tolist()
+    else:
+        descriptions = [""] * len(frame)
+
+    return [
+        MaintenanceRecord(*row)
+        for row in zip(
+            frame["record_id"].tolist(),
+            record_bikes.tolist(),
+            dates,
+            frame["maintenance_type"].tolist(),
+            costs.tolist(),
+            descriptions,
+        )
+    ]
@@ -12,22 +12,16 @@ Entry point that orchestrates the full pipeline:
 
 Usage:
     python main.py
+    CITYBIKE_INSPECT=1 python main.py   # also print the raw-data inspection
+    CITYBIKE_PREVIEW=1 python main.py   # render the charts at preview resolution
 """
 
+import os
+
 import numpy as np
 
 from analyzer import BikeShareSystem
-from visualization import (
-    plot_trips_per_station,
-    plot_monthly_trend,
-    plot_duration_histogram,
-    plot_duration_by_user_type,
-    plot_distance_histogram,
-    plot_avg_duration_by_hour,
-    plot_user_type_share,
-    plot_maintenance_cost_by_bike_type,
-    plot_top_routes_heatmap,
-)
+from visualization import plot_all, report_saved
 from pricing import CasualPricing, MemberPricing
 from numerical import calculate_fares
 
@@ -41,9 +35,10 @@ def main() -> None:
     print("\n>>> Loading data …")
     system.load_data()
 
-    # Step 2 — Inspect
-    print("\n>>> Inspecting data …")
-    system.inspect_data()
+    # Step 2 — Inspect (opt-in: it is a diagnostic, not part of the analysis)
+    if os.environ.get("CITYBIKE_INSPECT"):
+        print("\n>>> Inspecting data …")
+        system.inspect_data()
 
     # Step 3 — Clean
     print("\n>>> Cleaning data …")
@@ -70,51 +65,51 @@ def main() -> None:
     casual_strategy = CasualPricing()
     member_strategy = MemberPricing()
 
-    # Casual users
-    casual_mask = system.trips["user_type"] == "casual"
-    casual_trips = system.trips[casual_mask]
-
-    casual_fares = calculate_fares(
-        durations=casual_trips["duration_minutes"].to_numpy(),
-        distances=casual_trips["distance_km"].to_numpy(),
-        per_minute=casual_strategy.PER_MINUTE,
-        per_km=casual_strategy.PER_KM,
-        unlock_fee=casual_strategy.UNLOCK_FEE,
-    )
-
-    # Member users
-    member_mask = system.trips["user_type"] == "member"
-    member_trips = system.trips[member_mask]
-
-    member_fares = calculate_fares(
-        durations=member_trips["duration_minutes"].to_numpy(),
-        distances=member_trips["distance_km"].to_numpy(),
-        per_minute=member_strategy.PER_MINUTE,
-        per_km=member_strategy.PER_KM,
-        unlock_fee=0.0,
+    # Fares are affine in (duration, distance), so every trip is priced in
+    # one pass: per-row rates come from the user_type category codes and
+    # np.bincount sums the fares per user type.
+    user_type = system.trips["user_type"].cat
+    categories = list(user_type.categories)
+    rates = {
+        "casual": (casual_strategy.PER_MINUTE, casual_strategy.PER_KM, casual_strategy.UNLOCK_FEE),
+        "member": (member_strategy.PER_MINUTE, member_strategy.PER_KM, 0.0),
+    }
+    # One extra zero-rate slot catches missing and unpriced user types.
+    rate_table = np.array([rates.get(c, (0.0, 0.0, 0.0)) for c in categories] + [(0.0, 0.0, 0.0)])
+    codes = user_type.codes.to_numpy()
+    slots = np.where(codes >= 0, codes, len(categories))
+    per_minute, per_km, unlock_fee = rate_table[slots].T
+
+    # Revenue is money summed over every trip: price it in float64
+    fares = calculate_fares(
+        durations=system.trips["duration_minutes"].to_numpy(),
+        distances=system.trips["distance_km"].to_numpy(),
+        per_minute=per_minute,
+        per_km=per_km,
+        unlock_fee=unlock_fee,
+        dtype=np.float64,
     )
+    totals = dict(zip(categories, np.bincount(slots, weights=fares, minlength=len(categories) + 1)))
 
-    total_revenue = np.sum(casual_fares) + np.sum(member_fares)
+    casual_revenue = totals.get("casual", 0.0)
+    member_revenue = totals.get("member", 0.0)
+    total_revenue = casual_revenue + member_revenue
 
-    print(f"  Casual revenue   : €{np.sum(casual_fares):.2f}")
-    print(f"  Member revenue   : €{np.sum(member_fares):.2f}")
+    print(f"  Casual revenue   : €{casual_revenue:.2f}")
+    print(f"  Member revenue   : €{member_revenue:.2f}")
     print(f"  Total revenue    : €{total_revenue:.2f}")
 
     # Step 5 — Visualizations
     print("\n>>> Generating visualizations …")
 
-    # Existing plots
-    plot_trips_per_station(system.trips, system.stations)
-    plot_monthly_trend(system.trips)
-    plot_duration_histogram(system.trips)
-    plot_duration_by_user_type(system.trips)
-
-    # New plots
-    plot_distance_histogram(system.trips)               # Histogram of trip distances
-    plot_avg_duration_by_hour(system.trips)            # Line chart: average duration by hour
-    plot_user_type_share(system.trips)                 # Pie chart: user type proportions
-    plot_maintenance_cost_by_bike_type(system.maintenance)  # Bar chart: maintenance cost by bike type
-    plot_top_routes_heatmap(system.trips)             # Heatmap: top routes (start vs end stations)
+    # All nine charts; the trips table is prepared once for all of them
+    plot_all(
+        system.trips,
+        system.stations,
+        system.maintenance,
+        preview=bool(os.environ.get("CITYBIKE_PREVIEW")),
+    )
+    report_saved()
 
     # Step 6 — Report
     print("\n>>> Generating summary report …")
@@ -2,10 +2,10 @@
 Domain models for the CityBike Bike-Sharing Analytics platform.
 
 This module defines the class hierarchy:
-    Entity (ABC) -> Bike -> ClassicBike, ElectricBike
+    Entity -> Bike -> ClassicBike, ElectricBike
                  -> Station
                  -> User -> CasualUser, MemberUser
-    Trip
+    Trip, TripFrame (columnar trip table)
     MaintenanceRecord
     BikeShareSystem
 
@@ -17,47 +17,130 @@ TODO for students:
     - Add @property decorators where appropriate
 """
 
-from abc import ABC, abstractmethod
+import functools
+import operator
+import sys
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Any, ClassVar
+
+import numpy as np
+
+# Opt-in runtime type checks. Ids are annotated ``str`` and the loaders
+# validate at the ingestion boundary, so constructors only check values
+# by default; set this to True to also reject non-string ids.
+STRICT_VALIDATION = False
+
+
+# ---------------------------------------------------------------------------
+# Compiled validators
+# ---------------------------------------------------------------------------
+
+def _compile_validator(
+    name: str,
+    params: str,
+    checks: tuple[tuple[str, str], ...],
+    namespace: dict[str, Any] | None = None,
+) -> Callable[..., None]:
+    """Generate one validation function from ``(condition, message)`` rules.
+
+    The rules are compiled into a single flat function at import time, so
+    a constructor validates all its arguments with one call and no
+    per-rule dispatch. Messages are f-string bodies over ``params``.
+
+    Args:
+        name: Name of the generated function.
+        params: Its parameter list, e.g. ``"capacity, latitude"``.
+        checks: Conditions that must hold, each with the message of the
+            ``ValueError`` raised when it does not.
+        namespace: Extra globals the conditions refer to.
+
+    Returns:
+        The compiled validator.
+    """
+    lines = [f"def {name}({params}):"]
+    for condition, message in checks:
+        lines.append(f"    if not ({condition}):")
+        lines.append(f"        raise ValueError(f{message!r})")
+    namespace = dict(namespace or {})
+    exec("\n".join(lines), namespace)
+    return namespace[name]
 
 
 # ---------------------------------------------------------------------------
-# Abstract Base Class
+# Cached string representations
 # ---------------------------------------------------------------------------
 
-class Entity(ABC):
-    """Abstract base class for all domain entities.
+def _cached_string(
+    slot: str, *fields: str
+) -> Callable[[Callable[[Any], str]], Callable[[Any], str]]:
+    """Cache an entity's ``__str__``/``__repr__`` result in ``slot``.
+
+    The string is stored with the values of the *fields* it displays and
+    reused while every one of them is still the same object. Most fields
+    are plain writable attributes, so assigning any of them makes the next
+    call format the string again. Checking the fields is a few slot reads,
+    well below the cost of formatting.
+    """
+    getter = operator.attrgetter(*fields)
+    key = getter if len(fields) > 1 else lambda self: (getter(self),)
+
+    def decorator(method: Callable[[Any], str]) -> Callable[[Any], str]:
+        @functools.wraps(method)
+        def wrapper(self: Any) -> str:
+            values = key(self)
+            cached = getattr(self, slot)
+            if cached is not None and all(map(operator.is_, values, cached[0])):
+                return cached[1]
+            text = method(self)
+            setattr(self, slot, (values, text))
+            return text
+        return wrapper
+    return decorator
+
+
+# ---------------------------------------------------------------------------
+# Base class
+# ---------------------------------------------------------------------------
+
+class Entity:
+    """Base class for all domain entities.
+
+    A plain class rather than an ABC: every concrete entity overrides
+    ``__str__``/``__repr__`` anyway, and skipping ``ABCMeta`` keeps its
+    abstract-method check out of every construction.
+
+    ``str()``/``repr()`` are cached and formatted again only after a
+    displayed field is assigned (see ``_cached_string``).
 
     Attributes:
         id: Unique identifier for the entity.
-        created_at: Timestamp when the entity was created.
+        created_at: Timestamp when the entity was created. Every subclass
+            accepts it as a keyword; bulk loaders should pass one shared
+            value instead of paying a ``datetime.now()`` call per object.
     """
 
+    # Every class in the hierarchy declares __slots__, so instances carry
+    # no per-object __dict__.
+    __slots__ = ("id", "created_at", "_str_cache", "_repr_cache")
+
     def __init__(self, id: str, created_at: datetime | None = None) -> None:
-        if not id or not isinstance(id, str):
+        if not id:
             raise ValueError("id must be a non-empty string")
-        self._id = id
-        self._created_at = created_at or datetime.now()
-
-    @property
-    def id(self) -> str:
-        """Return the entity's unique identifier."""
-        return self._id
-
-    @property
-    def created_at(self) -> datetime:
-        """Return the creation timestamp."""
-        return self._created_at
-
-    @abstractmethod
-    def __str__(self) -> str:
-        """Return a user-friendly string representation."""
-        ...
+        if STRICT_VALIDATION and not isinstance(id, str):
+            raise ValueError("id must be a non-empty string")
+        self.id = id
+        self.created_at = datetime.now() if created_at is None else created_at
+        self._str_cache = self._repr_cache = None
 
-    @abstractmethod
+    @_cached_string("_repr_cache", "id")
     def __repr__(self) -> str:
-        """Return an unambiguous string representation for debugging."""
-        ...
+        """Return an unambiguous string representation for debugging.
+
+        Subclasses override this (and ``__str__``, which defaults to it).
+        """
+        return f"{type(self).__name__}(id={self.id!r})"
 
 
 # ---------------------------------------------------------------------------
@@ -72,25 +155,23 @@ class Bike(Entity):
         status: One of 'available', 'in_use', 'maintenance'.
     """
 
-    VALID_STATUSES = {"available", "in_use", "maintenance"}
+    __slots__ = ("bike_type", "_status")
+
+    VALID_STATUSES = frozenset({"available", "in_use", "maintenance"})
 
     def __init__(
         self,
         bike_id: str,
         bike_type: str,
         status: str = "available",
+        created_at: datetime | None = None,
     ) -> None:
-        super().__init__(id=bike_id)
-        if bike_type not in ("classic", "electric"):
-            raise ValueError(f"Invalid bike_type: {bike_type}")
-        if status not in self.VALID_STATUSES:
-            raise ValueError(f"Invalid status: {status}")
-        self._bike_type = bike_type
-        self._status = status
-
-    @property
-    def bike_type(self) -> str:
-        return self._bike_type
+        super().__init__(id=bike_id, created_at=created_at)
+        _validate_bike(bike_type, status)
+        # Vocabulary strings are interned: CSV-parsed copies collapse to one
+        # object each and equality checks short-circuit on identity.
+        self.bike_type = sys.intern(bike_type)
+        self._status = sys.intern(status)
 
     @property
     def status(self) -> str:
@@ -98,13 +179,17 @@ class Bike(Entity):
 
     @status.setter
     def status(self, value: str) -> None:
+        if value == self._status:
+            return
         if value not in self.VALID_STATUSES:
             raise ValueError(f"Invalid status: {value}")
-        self._status = value
+        self._status = sys.intern(value)
 
+    @_cached_string("_str_cache", "id", "bike_type", "_status")
     def __str__(self) -> str:
         return f"Bike({self.id}, {self.bike_type}, {self.status})"
 
+    @_cached_string("_repr_cache", "id", "bike_type", "_status")
     def __repr__(self) -> str:
         return (
             f"Bike(bike_id={self.id!r}, bike_type={self.bike_type!r}, "
@@ -112,6 +197,17 @@ class Bike(Entity):
         )
 
 
+_validate_bike = _compile_validator(
+    "_validate_bike",
+    "bike_type, status",
+    (
+        ('bike_type in ("classic", "electric")', "Invalid bike_type: {bike_type}"),
+        ("status in VALID_STATUSES", "Invalid status: {status}"),
+    ),
+    {"VALID_STATUSES": Bike.VALID_STATUSES},
+)
+
+
 class ClassicBike(Bike):
     """A classic (non-electric) bike with gears.
 
@@ -119,30 +215,60 @@ class ClassicBike(Bike):
         gear_count: Number of gears (must be positive).
     """
 
+    __slots__ = ("gear_count",)
+
     def __init__(
         self,
         bike_id: str,
         gear_count: int = 7,
         status: str = "available",
+        created_at: datetime | None = None,
     ) -> None:
-        super().__init__(bike_id=bike_id, bike_type="classic", status=status)
-        if gear_count <= 0:
-            raise ValueError("gear_count must be positive")
-        self._gear_count = gear_count
-
-    @property
-    def gear_count(self) -> int:
-        return self._gear_count
+        super().__init__(bike_id=bike_id, bike_type="classic", status=status, created_at=created_at)
+        _validate_classic_bike(gear_count)
+        self.gear_count = gear_count
 
+    @classmethod
+    def _unchecked(
+        cls,
+        bike_id: str,
+        gear_count: int = 7,
+        status: str = "available",
+        created_at: datetime | None = None,
+    ) -> "ClassicBike":
+        """Build a bike without running the constructor's validation.
+
+        For bulk loaders that have already validated their columns in a
+        vectorized pass (``factories.create_bikes_batch``); external
+        callers should use the constructor.
+        """
+        self = cls.__new__(cls)
+        self.id = bike_id
+        self.created_at = datetime.now() if created_at is None else created_at
+        self._str_cache = self._repr_cache = None
+        self.bike_type = "classic"
+        self._status = sys.intern(status)
+        self.gear_count = gear_count
+        return self
+
+    @_cached_string("_str_cache", "id", "gear_count")
     def __str__(self) -> str:
         return f"ClassicBike({self.id}, gears={self.gear_count})"
 
+    @_cached_string("_repr_cache", "id", "gear_count", "_status")
     def __repr__(self) -> str:
         return (
             f"ClassicBike(bike_id={self.id!r}, gear_count={self.gear_count}, "
             f"status={self.status!r})"
         )
 
+
+_validate_classic_bike = _compile_validator(
+    "_validate_classic_bike",
+    "gear_count",
+    (("gear_count > 0", "gear_count must be positive"),),
+)
+
 # ---------------------------------------------------------------------------
 # ElectricBike
 # ---------------------------------------------------------------------------
@@ -150,20 +276,20 @@ class ClassicBike(Bike):
 class ElectricBike(Bike):
     """An electric bike with a battery."""
 
+    __slots__ = ("_battery_level", "max_range_km")
+
     def __init__(
         self,
         bike_id: str,
         battery_level: float = 100.0,
         max_range_km: float = 50.0,
         status: str = "available",
+        created_at: datetime | None = None,
     ) -> None:
-        super().__init__(bike_id=bike_id, bike_type="electric", status=status)
-        if not (0.0 <= battery_level <= 100.0):
-            raise ValueError("battery_level must be between 0 and 100")
-        if max_range_km <= 0:
-            raise ValueError("max_range_km must be positive")
+        super().__init__(bike_id=bike_id, bike_type="electric", status=status, created_at=created_at)
+        _validate_electric_bike(battery_level, max_range_km)
         self._battery_level = battery_level
-        self._max_range_km = max_range_km
+        self.max_range_km = max_range_km
 
     @property
     def battery_level(self) -> float:
@@ -175,13 +301,11 @@ class ElectricBike(Bike):
             raise ValueError("battery_level must be between 0 and 100")
         self._battery_level = value
 
-    @property
-    def max_range_km(self) -> float:
-        return self._max_range_km
-
+    @_cached_string("_str_cache", "id", "_battery_level", "max_range_km")
     def __str__(self) -> str:
         return f"ElectricBike({self.id}, battery={self.battery_level}%, range={self.max_range_km}km)"
 
+    @_cached_string("_repr_cache", "id", "_battery_level", "max_range_km", "_status")
     def __repr__(self) -> str:
         return (
             f"ElectricBike(bike_id={self.id!r}, battery_level={self.battery_level}, "
@@ -189,6 +313,16 @@ class ElectricBike(Bike):
         )
 
 
+_validate_electric_bike = _compile_validator(
+    "_validate_electric_bike",
+    "battery_level, max_range_km",
+    (
+        ("0.0 <= battery_level <= 100.0", "battery_level must be between 0 and 100"),
+        ("max_range_km > 0", "max_range_km must be positive"),
+    ),
+)
+
+
 # ---------------------------------------------------------------------------
 # Station
 # ---------------------------------------------------------------------------
@@ -196,6 +330,8 @@ class ElectricBike(Bike):
 class Station(Entity):
     """Represents a bike-sharing station."""
 
+    __slots__ = ("name", "capacity", "latitude", "longitude")
+
     def __init__(
         self,
         station_id: str,
@@ -203,38 +339,20 @@ class Station(Entity):
         capacity: int,
         latitude: float,
         longitude: float,
+        created_at: datetime | None = None,
     ) -> None:
-        super().__init__(id=station_id)
-        if capacity <= 0:
-            raise ValueError("capacity must be positive")
-        if not (-90 <= latitude <= 90):
-            raise ValueError("latitude must be between -90 and 90")
-        if not (-180 <= longitude <= 180):
-            raise ValueError("longitude must be between -180 and 180")
-        self._name = name
-        self._capacity = capacity
-        self._latitude = latitude
-        self._longitude = longitude
-
-    @property
-    def name(self) -> str:
-        return self._name
-
-    @property
-    def capacity(self) -> int:
-        return self._capacity
-
-    @property
-    def latitude(self) -> float:
-        return self._latitude
-
-    @property
-    def longitude(self) -> float:
-        return self._longitude
-
+        super().__init__(id=station_id, created_at=created_at)
+        _validate_station(capacity, latitude, longitude)
+        self.name = name
+        self.capacity = capacity
+        self.latitude = latitude
+        self.longitude = longitude
+
+    @_cached_string("_str_cache", "id", "name", "capacity")
     def __str__(self) -> str:
         return f"Station({self.id}, {self.name}, capacity={self.capacity})"
 
+    @_cached_string("_repr_cache", "id", "name", "capacity", "latitude", "longitude")
     def __repr__(self) -> str:
         return (
             f"Station(station_id={self.id!r}, name={self.name!r}, capacity={self.capacity}, "
@@ -242,6 +360,17 @@ class Station(Entity):
         )
 
 
+_validate_station = _compile_validator(
+    "_validate_station",
+    "capacity, latitude, longitude",
+    (
+        ("capacity > 0", "capacity must be positive"),
+        ("-90 <= latitude <= 90", "latitude must be between -90 and 90"),
+        ("-180 <= longitude <= 180", "longitude must be between -180 and 180"),
+    ),
+)
+
+
 # ---------------------------------------------------------------------------
 # User hierarchy
 # ---------------------------------------------------------------------------
@@ -249,61 +378,62 @@ class Station(Entity):
 class User(Entity):
     """Base class for a system user."""
 
+    __slots__ = ("name", "email", "user_type")
+
     def __init__(
         self,
         user_id: str,
         name: str,
         email: str,
         user_type: str,
+        created_at: datetime | None = None,
     ) -> None:
-        super().__init__(id=user_id)
-        if "@" not in email:
-            raise ValueError("Invalid email address")
-        self._name = name
-        self._email = email
-        self._user_type = user_type
-
-    @property
-    def name(self) -> str:
-        return self._name
-
-    @property
-    def email(self) -> str:
-        return self._email
-
-    @property
-    def user_type(self) -> str:
-        return self._user_type
+        super().__init__(id=user_id, created_at=created_at)
+        _validate_user(email)
+        self.name = name
+        self.email = email
+        self.user_type = sys.intern(user_type)
 
+    @_cached_string("_str_cache", "id", "user_type")
     def __str__(self) -> str:
         return f"User({self.id}, {self.user_type})"
 
+    @_cached_string("_repr_cache", "id", "name", "email", "user_type")
     def __repr__(self) -> str:
         return f"User(user_id={self.id!r}, name={self.name!r}, email={self.email!r}, type={self.user_type!r})"
 
 
+_validate_user = _compile_validator(
+    "_validate_user",
+    "email",
+    (('"@" in email', "Invalid email address"),),
+)
+
+
 class CasualUser(User):
     """A casual (non-member) user."""
 
+    __slots__ = ("day_pass_count",)
+
     def __init__(
         self,
         user_id: str,
         name: str,
         email: str,
         day_pass_count: int = 0,
+        created_at: datetime | None = None,
     ) -> None:
-        super().__init__(user_id=user_id, name=name, email=email, user_type="casual")
-        if day_pass_count < 0:
-            raise ValueError("day_pass_count must be >= 0")
-        self._day_pass_count = day_pass_count
-
-    @property
-    def day_pass_count(self) -> int:
-        return self._day_pass_count
+        super().__init__(
+            user_id=user_id, name=name, email=email, user_type="casual", created_at=created_at,
+        )
+        _validate_casual_user(day_pass_count)
+        self.day_pass_count = day_pass_count
 
+    @_cached_string("_str_cache", "id", "day_pass_count")
     def __str__(self) -> str:
         return f"CasualUser({self.id}, day_passes={self.day_pass_count})"
 
+    @_cached_string("_repr_cache", "id", "name", "email", "day_pass_count")
     def __repr__(self) -> str:
         return (
             f"CasualUser(user_id={self.id!r}, name={self.name!r}, email={self.email!r}, "
@@ -311,10 +441,19 @@ class CasualUser(User):
         )
 
 
+_validate_casual_user = _compile_validator(
+    "_validate_casual_user",
+    "day_pass_count",
+    (("day_pass_count >= 0", "day_pass_count must be >= 0"),),
+)
+
+
 class MemberUser(User):
     """A registered member user."""
 
-    VALID_TIERS = {"basic", "premium"}
+    __slots__ = ("membership_start", "membership_end", "tier")
+
+    VALID_TIERS = ("basic", "premium")
 
     def __init__(
         self,
@@ -324,31 +463,21 @@ class MemberUser(User):
         membership_start: datetime,
         membership_end: datetime,
         tier: str = "basic",
+        created_at: datetime | None = None,
     ) -> None:
-        super().__init__(user_id=user_id, name=name, email=email, user_type="member")
-        if membership_end <= membership_start:
-            raise ValueError("membership_end must be after membership_start")
-        if tier not in self.VALID_TIERS:
-            raise ValueError(f"tier must be one of {self.VALID_TIERS}")
-        self._membership_start = membership_start
-        self._membership_end = membership_end
-        self._tier = tier
-
-    @property
-    def membership_start(self) -> datetime:
-        return self._membership_start
-
-    @property
-    def membership_end(self) -> datetime:
-        return self._membership_end
-
-    @property
-    def tier(self) -> str:
-        return self._tier
+        super().__init__(
+            user_id=user_id, name=name, email=email, user_type="member", created_at=created_at,
+        )
+        _validate_member_user(membership_start, membership_end, tier)
+        self.membership_start = membership_start
+        self.membership_end = membership_end
+        self.tier = sys.intern(tier)
 
+    @_cached_string("_str_cache", "id", "tier")
     def __str__(self) -> str:
         return f"MemberUser({self.id}, tier={self.tier})"
 
+    @_cached_string("_repr_cache", "id", "name", "email", "membership_start", "membership_end", "tier")
     def __repr__(self) -> str:
         return (
             f"MemberUser(user_id={self.id!r}, name={self.name!r}, email={self.email!r}, "
@@ -356,41 +485,45 @@ class MemberUser(User):
         )
 
 
+_validate_member_user = _compile_validator(
+    "_validate_member_user",
+    "membership_start, membership_end, tier",
+    (
+        ("membership_end > membership_start", "membership_end must be after membership_start"),
+        ("tier in VALID_TIERS", "tier must be one of {VALID_TIERS}"),
+    ),
+    {"VALID_TIERS": MemberUser.VALID_TIERS},
+)
+
+
 # ---------------------------------------------------------------------------
 # Trip
 # ---------------------------------------------------------------------------
 
+@dataclass(slots=True, eq=False, repr=False)
 class Trip:
-    """Represents a single bike trip."""
+    """Represents a single bike trip.
 
-    def __init__(
-        self,
-        trip_id: str,
-        user: User,
-        bike: Bike,
-        start_station: Station,
-        end_station: Station,
-        start_time: datetime,
-        end_time: datetime,
-        distance_km: float,
-    ) -> None:
-        if distance_km < 0:
+    ``duration_minutes`` is derived once in ``__post_init__`` and stored,
+    so formatting, filtering and statistics do not redo the timedelta.
+    """
+
+    trip_id: str
+    user: User
+    bike: Bike
+    start_station: Station
+    end_station: Station
+    start_time: datetime
+    end_time: datetime
+    distance_km: float
+    duration_minutes: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        if self.distance_km < 0:
             raise ValueError("distance_km must be >= 0")
-        if end_time < start_time:
+        if self.end_time < self.start_time:
             raise ValueError("end_time must be after start_time")
-        self.trip_id = trip_id
-        self.user = user
-        self.bike = bike
-        self.start_station = start_station
-        self.end_station = end_station
-        self.start_time = start_time
-        self.end_time = end_time
-        self.distance_km = distance_km
-
-    @property
-    def duration_minutes(self) -> float:
-        delta = self.end_time - self.start_time
-        return delta.total_seconds() / 60.0
+        self.duration_minutes = (self.end_time - self.start_time).total_seconds() / 60.0
 
     def __str__(self) -> str:
         return f"Trip({self.trip_id}, duration={self.duration_minutes:.1f} min)"
@@ -403,40 +536,120 @@ class Trip:
         )
 
 
+class TripFrame:
+    """Column-oriented (struct-of-arrays) storage for many trips.
+
+    Each field is one contiguous NumPy array rather than an attribute on
+    millions of ``Trip`` objects, so analytics (``numerical.py``) read
+    e.g. ``distance_km`` at 4 bytes per trip with no Python iteration.
+    Related entities are referenced by id.
+
+    Attributes:
+        trip_id, user_id, bike_id, start_station_id, end_station_id:
+            Object arrays of string ids.
+        start_time, end_time: ``datetime64[ns]`` arrays.
+        distance_km: ``float32`` array.
+    """
+
+    __slots__ = (
+        "trip_id",
+        "user_id",
+        "bike_id",
+        "start_station_id",
+        "end_station_id",
+        "start_time",
+        "end_time",
+        "distance_km",
+    )
+
+    _DTYPES: ClassVar[dict[str, str]] = {
+        "trip_id": "O",
+        "user_id": "O",
+        "bike_id": "O",
+        "start_station_id": "O",
+        "end_station_id": "O",
+        "start_time": "datetime64[ns]",
+        "end_time": "datetime64[ns]",
+        "distance_km": "float32",
+    }
+
+    def __init__(self, n: int) -> None:
+        for name, dtype in self._DTYPES.items():
+            setattr(self, name, np.empty(n, dtype=dtype))
+
+    @classmethod
+    def from_columns(cls, columns: Mapping[str, Any]) -> "TripFrame":
+        """Build a frame from column arrays, e.g. a trips ``DataFrame``.
+
+        Args:
+            columns: Mapping (or DataFrame) with one array-like per field.
+
+        Returns:
+            TripFrame whose arrays are converted to the field dtypes.
+        """
+        frame = cls.__new__(cls)
+        for name, dtype in cls._DTYPES.items():
+            setattr(frame, name, np.asarray(columns[name], dtype=dtype))
+        return frame
+
+    @classmethod
+    def from_trips(cls, trips: Sequence[Trip]) -> "TripFrame":
+        """Transpose ``Trip`` objects into columns."""
+        frame = cls(len(trips))
+        for i, trip in enumerate(trips):
+            frame.trip_id[i] = trip.trip_id
+            frame.user_id[i] = trip.user.id
+            frame.bike_id[i] = trip.bike.id
+            frame.start_station_id[i] = trip.start_station.id
+            frame.end_station_id[i] = trip.end_station.id
+            frame.start_time[i] = trip.start_time
+            frame.end_time[i] = trip.end_time
+            frame.distance_km[i] = trip.distance_km
+        return frame
+
+    def __len__(self) -> int:
+        return self.trip_id.size
+
+    @property
+    def duration_minutes(self) -> np.ndarray:
+        """Trip durations in minutes, computed for all trips at once."""
+        seconds = (self.end_time - self.start_time) / np.timedelta64(1, "s")
+        return (seconds / 60.0).astype(np.float32)
+
+
 # ---------------------------------------------------------------------------
 # MaintenanceRecord
 # ---------------------------------------------------------------------------
 
+@dataclass(slots=True, eq=False, repr=False)
 class MaintenanceRecord:
     """Represents a maintenance event for a bike."""
 
-    VALID_TYPES = {
+    VALID_TYPES: ClassVar[frozenset[str]] = frozenset({
         "tire_repair",
         "brake_adjustment",
         "battery_replacement",
         "chain_lubrication",
         "general_inspection",
-    }
-
-    def __init__(
-        self,
-        record_id: str,
-        bike: Bike,
-        date: datetime,
-        maintenance_type: str,
-        cost: float,
-        description: str = "",
-    ) -> None:
-        if maintenance_type not in self.VALID_TYPES:
-            raise ValueError(f"Invalid maintenance_type: {maintenance_type}")
-        if cost < 0:
+    })
+
+    record_id: str
+    bike: Bike
+    date: datetime
+    maintenance_type: str
+    cost: float
+    description: str = ""
+
+    def __post_init__(self) -> None:
+        # One lookup both validates the type and yields its canonical
+        # (interned) string; a miss means the type is invalid.
+        try:
+            maintenance_type = _MAINTENANCE_TYPES[self.maintenance_type]
+        except (KeyError, TypeError):
+            raise ValueError(f"Invalid maintenance_type: {self.maintenance_type}") from None
+        if self.cost < 0:
             raise ValueError("cost must be >= 0")
-        self.record_id = record_id
-        self.bike = bike
-        self.date = date
         self.maintenance_type = maintenance_type
-        self.cost = cost
-        self.description = description
 
     def __str__(self) -> str:
         return f"MaintenanceRecord({self.record_id}, bike={self.bike.id}, type={self.maintenance_type})"
@@ -446,3 +659,7 @@ class MaintenanceRecord:
             f"MaintenanceRecord(record_id={self.record_id!r}, bike={self.bike.id!r}, "
             f"type={self.maintenance_type!r}, cost={self.cost}, date={self.date})"
         )
+
+
+# Canonical string per valid maintenance type, keyed by itself.
+_MAINTENANCE_TYPES = {t: t for t in MaintenanceRecord.VALID_TYPES}
@@ -4,57 +4,261 @@ NumPy-based numerical computations for the CityBike platform.
 Includes:
     - Station distance matrix using Euclidean distance
     - Vectorized trip statistics (mean, median, std, percentiles)
+    - Equal-width histograms
     - Outlier detection using z-scores
     - Vectorized fare calculation across all trips
+
+Array inputs are coerced to ``dtype`` (float32 by default). Durations,
+distances, fares and city-scale coordinates need far fewer than float32's
+~7 significant digits, and half-width floats halve the memory traffic and
+double the SIMD lanes. Pass ``dtype=np.float64`` where full precision
+matters.
 """
 
+import math
+
 import numpy as np
 
+from compat import HAS_NUMBA, HAS_SCIPY, njit, pdist, prange, squareform
+
+# Length of one degree of latitude, in km (flat-earth approximation).
+KM_PER_DEGREE = 111.0
+
+# Quantiles reported by trip_duration_stats, as fractions.
+_PERCENTILES = {"median": 0.5, "p25": 0.25, "p75": 0.75, "p90": 0.9}
+
 # ---------------------------------------------------------------------------
 # Distance calculations
 # ---------------------------------------------------------------------------
 
+@njit(cache=True, parallel=True, fastmath=True)
+def _distance_kernel(latitudes: np.ndarray, longitudes: np.ndarray, out: np.ndarray) -> None:
+    """Fill ``out`` with pairwise distances, computing each pair once.
+
+    Rows are spread across cores with ``prange``; each row computes its
+    upper-triangle entries and mirrors them below the diagonal.
+    JIT-compiled by Numba when it is installed.
+    """
+    n = latitudes.size
+    for i in prange(n):
+        for j in range(i + 1, n):
+            d = math.sqrt((latitudes[i] - latitudes[j]) ** 2 + (longitudes[i] - longitudes[j]) ** 2)
+            out[i, j] = d
+            out[j, i] = d
+
+
 def station_distance_matrix(
-    latitudes: np.ndarray, longitudes: np.ndarray
+    latitudes: np.ndarray,
+    longitudes: np.ndarray,
+    dtype: np.dtype = np.float32,
+    to_km: bool = False,
 ) -> np.ndarray:
     """Compute pairwise Euclidean distances between stations.
 
     Uses a simplified flat-earth distance model:
         d = sqrt((lat2 - lat1)^2 + (lon2 - lon1)^2)
+
+    Distances are in degrees unless ``to_km`` is set. In that case the 1-D
+    inputs are scaled by ``KM_PER_DEGREE`` (longitudes also by the cosine
+    of the mean latitude) before the pairwise step, so kilometres cost
+    O(N) multiplies instead of a pass over the N x N result.
+
+    With Numba installed, a parallel kernel computes each of the
+    N*(N-1)/2 pairs once and mirrors it. Otherwise SciPy's ``pdist`` /
+    ``squareform`` do the same in C, and without either the matrix is
+    built by broadcasting.
     """
-    lat_diff = latitudes[:, np.newaxis] - latitudes[np.newaxis, :]
-    lon_diff = longitudes[:, np.newaxis] - longitudes[np.newaxis, :]
-    distances = np.sqrt(lat_diff**2 + lon_diff**2)
-    return distances
+    latitudes = np.asarray(latitudes, dtype=np.float64)
+    longitudes = np.asarray(longitudes, dtype=np.float64)
+    if to_km and latitudes.size:
+        lon_scale = KM_PER_DEGREE * math.cos(math.radians(latitudes.mean()))
+        latitudes = latitudes * KM_PER_DEGREE
+        longitudes = longitudes * lon_scale
+
+    if HAS_SCIPY and not HAS_NUMBA:
+        # pdist always works in float64; only the result is narrowed.
+        coords = np.column_stack((latitudes, longitudes))
+        return squareform(pdist(coords, metric="euclidean")).astype(dtype, copy=False)
+
+    # Shift the coordinates to the first station before narrowing them:
+    # differences of raw float32 degrees (~48.9) keep only ~4 digits.
+    latitudes = (latitudes - latitudes[:1]).astype(dtype)
+    longitudes = (longitudes - longitudes[:1]).astype(dtype)
+
+    if HAS_NUMBA:
+        out = np.zeros((latitudes.size, latitudes.size), dtype=dtype)
+        _distance_kernel(latitudes, longitudes, out)
+        return out
+
+    # np.hypot squares, adds and roots in one ufunc pass: a single N x N
+    # output instead of separate **2 and sum temporaries.
+    return np.hypot(
+        latitudes[:, np.newaxis] - latitudes[np.newaxis, :],
+        longitudes[:, np.newaxis] - longitudes[np.newaxis, :],
+    )
 
 # ---------------------------------------------------------------------------
 # Trip statistics
 # ---------------------------------------------------------------------------
 
+@njit(cache=True)
+def _mean_std(values: np.ndarray) -> tuple[float, float]:
+    """Return the population mean and standard deviation in one pass.
+
+    Sums are accumulated in float64 around the first element, which keeps
+    the ``E[x^2] - E[x]^2`` form from cancelling on float32 input.
+    JIT-compiled by Numba when it is installed.
+    """
+    n = values.size
+    shift = float(values[0])
+    s = 0.0
+    ss = 0.0
+    for i in range(n):
+        d = values[i] - shift
+        s += d
+        ss += d * d
+    mean = s / n
+    return shift + mean, math.sqrt(max(ss / n - mean * mean, 0.0))
+
+
 def trip_duration_stats(durations: np.ndarray) -> dict[str, float]:
-    """Compute summary statistics for trip durations."""
-    return {
-        "mean": float(np.mean(durations)),
-        "median": float(np.median(durations)),
-        "std": float(np.std(durations)),
-        "p25": float(np.percentile(durations, 25)),
-        "p75": float(np.percentile(durations, 75)),
-        "p90": float(np.percentile(durations, 90)),
-    }
+    """Compute summary statistics for trip durations.
+
+    Mean and standard deviation come from one fused pass, and the median
+    and percentiles from a single ``np.partition`` on all the order
+    statistics they need, instead of one full sort per percentile.
+    Like ``np.mean``/``np.percentile``, any NaN makes every statistic NaN.
+    """
+    durations = np.asarray(durations)
+    n = durations.size
+    # np.partition sorts NaNs to the end, which would skew the percentiles
+    if n == 0 or np.isnan(durations).any():
+        return dict.fromkeys(("mean", "median", "std", "p25", "p75", "p90"), float("nan"))
+
+    if HAS_NUMBA:
+        mean, std = _mean_std(durations)
+    else:
+        mean, std = durations.mean(), durations.std()
+
+    # Same linear interpolation as np.percentile: position q * (n - 1).
+    positions = {name: q * (n - 1) for name, q in _PERCENTILES.items()}
+    kth = sorted({k for pos in positions.values() for k in (math.floor(pos), math.ceil(pos))})
+    part = np.partition(durations, kth)
+
+    stats = {"mean": float(mean), "std": float(std)}
+    for name, pos in positions.items():
+        lo, hi = part[math.floor(pos)], part[math.ceil(pos)]
+        stats[name] = float(lo + (hi - lo) * (pos - math.floor(pos)))
+    return {key: stats[key] for key in ("mean", "median", "std", "p25", "p75", "p90")}
+
+# ---------------------------------------------------------------------------
+# Histograms
+# ---------------------------------------------------------------------------
+
+# Values per private count row in _histogram_kernel.
+_HISTOGRAM_CHUNK = 1 << 16
+
+
+@njit(cache=True, parallel=True)
+def _histogram_kernel(values: np.ndarray, edges: np.ndarray, n_chunks: int) -> np.ndarray:
+    """Count ``values`` into the equal-width bins bounded by ``edges``.
+
+    Each value's bin is computed directly from the fixed bin width, then
+    nudged against the exact edges as ``np.histogram`` does, so the counts
+    match it. Chunks are spread across cores with ``prange`` and count
+    into private rows that are summed at the end. NaNs and values outside
+    the edges are skipped. JIT-compiled by Numba when it is installed.
+    """
+    n = values.size
+    n_bins = edges.size - 1
+    lo = edges[0]
+    hi = edges[n_bins]
+    scale = n_bins / (hi - lo)
+    chunk = (n + n_chunks - 1) // n_chunks
+    partial = np.zeros((n_chunks, n_bins), dtype=np.int64)
+    for c in prange(n_chunks):
+        for i in range(c * chunk, min(n, (c + 1) * chunk)):
+            v = values[i]
+            if not (lo <= v <= hi):
+                continue
+            k = min(int((v - lo) * scale), n_bins - 1)
+            if v < edges[k]:
+                k -= 1
+            elif k + 1 < n_bins and v >= edges[k + 1]:
+                k += 1
+            partial[c, k] += 1
+    return partial.sum(axis=0)
+
+
+def histogram(
+    values: np.ndarray, bins: int = 10, range: tuple[float, float] | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """Equal-width histogram, returning ``(counts, edges)`` like ``np.histogram``.
+
+    With Numba, one linear pass computes each value's bin from the bin
+    width instead of ``np.histogram``'s sort-and-search over the edges.
+    Without it this is ``np.histogram``.
+    """
+    values = np.asarray(values)
+    if not HAS_NUMBA:
+        return np.histogram(values, bins=bins, range=range)
+
+    # Edges follow np.histogram's rules (including the edge dtype), so
+    # the two paths bin every value identically.
+    if bins < 1:
+        raise ValueError("`bins` must be positive, when an integer")
+    if range is None:
+        lo, hi = (values.min(), values.max()) if values.size else (0.0, 1.0)
+    else:
+        lo, hi = (r + 0.0 for r in range)
+    if lo > hi:
+        raise ValueError("max must be larger than min in range parameter.")
+    if not (np.isfinite(lo) and np.isfinite(hi)):
+        raise ValueError(f"range of [{lo}, {hi}] is not finite")
+    if lo == hi:
+        lo, hi = lo - 0.5, hi + 0.5
+    edge_type = np.result_type(lo, hi, values)
+    if np.issubdtype(edge_type, np.integer):
+        edge_type = np.result_type(edge_type, float)
+    edges = np.linspace(lo, hi, bins + 1, dtype=edge_type)
+    n_chunks = max(1, values.size // _HISTOGRAM_CHUNK)
+    return _histogram_kernel(values, edges, n_chunks), edges
 
 # ---------------------------------------------------------------------------
 # Outlier detection
 # ---------------------------------------------------------------------------
 
+@njit(cache=True)
+def _zscore_mask(values: np.ndarray, threshold: float) -> np.ndarray:
+    """Flag values whose z-score exceeds ``threshold`` (mean/std + one sweep)."""
+    out = np.zeros(values.size, dtype=np.bool_)
+    mean, std = _mean_std(values)
+    if std == 0.0:
+        return out
+    limit = threshold * std
+    for i in range(values.size):
+        out[i] = abs(values[i] - mean) > limit
+    return out
+
+
 def detect_outliers_zscore(
-    values: np.ndarray, threshold: float = 3.0
+    values: np.ndarray, threshold: float = 3.0, dtype: np.dtype = np.float32
 ) -> np.ndarray:
-    """Identify outlier indices using the z-score method."""
-    std = np.std(values)
+    """Identify outlier indices using the z-score method.
+
+    With Numba the statistics and the threshold test run in two sweeps of
+    one kernel; the NumPy path compares ``|x - mean|`` against
+    ``threshold * std`` to skip the division pass.
+    """
+    values = np.asarray(values, dtype=dtype)
+    if values.size == 0:
+        return np.zeros(0, dtype=bool)
+    if HAS_NUMBA:
+        return _zscore_mask(values, threshold)
+    std = values.std()
     if std == 0:
         return np.zeros_like(values, dtype=bool)
-    z = (values - np.mean(values)) / std
-    return np.abs(z) > threshold
+    return np.abs(values - values.mean()) > threshold * std
 
 # ---------------------------------------------------------------------------
 # Vectorized fare calculation
@@ -63,9 +267,29 @@ def detect_outliers_zscore(
 def calculate_fares(
     durations: np.ndarray,
     distances: np.ndarray,
-    per_minute: float,
-    per_km: float,
-    unlock_fee: float = 0.0,
+    per_minute: float | np.ndarray,
+    per_km: float | np.ndarray,
+    unlock_fee: float | np.ndarray = 0.0,
+    dtype: np.dtype = np.float32,
 ) -> np.ndarray:
-    """Calculate fares for many trips at once using NumPy."""
-    return unlock_fee + per_minute * durations + per_km * distances
+    """Calculate fares for many trips at once using NumPy.
+
+    Rates may be scalars or per-trip arrays (e.g. looked up by user type).
+    The fare is accumulated in place in a single output buffer: one
+    temporary for ``per_km * distances`` instead of one per operator.
+    """
+    durations = np.asarray(durations, dtype=dtype)
+    distances = np.asarray(distances, dtype=dtype)
+    per_minute = np.asarray(per_minute, dtype=dtype)
+    per_km = np.asarray(per_km, dtype=dtype)
+    unlock_fee = np.asarray(unlock_fee, dtype=dtype)
+    out = np.empty(
+        np.broadcast_shapes(
+            durations.shape, distances.shape, per_minute.shape, per_km.shape, unlock_fee.shape
+        ),
+        dtype=dtype,
+    )
+    np.multiply(per_minute, durations, out=out)
+    out += per_km * distances
+    out += unlock_fee
+    return out
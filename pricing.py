@@ -11,6 +11,10 @@ Students should:
 
 from abc import ABC, abstractmethod
 
+import numpy as np
+
+from numerical import calculate_fares
+
 
 # ---------------------------------------------------------------------------
 # Strategy interface
@@ -34,6 +38,28 @@ class PricingStrategy(ABC):
         """
         ...
 
+    def calculate_cost_batch(
+        self, durations: np.ndarray, distances: np.ndarray
+    ) -> np.ndarray:
+        """Return the cost of many trips at once.
+
+        The default calls ``calculate_cost`` per trip; strategies with
+        affine rates override it with one vectorized ``calculate_fares``.
+        Either way the costs are float64, as money is everywhere else.
+
+        Args:
+            durations: Trip lengths in minutes.
+            distances: Distances traveled in kilometers.
+
+        Returns:
+            float64 array of trip costs, one per trip.
+        """
+        return np.fromiter(
+            map(self.calculate_cost, durations, distances),
+            dtype=float,
+            count=len(durations),
+        )
+
 
 # ---------------------------------------------------------------------------
 # Concrete strategies
@@ -61,6 +87,14 @@ class CasualPricing(PricingStrategy):
             + self.PER_KM * distance_km
         )
 
+    def calculate_cost_batch(
+        self, durations: np.ndarray, distances: np.ndarray
+    ) -> np.ndarray:
+        return calculate_fares(
+            durations, distances, self.PER_MINUTE, self.PER_KM, self.UNLOCK_FEE,
+            dtype=np.float64,
+        )
+
 
 class MemberPricing(PricingStrategy):
     """Pricing for member users — discounted rates.
@@ -81,6 +115,13 @@ class MemberPricing(PricingStrategy):
             + self.PER_KM * distance_km
         )
 
+    def calculate_cost_batch(
+        self, durations: np.ndarray, distances: np.ndarray
+    ) -> np.ndarray:
+        return calculate_fares(
+            durations, distances, self.PER_MINUTE, self.PER_KM, dtype=np.float64
+        )
+
 
 class PeakHourPricing(PricingStrategy):
     """Pricing during peak hours (1.5x surcharge on casual rates)."""
@@ -90,17 +131,22 @@ class PeakHourPricing(PricingStrategy):
     def calculate_cost(
         self, duration_minutes: float, distance_km: float
     ) -> float:
-        # Base cost using casual pricing
-        base_cost = CasualPricing().calculate_cost(
-            duration_minutes, distance_km
+        # Casual rates inlined: no CasualPricing instance per trip
+        return self.MULTIPLIER * (
+            CasualPricing.UNLOCK_FEE
+            + CasualPricing.PER_MINUTE * duration_minutes
+            + CasualPricing.PER_KM * distance_km
         )
-        return self.MULTIPLIER * base_cost
-
-
-    MULTIPLIER = 1.5
 
-    def calculate_cost(
-        self, duration_minutes: float, distance_km: float
-    ) -> float:
-        # TODO: implement peak-hour pricing
-        raise NotImplementedError("PeakHourPricing.calculate_cost")
+    def calculate_cost_batch(
+        self, durations: np.ndarray, distances: np.ndarray
+    ) -> np.ndarray:
+        # The multiplier is folded into the rates: one fused pass
+        return calculate_fares(
+            durations,
+            distances,
+            self.MULTIPLIER * CasualPricing.PER_MINUTE,
+            self.MULTIPLIER * CasualPricing.PER_KM,
+            self.MULTIPLIER * CasualPricing.UNLOCK_FEE,
+            dtype=np.float64,
+        )
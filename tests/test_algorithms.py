@@ -2,13 +2,41 @@
 Unit tests for sorting and searching algorithms.
 
 Covers:
-    - merge_sort (fully implemented)
-    - benchmark_sort (fully implemented)
+    - merge_sort (fully implemented) / merge_sort_array
+    - parallel_merge_sort
+    - insertion_sort
+    - binary_search / binary_search_array
+    - bulk_binary_search
+    - galloping_search
+    - build_u64_index / binary_search_u64
+    - linear_search_array
+    - benchmark_sort (fully implemented) / benchmark_arrays
 """
 
+from operator import attrgetter, itemgetter
+
+import numpy as np
 import pytest
 
-from algorithms import merge_sort, benchmark_sort
+from algorithms import (
+    merge_sort,
+    merge_sort_array,
+    parallel_merge_sort,
+    insertion_sort,
+    binary_search,
+    binary_search_array,
+    bulk_binary_search,
+    galloping_search,
+    build_u64_index,
+    binary_search_u64,
+    linear_search_array,
+    benchmark_sort,
+    benchmark_search,
+    benchmark_arrays,
+    _to_c_key,
+    _merge_sort_numeric,
+    _merge_path_split,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -73,6 +101,250 @@ class TestMergeSort:
         ones = [item for item in result if item[0] == 1]
         assert ones == [(1, "a"), (1, "c")]
 
+    def test_float_key(self) -> None:
+        data = [{"d": 2.5}, {"d": -1.0}, {"d": 0.5}]
+        result = merge_sort(data, key=lambda x: x["d"])
+        assert [d["d"] for d in result] == [-1.0, 0.5, 2.5]
+
+    def test_tuple_key_falls_back(self) -> None:
+        data = [(2, "b"), (1, "z"), (2, "a"), (1, "y")]
+        assert merge_sort(data, key=lambda x: (x[0], x[1])) == sorted(data)
+
+    def test_key_called_once_per_element(self) -> None:
+        calls = []
+
+        def key(x: tuple) -> tuple:
+            calls.append(x)
+            return x
+
+        merge_sort([(i % 5, i) for i in range(200)], key=key)
+        assert len(calls) == 200
+
+    def test_tuple_key_large_is_stable(self) -> None:
+        import random
+        random.seed(1)
+        data = [(random.randint(0, 5), random.randint(0, 5), i) for i in range(300)]
+        result = merge_sort(data, key=lambda x: (x[0], x[1]))
+        assert result == sorted(data, key=lambda x: (x[0], x[1]))
+
+
+# ---------------------------------------------------------------------------
+# parallel_merge_sort
+# ---------------------------------------------------------------------------
+
+class TestParallelMergeSort:
+
+    def test_small_input_sorted_in_process(self) -> None:
+        assert parallel_merge_sort([3, 1, 2], key=lambda x: -x) == [3, 2, 1]
+
+    def test_large_input_matches_sorted(self) -> None:
+        import random
+        random.seed(3)
+        data = [random.random() for _ in range(60_000)]
+        assert parallel_merge_sort(data, workers=2) == sorted(data)
+
+    def test_large_input_with_picklable_key_is_stable(self) -> None:
+        from operator import itemgetter
+        data = [(i % 7, i) for i in range(60_000)]
+        result = parallel_merge_sort(data, key=itemgetter(0), workers=3)
+        assert result == sorted(data, key=itemgetter(0))
+
+    def test_large_input_with_string_keys(self) -> None:
+        data = [f"ST{(i * 7919) % 1000:04d}" for i in range(60_000)]
+        assert parallel_merge_sort(data, workers=2) == sorted(data)
+
+
+class TestMergePathSplit:
+
+    def test_pieces_cover_the_output(self) -> None:
+        a = np.array([1, 3, 3, 5, 7, 9])
+        b = np.array([2, 3, 4, 8])
+        starts = _merge_path_split(a, b, 4) + [(a.size, b.size)]
+        pieces = []
+        for (a_lo, b_lo), (a_hi, b_hi) in zip(starts, starts[1:]):
+            assert a_lo <= a_hi and b_lo <= b_hi
+            pieces.extend(sorted(a[a_lo:a_hi].tolist() + b[b_lo:b_hi].tolist()))
+        assert pieces == sorted(a.tolist() + b.tolist())
+
+    def test_ties_go_to_first_array(self) -> None:
+        a = np.array([5, 5, 5])
+        b = np.array([5, 5, 5])
+        assert _merge_path_split(a, b, 2) == [(0, 0), (3, 0)]
+
+
+# ---------------------------------------------------------------------------
+# insertion_sort
+# ---------------------------------------------------------------------------
+
+class TestInsertionSort:
+
+    def test_basic(self) -> None:
+        assert insertion_sort([5, 2, 4, 1, 3]) == [1, 2, 3, 4, 5]
+
+    def test_empty_and_single(self) -> None:
+        assert insertion_sort([]) == []
+        assert insertion_sort([7]) == [7]
+
+    def test_matches_sorted_with_key(self) -> None:
+        import random
+        random.seed(2)
+        data = [random.randint(0, 10) for _ in range(100)]
+        assert insertion_sort(data, key=lambda x: -x) == sorted(data, key=lambda x: -x)
+
+    def test_stability(self) -> None:
+        data = [(2, "a"), (1, "b"), (2, "c"), (1, "d")]
+        result = insertion_sort(data, key=lambda x: x[0])
+        assert result == [(1, "b"), (1, "d"), (2, "a"), (2, "c")]
+
+    def test_does_not_modify_original(self) -> None:
+        original = [3, 1, 2]
+        insertion_sort(original)
+        assert original == [3, 1, 2]
+
+    def test_key_called_once_per_element(self) -> None:
+        calls = []
+
+        def key(x: int) -> int:
+            calls.append(x)
+            return x
+
+        insertion_sort(list(range(50, 0, -1)), key=key)
+        assert len(calls) == 50
+
+
+# ---------------------------------------------------------------------------
+# _merge_sort_numeric (Numba kernel, pure Python without numba)
+# ---------------------------------------------------------------------------
+
+class TestMergeSortNumeric:
+
+    def test_matches_stable_argsort(self) -> None:
+        rng = np.random.default_rng(0)
+        keys = rng.integers(0, 20, size=300)
+        expected = np.argsort(keys, kind="stable")
+        assert np.array_equal(_merge_sort_numeric(keys), expected)
+
+    def test_float_keys(self) -> None:
+        keys = np.array([2.5, -1.0, 0.0, 2.5, 1.5])
+        assert _merge_sort_numeric(keys).tolist() == [1, 2, 4, 0, 3]
+
+    def test_empty(self) -> None:
+        assert _merge_sort_numeric(np.array([], dtype=np.float64)).size == 0
+
+
+# ---------------------------------------------------------------------------
+# binary_search
+# ---------------------------------------------------------------------------
+
+class TestBinarySearch:
+
+    def test_finds_every_element(self) -> None:
+        data = [1, 3, 5, 7, 9, 11]
+        for i, value in enumerate(data):
+            assert binary_search(data, value) == i
+
+    def test_missing_returns_none(self) -> None:
+        data = [1, 3, 5, 7]
+        assert binary_search(data, 4) is None
+        assert binary_search(data, 0) is None
+        assert binary_search(data, 8) is None
+
+    def test_empty_list(self) -> None:
+        assert binary_search([], 1) is None
+
+    def test_returns_first_duplicate(self) -> None:
+        assert binary_search([1, 2, 2, 2, 3], 2) == 1
+
+    def test_custom_key(self) -> None:
+        data = [{"id": 1}, {"id": 4}, {"id": 9}]
+        assert binary_search(data, 4, key=lambda x: x["id"]) == 1
+
+    def test_array_version_matches(self) -> None:
+        keys = np.array([1.0, 2.0, 2.0, 5.0, 8.0])
+        assert binary_search_array(keys, 2.0) == 1
+        assert binary_search_array(keys, 8.0) == 4
+        assert binary_search_array(keys, 3.0) == -1
+        assert binary_search_array(keys[:0], 3.0) == -1
+
+
+# ---------------------------------------------------------------------------
+# bulk_binary_search
+# ---------------------------------------------------------------------------
+
+class TestBulkBinarySearch:
+
+    def test_matches_scalar_search(self) -> None:
+        keys = np.array([2, 4, 4, 8, 16, 32])
+        targets = np.array([16, 3, 4, 2, 33, 32, 8])
+        expected = [binary_search_array(keys, t) for t in targets]
+        assert bulk_binary_search(keys, targets).tolist() == expected
+
+    def test_string_keys(self) -> None:
+        keys = np.array(["ST100", "ST101", "ST105"])
+        targets = np.array(["ST105", "ST102", "ST100"])
+        assert bulk_binary_search(keys, targets).tolist() == [2, -1, 0]
+
+    def test_empty_keys(self) -> None:
+        assert bulk_binary_search(np.array([]), np.array([1.0, 2.0])).tolist() == [-1, -1]
+
+
+# ---------------------------------------------------------------------------
+# galloping_search
+# ---------------------------------------------------------------------------
+
+class TestGallopingSearch:
+
+    def test_finds_every_element(self) -> None:
+        data = list(range(0, 100, 3))
+        for i, value in enumerate(data):
+            assert galloping_search(data, value) == i
+
+    def test_missing_returns_none(self) -> None:
+        data = [1, 3, 5, 7, 9]
+        for target in (0, 2, 8, 10):
+            assert galloping_search(data, target) is None
+
+    def test_empty_and_single(self) -> None:
+        assert galloping_search([], 1) is None
+        assert galloping_search([4], 4) == 0
+        assert galloping_search([4], 5) is None
+
+    def test_returns_first_duplicate(self) -> None:
+        assert galloping_search([1, 2, 2, 2, 2, 2, 3], 2) == 1
+
+    def test_custom_key(self) -> None:
+        data = [("a", 1), ("b", 5), ("c", 8)]
+        assert galloping_search(data, 8, key=lambda x: x[1]) == 2
+
+
+# ---------------------------------------------------------------------------
+# binary_search_u64
+# ---------------------------------------------------------------------------
+
+class TestBinarySearchU64:
+
+    def test_shared_prefixes(self) -> None:
+        data = sorted(["ST100", "ST1000000", "ST10000001", "ST10000002", "ST2", "a"])
+        index = build_u64_index(data)
+        for i, value in enumerate(data):
+            assert binary_search_u64(index, data, value) == i
+
+    def test_missing_returns_none(self) -> None:
+        data = sorted(["ST10000001", "ST10000003", "Tech Hub"])
+        index = build_u64_index(data)
+        assert binary_search_u64(index, data, "ST10000002") is None
+        assert binary_search_u64(index, data, "Airport") is None
+
+    def test_non_ascii(self) -> None:
+        data = sorted(["Café Royal", "Cafe", "Zürich HB", "Zurich"])
+        index = build_u64_index(data)
+        assert binary_search_u64(index, data, "Zürich HB") == data.index("Zürich HB")
+
+    def test_custom_key(self) -> None:
+        data = [{"name": "City Hall"}, {"name": "Lakeside"}, {"name": "Old Town"}]
+        index = build_u64_index(data, key=lambda x: x["name"])
+        assert binary_search_u64(index, data, "Lakeside", key=lambda x: x["name"]) == 1
+
 
 # ---------------------------------------------------------------------------
 # benchmark_sort
@@ -94,3 +366,78 @@ class TestBenchmarkSort:
         data = ["bb", "a", "ccc"]
         result = benchmark_sort(data, key=len, repeats=1)
         assert isinstance(result["merge_sort_ms"], float)
+
+
+# ---------------------------------------------------------------------------
+# _to_c_key
+# ---------------------------------------------------------------------------
+
+class TestToCKey:
+
+    def test_subscript_lambda_becomes_itemgetter(self) -> None:
+        key = _to_c_key(lambda t: t["duration_minutes"])
+        assert isinstance(key, itemgetter)
+        assert key({"duration_minutes": 12.5}) == 12.5
+
+    def test_attribute_lambda_becomes_attrgetter(self) -> None:
+        key = _to_c_key(lambda t: t.real)
+        assert isinstance(key, attrgetter)
+        assert key(3 + 4j) == 3
+
+    def test_other_callables_unchanged(self) -> None:
+        def identity(x): return x
+        offset = 1
+        closure = lambda t: t[offset]  # noqa: E731
+        computed = lambda t: t[0] * 2  # noqa: E731
+        for key in (identity, closure, computed, len):
+            assert _to_c_key(key) is key
+
+
+# ---------------------------------------------------------------------------
+# NumPy array kernels
+# ---------------------------------------------------------------------------
+
+class TestMergeSortArray:
+
+    def test_matches_numpy_sort(self) -> None:
+        arr = np.random.default_rng(3).random(500)
+        assert np.array_equal(merge_sort_array(arr), np.sort(arr))
+
+    def test_input_not_modified(self) -> None:
+        arr = np.array([3.0, 1.0, 2.0])
+        merge_sort_array(arr)
+        assert arr.tolist() == [3.0, 1.0, 2.0]
+
+    def test_non_numeric_falls_back(self) -> None:
+        assert merge_sort_array(np.array(["b", "a"])).tolist() == ["a", "b"]
+
+
+class TestLinearSearchArray:
+
+    def test_first_match(self) -> None:
+        assert linear_search_array(np.array([5.0, 2.0, 2.0]), 2.0) == 1
+
+    def test_missing(self) -> None:
+        assert linear_search_array(np.array([5.0, 2.0]), 7.0) == -1
+
+
+class TestBenchmarkArrays:
+
+    def test_returns_all_timings(self) -> None:
+        result = benchmark_arrays(np.arange(100, dtype=np.float64), 42.0, repeats=2)
+        assert set(result) == {
+            "merge_sort_array_ms", "numpy_sort_ms",
+            "binary_search_array_ms", "linear_search_array_ms",
+        }
+        assert all(v >= 0 for v in result.values())
+
+
+class TestBenchmarkSearch:
+
+    def test_numeric_keys_include_array_baselines(self) -> None:
+        result = benchmark_search(list(range(200)), 150, repeats=2)
+        assert {"searchsorted_ms", "eytzinger_search_ms"} <= set(result)
+
+    def test_string_keys_skip_array_baselines(self) -> None:
+        result = benchmark_search(["b", "a", "c"], "c", repeats=2)
+        assert "searchsorted_ms" not in result
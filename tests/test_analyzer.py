@@ -0,0 +1,201 @@
+"""
+Unit tests for the analyzer module.
+
+Covers:
+    - _normalize_category
+    - _top_n_indices
+    - BikeShareSystem loading and cleaning (on small CSVs in a temp dir)
+    - BikeShareSystem analytics and their memoization
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import analyzer
+from analyzer import BikeShareSystem, _normalize_category, _top_n_indices
+
+
+TRIPS_CSV = """\
+trip_id,user_id,user_type,bike_id,bike_type,start_station_id,end_station_id,start_time,end_time,duration_minutes,distance_km,status
+TR1,U1,member,BK1,classic,ST1,ST2,2024-01-05 08:00:00,2024-01-05 08:10:00,10.0,2.0,completed
+TR2,U1, Member ,BK2,Electric,ST1,ST3,2024-01-20 08:30:00,2024-01-20 09:00:00,30.0,5.5,Completed
+TR3,U2,casual,BK1,classic,ST2,ST1,2024-03-02 17:00:00,2024-03-02 17:20:00,20.0,3.0,cancelled
+TR3,U2,casual,BK1,classic,ST2,ST1,2024-03-02 17:00:00,2024-03-02 17:20:00,20.0,3.0,cancelled
+TR4,U3,casual,BK2,electric,ST1,ST2,2024-03-10 09:00:00,2024-03-10 08:00:00,5.0,1.0,completed
+TR5,U3,casual,BK2,electric,ST3,ST2,2024-03-11 09:00:00,,5.0,1.0,completed
+"""
+
+STATIONS_CSV = """\
+station_id,station_name,capacity,latitude,longitude
+ST1,Central,20,48.8,9.2
+ST2,Harbor,15,48.9,9.3
+ST3,,10,48.7,9.1
+ST4,Idle,10,48.6,9.0
+"""
+
+MAINTENANCE_CSV = """\
+record_id,bike_id,bike_type,date,maintenance_type,cost,description
+MR1,BK1,classic,2024-02-01,tire_repair,10.5,Tire
+MR2,BK2,Electric,2024-02-03,battery_replacement,100.25,Battery
+"""
+
+
+@pytest.fixture
+def system(tmp_path, monkeypatch) -> BikeShareSystem:
+    """A loaded and cleaned system over the small CSVs above."""
+    (tmp_path / "trips.csv").write_text(TRIPS_CSV)
+    (tmp_path / "stations.csv").write_text(STATIONS_CSV)
+    (tmp_path / "maintenance.csv").write_text(MAINTENANCE_CSV)
+    monkeypatch.setattr(analyzer, "DATA_DIR", tmp_path)
+    system = BikeShareSystem()
+    system.load_data()
+    system.clean_data()
+    return system
+
+
+# ---------------------------------------------------------------------------
+# _normalize_category
+# ---------------------------------------------------------------------------
+
+class TestNormalizeCategory:
+
+    def test_trims_lowercases_and_merges_labels(self) -> None:
+        col = pd.Series([" Member", "member ", "CASUAL", "casual"], index=[3, 5, 7, 9], name="user_type")
+        result = _normalize_category(col)
+        assert isinstance(result.dtype, pd.CategoricalDtype)
+        assert result.tolist() == ["member", "member", "casual", "casual"]
+        assert list(result.cat.categories) == ["casual", "member"]
+        assert result.index.tolist() == [3, 5, 7, 9]
+        assert result.name == "user_type"
+
+    def test_missing_values_stay_missing(self) -> None:
+        result = _normalize_category(pd.Series(["A", None, " a"], dtype="string[pyarrow]"))
+        assert result.isna().tolist() == [False, True, False]
+        assert result.cat.categories.tolist() == ["a"]
+
+    def test_empty_column(self) -> None:
+        result = _normalize_category(pd.Series([], dtype="string[pyarrow]"))
+        assert len(result) == 0
+
+
+# ---------------------------------------------------------------------------
+# _top_n_indices
+# ---------------------------------------------------------------------------
+
+class TestTopNIndices:
+
+    @pytest.mark.parametrize("n", [1, 3, 5, 8, 20])
+    def test_matches_stable_sort(self, n: int) -> None:
+        counts = np.array([4, 9, 1, 9, 4, 0, 7, 4])
+        expected = np.argsort(-counts, kind="stable")[:n]
+        assert _top_n_indices(counts, n).tolist() == expected.tolist()
+
+    def test_non_positive_n(self) -> None:
+        assert _top_n_indices(np.array([1, 2]), 0).size == 0
+
+
+# ---------------------------------------------------------------------------
+# Loading and cleaning
+# ---------------------------------------------------------------------------
+
+class TestCleanData:
+
+    def test_drops_duplicate_incomplete_and_invalid_trips(self, system: BikeShareSystem) -> None:
+        assert system.trips["trip_id"].tolist() == ["TR1", "TR2", "TR3"]
+
+    def test_normalizes_categories(self, system: BikeShareSystem) -> None:
+        assert system.trips["user_type"].tolist() == ["member", "member", "casual"]
+        assert system.trips["status"].tolist() == ["completed", "completed", "cancelled"]
+        assert system.maintenance["bike_type"].tolist() == ["classic", "electric"]
+
+    def test_fills_missing_station_names(self, system: BikeShareSystem) -> None:
+        assert system.stations["station_name"].tolist() == ["Central", "Harbor", "Unknown", "Idle"]
+
+    def test_derives_time_buckets(self, system: BikeShareSystem) -> None:
+        assert system.trips["start_hour"].tolist() == [8, 8, 17]
+        assert system.trips["start_month"].dt.month.tolist() == [1, 1, 3]
+
+    def test_drops_rows_with_malformed_values(self, system: BikeShareSystem, tmp_path) -> None:
+        (tmp_path / "trips.csv").write_text(
+            TRIPS_CSV
+            + "TR6,U1,member,BK1,classic,ST1,ST2,not-a-date,2024-01-06 08:10:00,10.0,2.0,completed\n"
+            + "TR7,U1,member,BK1,classic,ST1,ST2,2024-01-07 08:00:00,2024-01-07 08:10:00,ten,2.0,completed\n"
+        )
+        system.load_data()
+        assert system.trips["start_time"].dtype == "datetime64[ns]"
+        assert system.trips["duration_minutes"].dtype == np.float64
+        system.clean_data()
+        assert system.trips["trip_id"].tolist() == ["TR1", "TR2", "TR3"]
+
+
+# ---------------------------------------------------------------------------
+# Analytics
+# ---------------------------------------------------------------------------
+
+class TestAnalytics:
+
+    def test_total_trips_summary(self, system: BikeShareSystem) -> None:
+        assert system.total_trips_summary() == {
+            "total_trips": 3,
+            "total_distance_km": 10.5,
+            "avg_duration_min": 20.0,
+        }
+
+    def test_top_start_stations_skips_stations_without_trips(self, system: BikeShareSystem) -> None:
+        top = system.top_start_stations(5)
+        assert top["station_name"].tolist() == ["Central", "Harbor"]
+        assert top["trip_count"].tolist() == [2, 1]
+
+    def test_top_start_stations_on_empty_table(self, system: BikeShareSystem) -> None:
+        system.trips = system.trips.iloc[:0]
+        assert system.top_start_stations().empty
+
+    def test_peak_usage_hours(self, system: BikeShareSystem) -> None:
+        hours = system.peak_usage_hours()
+        assert len(hours) == 24
+        assert hours[8] == 2
+        assert hours[17] == 1
+        assert hours.sum() == 3
+
+    def test_monthly_trip_trend_fills_empty_months(self, system: BikeShareSystem) -> None:
+        monthly = system.monthly_trip_trend()
+        assert monthly.tolist() == [2, 0, 1]
+        assert [ts.month for ts in monthly.index] == [1, 2, 3]
+
+    def test_top_active_users(self, system: BikeShareSystem) -> None:
+        top = system.top_active_users(1)
+        assert top["user_id"].tolist() == ["U1"]
+        assert top["trip_count"].tolist() == [2]
+
+    def test_top_routes(self, system: BikeShareSystem) -> None:
+        routes = system.top_routes(2)
+        assert routes[["start_station_id", "end_station_id"]].values.tolist() == [
+            ["ST1", "ST2"],
+            ["ST1", "ST3"],
+        ]
+        assert routes["trip_count"].tolist() == [1, 1]
+
+    def test_maintenance_cost_by_bike_type(self, system: BikeShareSystem) -> None:
+        costs = system.maintenance_cost_by_bike_type()
+        assert costs.to_dict() == {"classic": 10.5, "electric": 100.25}
+
+    def test_trip_completion_rate(self, system: BikeShareSystem) -> None:
+        assert system.trip_completion_rate() == pytest.approx(200 / 3)
+
+
+class TestMemoize:
+
+    def test_results_are_cached_per_arguments(self, system: BikeShareSystem) -> None:
+        assert system.top_start_stations(2) is system.top_start_stations(2)
+        assert system.top_start_stations(1) is not system.top_start_stations(2)
+
+    def test_load_and_clean_clear_the_cache(self, system: BikeShareSystem) -> None:
+        before = system.total_trips_summary()
+        system.load_data()  # reads back the cleaned Parquet files
+        reloaded = system.total_trips_summary()
+        assert reloaded is not before
+        assert reloaded == before
+        system.trips = system.trips.iloc[:2]
+        system.clean_data()
+        assert system.total_trips_summary()["total_trips"] == 2
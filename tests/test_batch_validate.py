@@ -0,0 +1,74 @@
+"""
+Unit tests for the batch_validate module.
+
+Covers:
+    - encode_ids
+    - validate_trip_arrays (serial and parallel kernels)
+    - the uncompiled loop, via ``py_func`` when Numba is installed
+"""
+
+import numpy as np
+import pandas as pd
+
+import batch_validate
+from batch_validate import encode_ids, validate_trip_arrays
+
+
+def _arrays() -> tuple[np.ndarray, ...]:
+    """Five trips: valid, unknown bike, end before start, negative distance, valid."""
+    ids = np.array([0, 1, 0, 1, 0], dtype=np.int64)
+    bikes = np.array([0, -1, 0, 0, 1], dtype=np.int64)
+    start = np.array([0, 10, 20, 30, 40], dtype=np.int64)
+    end = np.array([5, 15, 19, 35, 45], dtype=np.int64)
+    dist = np.array([1.0, 2.0, 3.0, -0.5, 0.0])
+    return ids, bikes, ids, ids, start, end, dist
+
+
+EXPECTED = [True, False, False, False, True]
+
+
+# ---------------------------------------------------------------------------
+# encode_ids
+# ---------------------------------------------------------------------------
+
+class TestEncodeIds:
+
+    def test_positions_and_unknown(self) -> None:
+        lookup = {"A": object(), "B": object()}
+        codes = encode_ids(pd.Series(["B", "A", "Z"]), lookup)
+        assert codes.dtype == np.int64
+        assert codes.tolist() == [1, 0, -1]
+
+    def test_categorical_column(self) -> None:
+        codes = encode_ids(pd.Series(["B", "A"], dtype="category"), {"A": 1, "B": 2})
+        assert codes.tolist() == [1, 0]
+
+
+# ---------------------------------------------------------------------------
+# validate_trip_arrays
+# ---------------------------------------------------------------------------
+
+class TestValidateTripArrays:
+
+    def test_mask_and_first_invalid(self) -> None:
+        valid, first = validate_trip_arrays(*_arrays())
+        assert valid.tolist() == EXPECTED
+        assert first == 1
+
+    def test_all_valid(self) -> None:
+        arrays = list(_arrays())
+        arrays[1] = np.zeros(5, dtype=np.int64)
+        arrays[5] = arrays[4] + 1
+        arrays[6] = np.ones(5)
+        valid, first = validate_trip_arrays(*arrays)
+        assert valid.all()
+        assert first == -1
+
+    def test_parallel_kernel(self, monkeypatch) -> None:
+        monkeypatch.setattr(batch_validate, "PARALLEL_THRESHOLD", 0)
+        valid, _ = validate_trip_arrays(*_arrays())
+        assert valid.tolist() == EXPECTED
+
+    def test_python_loop(self) -> None:
+        kernel = getattr(batch_validate._validate_serial, "py_func", batch_validate._validate_serial)
+        assert kernel(*_arrays()).tolist() == EXPECTED
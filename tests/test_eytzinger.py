@@ -0,0 +1,58 @@
+"""
+Unit tests for the Eytzinger search layout.
+
+Covers:
+    - build_eytzinger
+    - eytzinger_search
+"""
+
+import numpy as np
+
+from eytzinger import build_eytzinger, eytzinger_search
+
+
+# ---------------------------------------------------------------------------
+# build_eytzinger
+# ---------------------------------------------------------------------------
+
+class TestBuildEytzinger:
+
+    def test_known_layout(self) -> None:
+        layout, order = build_eytzinger(np.arange(7))
+        assert layout[1:].tolist() == [3, 1, 5, 0, 2, 4, 6]
+        assert order[1:].tolist() == [3, 1, 5, 0, 2, 4, 6]
+
+    def test_order_is_permutation(self) -> None:
+        _, order = build_eytzinger(np.arange(10.0))
+        assert sorted(order[1:].tolist()) == list(range(10))
+
+    def test_empty(self) -> None:
+        layout, order = build_eytzinger(np.array([], dtype=np.float64))
+        assert layout.size == 1
+        assert order.size == 1
+
+
+# ---------------------------------------------------------------------------
+# eytzinger_search
+# ---------------------------------------------------------------------------
+
+class TestEytzingerSearch:
+
+    def test_finds_every_element(self) -> None:
+        keys = np.array([2.0, 3.5, 7.0, 9.0, 11.0, 20.0, 31.0, 40.0, 41.0])
+        layout, order = build_eytzinger(keys)
+        for i, value in enumerate(keys):
+            assert eytzinger_search(layout, order, value) == i
+
+    def test_missing_returns_minus_one(self) -> None:
+        layout, order = build_eytzinger(np.array([1, 3, 5, 7]))
+        for target in (0, 2, 4, 6, 8):
+            assert eytzinger_search(layout, order, target) == -1
+
+    def test_returns_first_duplicate(self) -> None:
+        layout, order = build_eytzinger(np.array([1, 2, 2, 2, 3]))
+        assert eytzinger_search(layout, order, 2) == 1
+
+    def test_empty(self) -> None:
+        layout, order = build_eytzinger(np.array([], dtype=np.int64))
+        assert eytzinger_search(layout, order, 5) == -1
@@ -3,12 +3,28 @@ Unit tests for the factory module.
 
 Covers:
     - create_bike (fully implemented)
+    - create_bikes_batch
+    - create_user
+    - create_trip / create_maintenance_record timestamp inputs
+    - create_trips_batch / create_maintenance_records_batch
 """
 
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
 import pytest
 
-from factories import create_bike
-from models import ClassicBike, ElectricBike, Bike
+from factories import (
+    create_bike,
+    create_bikes_batch,
+    create_user,
+    create_trip,
+    create_maintenance_record,
+    create_trips_batch,
+    create_maintenance_records_batch,
+)
+from models import ClassicBike, ElectricBike, Bike, CasualUser, MemberUser, Station
 
 
 # ---------------------------------------------------------------------------
@@ -58,3 +74,172 @@ class TestCreateBike:
     def test_result_is_bike_instance(self) -> None:
         bike = create_bike({"bike_id": "BK008", "bike_type": "electric"})
         assert isinstance(bike, Bike)
+
+
+class TestCreateBikesBatch:
+
+    def test_matches_constructors(self) -> None:
+        ts = datetime(2024, 6, 15, 12, 0, 0)
+        frame = pd.DataFrame({
+            "bike_id": ["BK1", "BK2", "BK3"],
+            "bike_type": ["classic", "Electric", "CLASSIC"],
+            "status": ["available", "in_use", None],
+            "gear_count": [21, None, None],
+            "battery_level": [None, 80.0, None],
+        })
+        bikes = create_bikes_batch(frame, created_at=ts)
+        expected = [
+            ClassicBike("BK1", gear_count=21, created_at=ts),
+            ElectricBike("BK2", battery_level=80.0, status="in_use", created_at=ts),
+            ClassicBike("BK3", created_at=ts),
+        ]
+        assert [type(b) for b in bikes] == [type(e) for e in expected]
+        assert [repr(b) for b in bikes] == [repr(e) for e in expected]
+        assert all(b.created_at is ts for b in bikes)
+        assert type(bikes[0].gear_count) is int
+
+    def test_shares_one_default_created_at(self) -> None:
+        frame = pd.DataFrame({"bike_id": ["BK1", "BK2"], "bike_type": ["classic", "electric"]})
+        first, second = create_bikes_batch(frame)
+        assert isinstance(first.created_at, datetime)
+        assert second.created_at is first.created_at
+
+    def test_reports_every_invalid_row(self) -> None:
+        frame = pd.DataFrame({
+            "bike_id": ["BK1", "BK2", "BK3", "BK4", ""],
+            "bike_type": ["classic", "tandem", "classic", "electric", "classic"],
+            "status": ["available", "available", "lost", "available", "available"],
+            "gear_count": [0, 7, 7, 0, 7],
+        })
+        with pytest.raises(ValueError, match=r"\['BK1', 'BK2', 'BK3', ''\]"):
+            create_bikes_batch(frame)
+
+
+# ---------------------------------------------------------------------------
+# create_user
+# ---------------------------------------------------------------------------
+
+class TestCreateUser:
+
+    def test_creates_casual_user(self) -> None:
+        user = create_user({
+            "user_id": "USR1", "name": "Ann", "email": "ann@example.com",
+            "user_type": "Casual", "day_pass_count": "2",
+        })
+        assert isinstance(user, CasualUser)
+        assert user.day_pass_count == 2
+
+    def test_creates_member_user(self) -> None:
+        user = create_user({
+            "user_id": "USR2", "name": "Bo", "email": "bo@example.com",
+            "user_type": "member", "membership_start": "2024-01-01",
+            "membership_end": "2025-01-01", "tier": "Premium",
+        })
+        assert isinstance(user, MemberUser)
+        assert user.tier == "premium"
+
+    def test_unknown_type_raises(self) -> None:
+        with pytest.raises(ValueError, match="Unknown user_type"):
+            create_user({"user_id": "USR3", "name": "Cy", "email": "cy@example.com", "user_type": "guest"})
+
+
+# ---------------------------------------------------------------------------
+# create_trip / create_maintenance_record
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def lookups() -> tuple[dict, dict, dict]:
+    users = {"USR1": CasualUser(user_id="USR1", name="Ann", email="ann@example.com")}
+    bikes = {"BK1": ClassicBike(bike_id="BK1")}
+    stations = {
+        "ST1": Station(station_id="ST1", name="A", capacity=10, latitude=48.8, longitude=9.2),
+        "ST2": Station(station_id="ST2", name="B", capacity=10, latitude=48.9, longitude=9.3),
+    }
+    return users, bikes, stations
+
+
+def _trip_row(start, end) -> dict:
+    return {
+        "trip_id": "TR1", "user_id": "USR1", "bike_id": "BK1",
+        "start_station_id": "ST1", "end_station_id": "ST2",
+        "start_time": start, "end_time": end, "distance_km": 2.5,
+    }
+
+
+class TestCreateTrip:
+
+    @pytest.mark.parametrize("convert", [
+        str,
+        lambda s: datetime.fromisoformat(s),
+        pd.Timestamp,
+        np.datetime64,
+    ])
+    def test_accepts_strings_and_parsed_timestamps(self, lookups, convert) -> None:
+        row = _trip_row(convert("2024-05-03T11:15:00"), convert("2024-05-03T11:45:00"))
+        trip = create_trip(row, *lookups)
+        assert type(trip.start_time) is datetime
+        assert trip.start_time == datetime(2024, 5, 3, 11, 15)
+        assert trip.duration_minutes == 30.0
+
+    def test_from_dataframe_row(self, lookups) -> None:
+        frame = pd.DataFrame([_trip_row("2024-05-03 11:15:00", "2024-05-03 11:20:00")])
+        frame[["start_time", "end_time"]] = frame[["start_time", "end_time"]].apply(pd.to_datetime)
+        trip = create_trip(frame.iloc[0].to_dict(), *lookups)
+        assert trip.end_time == datetime(2024, 5, 3, 11, 20)
+
+
+class TestCreateMaintenanceRecord:
+
+    def test_accepts_timestamp(self, lookups) -> None:
+        _, bikes, _ = lookups
+        record = create_maintenance_record({
+            "record_id": "MR1", "bike_id": "BK1", "date": pd.Timestamp("2024-03-03"),
+            "maintenance_type": "tire_repair", "cost": 12.5,
+        }, bikes)
+        assert record.date == datetime(2024, 3, 3)
+
+
+class TestCreateTripsBatch:
+
+    def test_matches_scalar_factory(self, lookups) -> None:
+        rows = [
+            _trip_row("2024-05-03 11:15:00", "2024-05-03 11:45:00"),
+            _trip_row("2024-05-04T08:00:00", "2024-05-04T08:12:30"),
+        ]
+        trips = create_trips_batch(pd.DataFrame(rows), *lookups)
+        expected = [create_trip(row, *lookups) for row in rows]
+        for trip, ref in zip(trips, expected):
+            assert type(trip.start_time) is datetime
+            assert (trip.user, trip.start_station, trip.end_station) == (
+                ref.user, ref.start_station, ref.end_station
+            )
+            assert (trip.start_time, trip.end_time, trip.distance_km) == (
+                ref.start_time, ref.end_time, ref.distance_km
+            )
+
+    def test_reports_unknown_ids(self, lookups) -> None:
+        row = _trip_row("2024-05-03 11:15:00", "2024-05-03 11:45:00")
+        frame = pd.DataFrame([row, {**row, "bike_id": "BK9"}])
+        with pytest.raises(ValueError, match="BK9"):
+            create_trips_batch(frame, *lookups)
+
+    def test_rejects_end_before_start(self, lookups) -> None:
+        frame = pd.DataFrame([_trip_row("2024-05-03 11:45:00", "2024-05-03 11:15:00")])
+        with pytest.raises(ValueError, match="TR1"):
+            create_trips_batch(frame, *lookups)
+
+
+class TestCreateMaintenanceRecordsBatch:
+
+    def test_builds_records(self, lookups) -> None:
+        _, bikes, _ = lookups
+        frame = pd.DataFrame({
+            "record_id": ["MR1", "MR2"], "bike_id": ["BK1", "BK1"],
+            "date": ["2024-03-03", "2024-03-04"],
+            "maintenance_type": ["tire_repair", "general_inspection"],
+            "cost": [12.5, 30.0], "description": ["flat", None],
+        })
+        records = create_maintenance_records_batch(frame, bikes)
+        assert [r.date for r in records] == [datetime(2024, 3, 3), datetime(2024, 3, 4)]
+        assert [r.description for r in records] == ["flat", ""]
+        assert records[1].bike is bikes["BK1"]
@@ -2,13 +2,22 @@
 Unit tests for OOP models.
 
 Covers:
-    - Entity (via ClassicBike since Entity is abstract)
+    - Entity (mostly via ClassicBike)
     - Bike base class validation
     - ClassicBike creation, properties, validation, __str__, __repr__
+    - User validation
+    - Trip / MaintenanceRecord slot layout
+    - TripFrame columnar storage
 """
 
+import sys
+
+import numpy as np
 import pytest
 from datetime import datetime
+
+import models
+from utils import parse_iso_datetime
 from models import (
     Entity,
     Bike,
@@ -16,6 +25,7 @@ from models import (
     ElectricBike,
     User,
     Trip,
+    TripFrame,
     Station,
     MaintenanceRecord,
 )
@@ -43,18 +53,22 @@ def create_trip(data: dict, user_map: dict, bike_map: dict, station_map: dict) -
     start_station = station_map.get(data["start_station_id"])
     end_station = station_map.get(data["end_station_id"])
 
-    if user is None:
-        raise ValueError(f"User ID {data['user_id']} not found")
-    if bike is None:
-        raise ValueError(f"Bike ID {data['bike_id']} not found")
-    if start_station is None:
-        raise ValueError(f"Start station ID {data['start_station_id']} not found")
-    if end_station is None:
-        raise ValueError(f"End station ID {data['end_station_id']} not found")
+    missing = [
+        f"{key}={data[key]}"
+        for key, found in (
+            ("user_id", user),
+            ("bike_id", bike),
+            ("start_station_id", start_station),
+            ("end_station_id", end_station),
+        )
+        if found is None
+    ]
+    if missing:
+        raise ValueError(f"IDs not found: {', '.join(missing)}")
 
     # Parse datetimes
-    start_time = datetime.fromisoformat(data["start_time"])
-    end_time = datetime.fromisoformat(data["end_time"])
+    start_time = parse_iso_datetime(data["start_time"])
+    end_time = parse_iso_datetime(data["end_time"])
 
     # Distance validation
     distance_km = float(data.get("distance_km", 0.0))
@@ -95,7 +109,7 @@ def create_maintenance_record(data: dict, bike_map: dict) -> MaintenanceRecord:
         raise ValueError(f"Bike ID {data['bike_id']} not found")
 
     # Parse date
-    date = datetime.fromisoformat(data["date"])
+    date = parse_iso_datetime(data["date"])
 
     # Cost validation
     cost = float(data.get("cost", 0.0))
@@ -115,40 +129,54 @@ def create_maintenance_record(data: dict, bike_map: dict) -> MaintenanceRecord:
     )
 
 
+# Built once per module for the tests that only read a default bike;
+# tests that mutate a bike construct their own.
+@pytest.fixture(scope="module")
+def sample_bike() -> ClassicBike:
+    return ClassicBike(bike_id="BK001")
+
 
 # ---------------------------------------------------------------------------
 # Entity (tested through concrete subclass ClassicBike)
 # ---------------------------------------------------------------------------
 
 class TestEntity:
-    """Tests for the abstract Entity base class."""
+    """Tests for the Entity base class."""
 
-    def test_entity_cannot_be_instantiated(self) -> None:
-        with pytest.raises(TypeError):
-            Entity(id="E001")  # type: ignore[abstract]
+    def test_entity_default_repr(self) -> None:
+        entity = Entity(id="E001")
+        assert repr(entity) == "Entity(id='E001')"
+        assert str(entity) == repr(entity)
 
     def test_entity_rejects_empty_id(self) -> None:
         with pytest.raises(ValueError):
             ClassicBike(bike_id="", gear_count=5)
 
-    def test_entity_rejects_non_string_id(self) -> None:
+    def test_entity_rejects_non_string_id(self, monkeypatch) -> None:
+        monkeypatch.setattr(models, "STRICT_VALIDATION", True)
         with pytest.raises((ValueError, TypeError)):
             ClassicBike(bike_id=123, gear_count=5)  # type: ignore[arg-type]
 
-    def test_entity_id_property(self) -> None:
-        bike = ClassicBike(bike_id="BK001")
-        assert bike.id == "BK001"
+    def test_entity_skips_type_check_by_default(self) -> None:
+        bike = ClassicBike(bike_id=123, gear_count=5)  # type: ignore[arg-type]
+        assert bike.id == 123
 
-    def test_entity_created_at_default(self) -> None:
-        bike = ClassicBike(bike_id="BK001")
-        assert isinstance(bike.created_at, datetime)
+    def test_entity_id_property(self, sample_bike: ClassicBike) -> None:
+        assert sample_bike.id == "BK001"
+
+    def test_entity_created_at_default(self, sample_bike: ClassicBike) -> None:
+        assert isinstance(sample_bike.created_at, datetime)
 
     def test_entity_created_at_custom(self) -> None:
         ts = datetime(2024, 6, 15, 12, 0, 0)
-        bike = ClassicBike.__new__(ClassicBike)
-        Entity.__init__(bike, id="BK001", created_at=ts)
+        bike = ClassicBike._unchecked("BK001", created_at=ts)
         assert bike.created_at == ts
 
+    def test_subclass_accepts_created_at(self) -> None:
+        ts = datetime(2024, 6, 15, 12, 0, 0)
+        bikes = [ClassicBike(bike_id=f"BK{i:03d}", created_at=ts) for i in range(3)]
+        assert all(b.created_at is ts for b in bikes)
+
 
 # ---------------------------------------------------------------------------
 # Bike
@@ -204,12 +232,11 @@ class TestBike:
 class TestClassicBike:
     """Tests for the ClassicBike subclass."""
 
-    def test_creation_defaults(self) -> None:
-        bike = ClassicBike(bike_id="BK010")
-        assert bike.id == "BK010"
-        assert bike.bike_type == "classic"
-        assert bike.gear_count == 7
-        assert bike.status == "available"
+    def test_creation_defaults(self, sample_bike: ClassicBike) -> None:
+        assert sample_bike.id == "BK001"
+        assert sample_bike.bike_type == "classic"
+        assert sample_bike.gear_count == 7
+        assert sample_bike.status == "available"
 
     def test_creation_custom_gears(self) -> None:
         bike = ClassicBike(bike_id="BK011", gear_count=21)
@@ -223,10 +250,9 @@ class TestClassicBike:
         with pytest.raises(ValueError):
             ClassicBike(bike_id="BK013", gear_count=-3)
 
-    def test_is_instance_of_bike(self) -> None:
-        bike = ClassicBike(bike_id="BK014")
-        assert isinstance(bike, Bike)
-        assert isinstance(bike, Entity)
+    def test_is_instance_of_bike(self, sample_bike: ClassicBike) -> None:
+        assert isinstance(sample_bike, Bike)
+        assert isinstance(sample_bike, Entity)
 
     def test_str(self) -> None:
         bike = ClassicBike(bike_id="BK015", gear_count=7)
@@ -238,3 +264,126 @@ class TestClassicBike:
         assert "BK015" in r
         assert "gear_count=7" in r
         assert "available" in r
+
+    def test_has_no_instance_dict(self, sample_bike: ClassicBike) -> None:
+        assert not hasattr(sample_bike, "__dict__")
+
+    def test_unchecked_matches_constructor(self) -> None:
+        ts = datetime(2024, 6, 15, 12, 0, 0)
+        bike = ClassicBike._unchecked("BK017", gear_count=21, status="in_use", created_at=ts)
+        expected = ClassicBike(bike_id="BK017", gear_count=21, status="in_use", created_at=ts)
+        assert type(bike) is ClassicBike
+        assert repr(bike) == repr(expected)
+        assert bike.bike_type == "classic"
+        assert bike.created_at is ts
+
+    def test_unchecked_skips_validation(self) -> None:
+        bike = ClassicBike._unchecked("BK018", gear_count=0)
+        assert bike.gear_count == 0
+        assert isinstance(bike.created_at, datetime)
+        with pytest.raises(AttributeError):
+            bike.colour = "red"  # type: ignore[attr-defined]
+
+    def test_repr_cache_follows_status(self) -> None:
+        bike = ClassicBike(bike_id="BK018")
+        assert repr(bike) is repr(bike)
+        bike.status = "maintenance"
+        assert "maintenance" in repr(bike)
+        assert str(bike) == "ClassicBike(BK018, gears=7)"
+
+    def test_string_cache_follows_plain_fields(self) -> None:
+        bike = ClassicBike(bike_id="BK019")
+        assert str(bike) == "ClassicBike(BK019, gears=7)"
+        bike.gear_count = 21
+        assert str(bike) == "ClassicBike(BK019, gears=21)"
+        assert "gear_count=21" in repr(bike)
+
+    def test_interns_vocabulary_strings(self) -> None:
+        # Built at runtime, as a CSV parser would produce them
+        status = "".join(["in", "_use"])
+        bike = ClassicBike(bike_id="BK017", status=status)
+        assert bike.status is sys.intern("in_use")
+        assert bike.bike_type is sys.intern("classic")
+
+
+# ---------------------------------------------------------------------------
+# User
+# ---------------------------------------------------------------------------
+
+class TestUser:
+    """Tests for the User base class."""
+
+    def test_creation(self) -> None:
+        user = User(user_id="U001", name="Ada", email="ada@example.com", user_type="casual")
+        assert user.email == "ada@example.com"
+
+    def test_rejects_invalid_email(self) -> None:
+        with pytest.raises(ValueError, match="Invalid email address"):
+            User(user_id="U002", name="Bob", email="bob.example.com", user_type="casual")
+
+
+# ---------------------------------------------------------------------------
+# Trip / MaintenanceRecord
+# ---------------------------------------------------------------------------
+
+class TestRecordSlots:
+    """Trip and MaintenanceRecord are slotted: no per-instance __dict__."""
+
+    def setup_method(self) -> None:
+        self.bike = ClassicBike(bike_id="BK020")
+        self.station = Station("ST001", "Central", 10, 48.8, 9.2)
+        self.user = User(user_id="U010", name="Eve", email="eve@example.com", user_type="casual")
+
+    def test_trip_has_no_instance_dict(self) -> None:
+        trip = Trip(
+            "T001", self.user, self.bike, self.station, self.station,
+            datetime(2024, 1, 1, 8, 0), datetime(2024, 1, 1, 8, 45), 3.2,
+        )
+        assert not hasattr(trip, "__dict__")
+        assert trip.duration_minutes == pytest.approx(45.0)
+
+    def test_maintenance_record_has_no_instance_dict(self) -> None:
+        record = MaintenanceRecord("M001", self.bike, datetime(2024, 1, 2), "tire_repair", 12.5)
+        assert not hasattr(record, "__dict__")
+        with pytest.raises(AttributeError):
+            record.notes = "x"  # type: ignore[attr-defined]
+
+
+# ---------------------------------------------------------------------------
+# TripFrame
+# ---------------------------------------------------------------------------
+
+class TestTripFrame:
+    """Tests for the columnar trip table."""
+
+    COLUMNS = {
+        "trip_id": ["T001", "T002"],
+        "user_id": ["U001", "U002"],
+        "bike_id": ["BK001", "BK002"],
+        "start_station_id": ["ST001", "ST002"],
+        "end_station_id": ["ST002", "ST001"],
+        "start_time": ["2024-01-01T08:00", "2024-01-01T09:00"],
+        "end_time": ["2024-01-01T08:30", "2024-01-01T09:06"],
+        "distance_km": [2.5, 1.0],
+    }
+
+    def test_from_columns(self) -> None:
+        frame = TripFrame.from_columns(self.COLUMNS)
+        assert len(frame) == 2
+        assert frame.start_time.dtype == np.dtype("datetime64[ns]")
+        assert frame.distance_km.dtype == np.float32
+        assert frame.duration_minutes.tolist() == pytest.approx([30.0, 6.0])
+
+    def test_from_trips(self) -> None:
+        bike = ClassicBike(bike_id="BK001")
+        station = Station("ST001", "Central", 10, 48.8, 9.2)
+        user = User(user_id="U001", name="Ann", email="ann@example.com", user_type="member")
+        trips = [
+            Trip(f"T{i}", user, bike, station, station,
+                 datetime(2024, 1, 1, 8, 0), datetime(2024, 1, 1, 8, 10 * i), float(i))
+            for i in range(1, 4)
+        ]
+        frame = TripFrame.from_trips(trips)
+        assert frame.trip_id.tolist() == ["T1", "T2", "T3"]
+        assert frame.bike_id.tolist() == ["BK001"] * 3
+        assert frame.duration_minutes.tolist() == pytest.approx([t.duration_minutes for t in trips])
@@ -3,12 +3,23 @@ Unit tests for the numerical module.
 
 Covers:
     - trip_duration_stats (partially implemented — mean, median, std)
+    - station_distance_matrix
+    - histogram
+    - detect_outliers_zscore
+    - calculate_fares
 """
 
 import pytest
 import numpy as np
 
-from numerical import trip_duration_stats
+import numerical
+from numerical import (
+    calculate_fares,
+    detect_outliers_zscore,
+    histogram,
+    station_distance_matrix,
+    trip_duration_stats,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -47,3 +58,143 @@ class TestTripDurationStats:
         stats = trip_duration_stats(durations)
         for val in stats.values():
             assert isinstance(val, float)
+
+    def test_percentiles_match_numpy(self) -> None:
+        durations = np.array([3.0, 41.0, 7.5, 12.0, 29.0, 18.0, 55.0])
+        stats = trip_duration_stats(durations)
+        for key, q in (("p25", 25), ("median", 50), ("p75", 75), ("p90", 90)):
+            assert stats[key] == pytest.approx(np.percentile(durations, q))
+
+    def test_nan_makes_every_stat_nan(self) -> None:
+        stats = trip_duration_stats(np.array([5.0, np.nan, 1.0, 3.0, 2.0]))
+        assert all(np.isnan(val) for val in stats.values())
+
+
+# ---------------------------------------------------------------------------
+# station_distance_matrix
+# ---------------------------------------------------------------------------
+
+class TestStationDistanceMatrix:
+
+    LATS = np.array([48.89, 48.84, 48.80, 48.86])
+    LONS = np.array([9.26, 9.22, 9.18, 9.30])
+
+    def _expected(self) -> np.ndarray:
+        lat = self.LATS[:, None] - self.LATS[None, :]
+        lon = self.LONS[:, None] - self.LONS[None, :]
+        return np.sqrt(lat**2 + lon**2)
+
+    def test_matches_pairwise_formula(self) -> None:
+        result = station_distance_matrix(self.LATS, self.LONS)
+        assert result.shape == (4, 4)
+        assert np.allclose(result, self._expected())
+
+    def test_symmetric_with_zero_diagonal(self) -> None:
+        result = station_distance_matrix(self.LATS, self.LONS)
+        assert np.array_equal(result, result.T)
+        assert np.all(np.diag(result) == 0)
+
+    def test_scipy_path_matches(self, monkeypatch) -> None:
+        monkeypatch.setattr(numerical, "HAS_NUMBA", False)
+        assert np.allclose(station_distance_matrix(self.LATS, self.LONS), self._expected())
+
+    def test_numpy_fallback_matches(self, monkeypatch) -> None:
+        monkeypatch.setattr(numerical, "HAS_NUMBA", False)
+        monkeypatch.setattr(numerical, "HAS_SCIPY", False)
+        assert np.allclose(station_distance_matrix(self.LATS, self.LONS), self._expected())
+
+    @pytest.mark.parametrize("numba, scipy", [(True, True), (False, True), (False, False)])
+    def test_to_km(self, monkeypatch, numba: bool, scipy: bool) -> None:
+        monkeypatch.setattr(numerical, "HAS_NUMBA", numba and numerical.HAS_NUMBA)
+        monkeypatch.setattr(numerical, "HAS_SCIPY", scipy and numerical.HAS_SCIPY)
+        lon_scale = numerical.KM_PER_DEGREE * np.cos(np.radians(self.LATS.mean()))
+        lat = (self.LATS[:, None] - self.LATS[None, :]) * numerical.KM_PER_DEGREE
+        lon = (self.LONS[:, None] - self.LONS[None, :]) * lon_scale
+        result = station_distance_matrix(self.LATS, self.LONS, to_km=True)
+        assert np.allclose(result, np.hypot(lat, lon), rtol=1e-5)
+
+    def test_defaults_to_float32(self) -> None:
+        assert station_distance_matrix(self.LATS, self.LONS).dtype == np.float32
+
+    def test_dtype_parameter(self) -> None:
+        result = station_distance_matrix(self.LATS, self.LONS, dtype=np.float64)
+        assert result.dtype == np.float64
+
+
+# ---------------------------------------------------------------------------
+# histogram
+# ---------------------------------------------------------------------------
+
+class TestHistogram:
+
+    @pytest.mark.parametrize("dtype", [np.float64, np.float32])
+    @pytest.mark.parametrize("bin_range", [None, (0, 50), (7, 7)])
+    def test_matches_numpy(self, dtype, bin_range) -> None:
+        values = np.random.default_rng(0).exponential(20.0, 5000).astype(dtype)
+        counts, edges = histogram(values, bins=30, range=bin_range)
+        expected_counts, expected_edges = np.histogram(values, bins=30, range=bin_range)
+        assert np.array_equal(counts, expected_counts)
+        assert np.array_equal(edges, expected_edges)
+        assert edges.dtype == expected_edges.dtype
+
+    def test_skips_nan_and_out_of_range(self) -> None:
+        counts, _ = histogram(np.array([np.nan, -1.0, 0.0, 0.5, 1.0, 2.0]), bins=2, range=(0, 1))
+        assert counts.tolist() == [1, 2]
+
+    def test_multiple_chunks(self, monkeypatch) -> None:
+        monkeypatch.setattr(numerical, "_HISTOGRAM_CHUNK", 7)
+        values = np.arange(100.0)
+        assert histogram(values, bins=4)[0].tolist() == [25, 25, 25, 25]
+
+    def test_rejects_reversed_range(self) -> None:
+        with pytest.raises(ValueError):
+            histogram(np.ones(3), range=(2, 1))
+
+    @pytest.mark.parametrize("bins", [0, -1])
+    def test_rejects_non_positive_bins(self, bins: int) -> None:
+        with pytest.raises(ValueError):
+            histogram(np.ones(3), bins=bins)
+
+
+# ---------------------------------------------------------------------------
+# detect_outliers_zscore
+# ---------------------------------------------------------------------------
+
+class TestDetectOutliersZscore:
+
+    VALUES = np.array([10.0] * 20 + [11.0] * 20 + [100.0])
+
+    def test_flags_outlier(self) -> None:
+        mask = detect_outliers_zscore(self.VALUES)
+        assert mask.tolist() == [False] * 40 + [True]
+
+    def test_constant_values(self) -> None:
+        assert not detect_outliers_zscore(np.full(5, 7.0)).any()
+
+    def test_numpy_fallback_matches(self, monkeypatch) -> None:
+        expected = detect_outliers_zscore(self.VALUES)
+        monkeypatch.setattr(numerical, "HAS_NUMBA", False)
+        assert np.array_equal(detect_outliers_zscore(self.VALUES), expected)
+
+
+# ---------------------------------------------------------------------------
+# calculate_fares
+# ---------------------------------------------------------------------------
+
+class TestCalculateFares:
+
+    DURATIONS = np.array([10.0, 20.0, 30.0])
+    DISTANCES = np.array([1.0, 2.5, 4.0])
+
+    def test_scalar_rates(self) -> None:
+        fares = calculate_fares(self.DURATIONS, self.DISTANCES, 0.15, 0.10, unlock_fee=1.0)
+        assert np.allclose(fares, [2.6, 4.25, 5.9])
+
+    def test_per_trip_rates(self) -> None:
+        per_minute = np.array([0.15, 0.10, 0.0])
+        fares = calculate_fares(self.DURATIONS, self.DISTANCES, per_minute, 0.0)
+        assert np.allclose(fares, [1.5, 2.0, 0.0])
+
+    def test_dtype_parameter(self) -> None:
+        fares = calculate_fares(self.DURATIONS, self.DISTANCES, 0.15, 0.10, dtype=np.float64)
+        assert fares.dtype == np.float64
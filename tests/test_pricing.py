@@ -3,12 +3,15 @@ Unit tests for the pricing module.
 
 Covers:
     - CasualPricing (fully implemented)
+    - PeakHourPricing
+    - calculate_cost_batch on every strategy
     - PricingStrategy cannot be instantiated directly
 """
 
+import numpy as np
 import pytest
 
-from pricing import PricingStrategy, CasualPricing
+from pricing import PricingStrategy, CasualPricing, MemberPricing, PeakHourPricing
 
 
 # ---------------------------------------------------------------------------
@@ -57,3 +60,51 @@ class TestCasualPricing:
 
     def test_is_pricing_strategy(self) -> None:
         assert isinstance(self.pricing, PricingStrategy)
+
+
+# ---------------------------------------------------------------------------
+# PeakHourPricing
+# ---------------------------------------------------------------------------
+
+class TestPeakHourPricing:
+
+    def setup_method(self) -> None:
+        self.pricing = PeakHourPricing()
+
+    def test_known_trip(self) -> None:
+        # 1.5 x casual: 1.5 * 4.50 = 6.75
+        cost = self.pricing.calculate_cost(20, 5)
+        assert cost == pytest.approx(6.75)
+
+    def test_surcharge_over_casual(self) -> None:
+        casual = CasualPricing().calculate_cost(45, 8)
+        assert self.pricing.calculate_cost(45, 8) == pytest.approx(1.5 * casual)
+
+
+# ---------------------------------------------------------------------------
+# calculate_cost_batch
+# ---------------------------------------------------------------------------
+
+class _FlatPricing(PricingStrategy):
+    """Strategy without a batch override (exercises the default)."""
+
+    def calculate_cost(self, duration_minutes: float, distance_km: float) -> float:
+        return 2.0 + duration_minutes
+
+
+class TestCalculateCostBatch:
+
+    DURATIONS = np.array([0.0, 20.0, 60.0, 7.5])
+    DISTANCES = np.array([0.0, 5.0, 12.0, 1.2])
+
+    @pytest.mark.parametrize(
+        "strategy", [CasualPricing(), MemberPricing(), PeakHourPricing(), _FlatPricing()]
+    )
+    def test_matches_scalar(self, strategy: PricingStrategy) -> None:
+        batch = strategy.calculate_cost_batch(self.DURATIONS, self.DISTANCES)
+        expected = [
+            strategy.calculate_cost(d, km) for d, km in zip(self.DURATIONS, self.DISTANCES)
+        ]
+        assert batch.shape == self.DURATIONS.shape
+        assert batch.dtype == np.float64
+        assert np.allclose(batch, expected)
@@ -14,8 +14,13 @@ from utils import (
     validate_in,
     parse_datetime,
     parse_date,
+    parse_iso_datetime,
     fmt_duration,
     fmt_currency,
+    fmt_duration_batch,
+    fmt_currency_batch,
+    _parse_dt_cached,
+    VALID_BIKE_TYPES,
 )
 
 
@@ -79,6 +84,11 @@ class TestValidateEmail:
         with pytest.raises(ValueError, match="Invalid email"):
             validate_email(123)  # type: ignore[arg-type]
 
+    @pytest.mark.parametrize("email", ["a@", "@example.com", "a@b", "a b@example.com", "a@@b.com"])
+    def test_malformed_raises(self, email: str) -> None:
+        with pytest.raises(ValueError, match="Invalid email"):
+            validate_email(email)
+
 
 # ---------------------------------------------------------------------------
 # validate_in
@@ -93,9 +103,14 @@ class TestValidateIn:
         with pytest.raises(ValueError, match="must be one of"):
             validate_in("x", {"a", "b", "c"}, name="letter")
 
+    def test_frozenset_constant(self) -> None:
+        assert validate_in("electric", VALID_BIKE_TYPES) == "electric"
+        with pytest.raises(ValueError, match=r"\['classic', 'electric'\]"):
+            validate_in("scooter", VALID_BIKE_TYPES, name="bike_type")
+
 
 # ---------------------------------------------------------------------------
-# parse_datetime / parse_date
+# parse_datetime / parse_date / parse_iso_datetime
 # ---------------------------------------------------------------------------
 
 class TestParsing:
@@ -116,6 +131,32 @@ class TestParsing:
         with pytest.raises(ValueError):
             parse_date("June 15, 2024")
 
+    @pytest.mark.parametrize(
+        "text", ["2024-06-15T08:30:00", "2024-06-15 08:30", "2024-06-15 08:30:00+00:00"]
+    )
+    def test_parse_datetime_rejects_other_iso_forms(self, text: str) -> None:
+        with pytest.raises(ValueError):
+            parse_datetime(text)
+
+    @pytest.mark.parametrize("text", ["20240615", "2024-W24-6", "2024-06-15 00:00:00"])
+    def test_parse_date_rejects_other_iso_forms(self, text: str) -> None:
+        with pytest.raises(ValueError):
+            parse_date(text)
+
+    @pytest.mark.parametrize("text", ["2024-06-15T08:30:00", "2024-06-15 08:30:00"])
+    def test_parse_iso_datetime(self, text: str) -> None:
+        assert parse_iso_datetime(text) == datetime(2024, 6, 15, 8, 30, 0)
+
+    def test_parse_iso_datetime_invalid(self) -> None:
+        with pytest.raises(ValueError):
+            parse_iso_datetime("15/06/2024 08:30")
+
+    def test_repeated_strings_hit_cache(self) -> None:
+        _parse_dt_cached.cache_clear()
+        first = parse_datetime("2024-06-15 08:30:00")
+        assert parse_datetime("2024-06-15 08:30:00") is first
+        assert _parse_dt_cached.cache_info().hits == 1
+
 
 # ---------------------------------------------------------------------------
 # fmt_duration
@@ -150,3 +191,18 @@ class TestFmtCurrency:
 
     def test_large_amount(self) -> None:
         assert fmt_currency(1234.567) == "€1234.57"
+
+
+# ---------------------------------------------------------------------------
+# fmt_duration_batch / fmt_currency_batch
+# ---------------------------------------------------------------------------
+
+class TestFmtBatch:
+
+    def test_duration_matches_scalar(self) -> None:
+        values = [120, 95.5, 45, 0, 59.99, 1441]
+        assert fmt_duration_batch(values).tolist() == [fmt_duration(v) for v in values]
+
+    def test_currency_matches_scalar(self) -> None:
+        values = [9.5, 0, 1234.567, 0.125]
+        assert fmt_currency_batch(values).tolist() == [fmt_currency(v) for v in values]
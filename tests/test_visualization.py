@@ -0,0 +1,178 @@
+"""
+Unit tests for the visualization module.
+
+Covers:
+    - _box_stats against matplotlib.cbook.boxplot_stats
+    - _prepare_trips
+    - plot_trips_per_station labels
+    - _PNGWriter and plot_all (inline and background writes)
+    - _plot_in_worker with the column subsets plot_all_parallel sends
+    - report_saved
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from matplotlib import cbook
+from PIL import Image
+
+import visualization
+from visualization import _box_stats, _PNGWriter, _plot_in_worker, _prepare_trips
+
+CHART_FILES = {
+    "trips_per_station.png",
+    "monthly_trend.png",
+    "duration_histogram.png",
+    "duration_by_user_type.png",
+    "distance_histogram.png",
+    "avg_duration_by_hour.png",
+    "user_type_share.png",
+    "maintenance_cost_by_bike_type.png",
+    "all_routes_heatmap.png",
+}
+
+
+@pytest.fixture
+def figures_dir(tmp_path, monkeypatch):
+    """Send every chart to a temp dir at a small DPI, with a clean save log."""
+    monkeypatch.setattr(visualization, "_figures_dir", lambda: tmp_path)
+    monkeypatch.setattr(visualization, "_dpi", 30)
+    monkeypatch.setattr(visualization, "_saved", [])
+    return tmp_path
+
+
+@pytest.fixture
+def tables() -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Small raw trips, stations and maintenance tables."""
+    rng = np.random.default_rng(0)
+    n = 60
+    trips = pd.DataFrame({
+        "start_station_id": rng.choice(["ST1", "ST2", "ST3"], n),
+        "end_station_id": rng.choice(["ST1", "ST2", "ST3"], n),
+        "start_time": pd.date_range("2024-01-01 06:00", periods=n, freq="37h").astype(str),
+        "duration_minutes": rng.gamma(2.0, 10.0, n),
+        "distance_km": rng.gamma(2.0, 2.0, n),
+        "user_type": rng.choice(["member", "casual"], n),
+    })
+    stations = pd.DataFrame({"station_id": ["ST1", "ST2", "ST3"], "station_name": ["A", "B", "C"]})
+    maintenance = pd.DataFrame({"bike_type": ["classic", "electric", "classic"], "cost": [10.0, 50.0, 5.5]})
+    return trips, stations, maintenance
+
+
+# ---------------------------------------------------------------------------
+# _box_stats
+# ---------------------------------------------------------------------------
+
+class TestBoxStats:
+
+    KEYS = ("q1", "med", "q3", "whislo", "whishi")
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 4, 7, 50, 501])
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_matches_cbook(self, size: int, seed: int) -> None:
+        rng = np.random.default_rng(seed)
+        # Heavy tails on both sides so most samples have fliers at either
+        # end; rounding adds ties
+        values = np.round(20.0 + 5.0 * rng.standard_t(2, size), 1)
+        stats = _box_stats(values.copy(), "Member")
+        expected = cbook.boxplot_stats(values, labels=["Member"])[0]
+        assert stats["label"] == "Member"
+        for key in self.KEYS:
+            assert stats[key] == pytest.approx(expected[key]), key
+        assert sorted(stats["fliers"].tolist()) == sorted(expected["fliers"].tolist())
+
+    def test_constant_values(self) -> None:
+        stats = _box_stats(np.full(5, 3.0), "Casual")
+        assert (stats["q1"], stats["med"], stats["q3"]) == (3.0, 3.0, 3.0)
+        assert (stats["whislo"], stats["whishi"]) == (3.0, 3.0)
+        assert stats["fliers"].size == 0
+
+
+# ---------------------------------------------------------------------------
+# _prepare_trips
+# ---------------------------------------------------------------------------
+
+class TestPrepareTrips:
+
+    def test_derives_columns_without_mutating(self, tables) -> None:
+        trips, _, _ = tables
+        original = trips.copy()
+        prepared = _prepare_trips(trips)
+        pd.testing.assert_frame_equal(trips, original)
+        assert pd.api.types.is_datetime64_any_dtype(prepared["start_time"])
+        assert prepared["hour"].tolist() == prepared["start_time"].dt.hour.tolist()
+        assert prepared["duration_minutes"].dtype == np.float32
+        assert isinstance(prepared["start_station_id"].dtype, pd.CategoricalDtype)
+
+    def test_prepared_frame_is_returned_as_is(self, tables) -> None:
+        prepared = _prepare_trips(tables[0])
+        assert _prepare_trips(prepared) is prepared
+
+    def test_unparseable_times_become_nat(self) -> None:
+        prepared = _prepare_trips(pd.DataFrame({"start_time": ["2024-01-01 08:00:00", "soon"]}))
+        assert prepared["start_time"].isna().tolist() == [False, True]
+
+
+# ---------------------------------------------------------------------------
+# Charts
+# ---------------------------------------------------------------------------
+
+class TestPlotTripsPerStation:
+
+    def test_labels_with_integer_station_ids(self, figures_dir, monkeypatch) -> None:
+        saved = []
+        monkeypatch.setattr(visualization, "_save_figure", lambda fig, name, writer=None: saved.append(fig))
+        trips = pd.DataFrame({"start_station_id": [1, 2, 2]})
+        stations = pd.DataFrame({"station_id": [1, 2], "station_name": ["A", "B"]})
+        visualization.plot_trips_per_station(trips, stations)
+        labels = [label.get_text() for label in saved[0].axes[0].get_yticklabels()]
+        assert labels == ["B", "A"]
+
+
+class TestPNGWriter:
+
+    def test_writes_in_background(self, tmp_path) -> None:
+        image = Image.new("RGB", (4, 3), "red")
+        with _PNGWriter() as writer:
+            writer.submit(image, tmp_path / "a.png")
+        with Image.open(tmp_path / "a.png") as written:
+            assert written.size == (4, 3)
+
+    def test_reraises_write_errors(self, tmp_path) -> None:
+        with pytest.raises(FileNotFoundError):
+            with _PNGWriter() as writer:
+                writer.submit(Image.new("RGB", (1, 1)), tmp_path / "missing" / "a.png")
+
+
+class TestPlotAll:
+
+    @pytest.mark.parametrize("cores", [1, 4])
+    def test_saves_every_chart(self, figures_dir, tables, monkeypatch, cores: int) -> None:
+        monkeypatch.setattr(visualization.os, "cpu_count", lambda: cores)
+        visualization.plot_all(*tables)
+        assert {path.name for path in figures_dir.iterdir()} == CHART_FILES
+        assert {path.name for path in visualization._saved} == CHART_FILES
+        assert visualization._GROUP_CACHE is None
+
+    def test_report_saved_prints_once_and_clears(self, figures_dir, tables, capsys) -> None:
+        visualization.plot_all(*tables)
+        visualization.report_saved()
+        lines = capsys.readouterr().out.splitlines()
+        assert len(lines) == len(CHART_FILES)
+        assert all(line.startswith("Saved: ") for line in lines)
+        assert visualization._saved == []
+
+
+class TestPlotInWorker:
+
+    @pytest.mark.parametrize("name", list(visualization._PLOTS))
+    def test_renders_from_declared_columns(self, figures_dir, tables, name: str) -> None:
+        # The same column subsets plot_all_parallel pickles for each chart
+        trips, stations, maintenance = tables
+        sources = {"trips": _prepare_trips(trips), "stations": stations, "maintenance": maintenance}
+        _, spec = visualization._PLOTS[name]
+        subsets = [sources[table][list(columns)] for table, columns in spec.items()]
+        saved = _plot_in_worker(name, 30, *subsets)
+        assert len(saved) == 1
+        assert saved[0].exists()
+        assert visualization._saved == []
@@ -5,10 +5,15 @@ Provides validation, date parsing, and formatting functions.
 Keep I/O-free — these are pure helper functions.
 """
 
+import math
 import re
+from collections.abc import Collection
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
+import numpy as np
+
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -17,16 +22,20 @@ from typing import Any
 DATE_FORMAT = "%Y-%m-%d"
 DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 
-VALID_BIKE_TYPES = {"classic", "electric"}
-VALID_USER_TYPES = {"casual", "member"}
-VALID_TRIP_STATUSES = {"completed", "cancelled"}
-VALID_MAINTENANCE_TYPES = {
+# local@domain.tld with no whitespace or extra '@'; compiled once at import.
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+# Immutable so callers cannot alter the vocabularies by accident.
+VALID_BIKE_TYPES = frozenset({"classic", "electric"})
+VALID_USER_TYPES = frozenset({"casual", "member"})
+VALID_TRIP_STATUSES = frozenset({"completed", "cancelled"})
+VALID_MAINTENANCE_TYPES = frozenset({
     "tire_repair",
     "brake_adjustment",
     "battery_replacement",
     "chain_lubrication",
     "general_inspection",
-}
+})
 
 
 # ---------------------------------------------------------------------------
@@ -59,34 +68,71 @@ def validate_non_negative(value: float, name: str = "value") -> float:
 
 
 def validate_email(email: str) -> str:
-    """Basic email validation — checks for presence of '@'.
+    """Email validation — requires ``local@domain.tld`` with no spaces.
 
-    TODO (optional): make the regex stricter.
+    Non-strings are rejected by an exact type check before the
+    precompiled regex runs.
     """
-    if not isinstance(email, str) or "@" not in email:
+    if type(email) is not str or not _EMAIL_RE.fullmatch(email):
         raise ValueError(f"Invalid email: {email!r}")
     return email
 
 
-def validate_in(value: Any, allowed: set, name: str = "value") -> Any:
-    """Ensure *value* is in the *allowed* set."""
-    if value not in allowed:
-        raise ValueError(f"{name} must be one of {allowed}, got {value!r}")
-    return value
+def validate_in(value: Any, allowed: Collection, name: str = "value") -> Any:
+    """Ensure *value* is in the *allowed* set (or frozenset)."""
+    if value in allowed:
+        return value
+    raise ValueError(f"{name} must be one of {sorted(allowed)}, got {value!r}")
 
 
 # ---------------------------------------------------------------------------
 # Parsing helpers
 # ---------------------------------------------------------------------------
 
+# Trip and maintenance data repeat the same timestamps (shared start-of-hour
+# stamps, maintenance dates), so each parser memoizes on the raw string;
+# a hit is a dict lookup instead of a parse. datetimes are immutable, so
+# sharing the cached objects is safe. Tests can call ``.cache_clear()``.
+
+# Parsing goes through the C ``datetime.fromisoformat`` rather than
+# ``strptime``'s Python format interpreter. fromisoformat also accepts
+# other ISO 8601 spellings ('T' separator, week dates, offsets), so the
+# result must round-trip to the input to match the exact format.
+
+@lru_cache(maxsize=1 << 16)
+def _parse_dt_cached(text: str) -> datetime:
+    dt = datetime.fromisoformat(text)
+    if dt.tzinfo is not None or dt.isoformat(" ") != text:
+        raise ValueError(f"time data {text!r} does not match format {DATETIME_FORMAT!r}")
+    return dt
+
+
+@lru_cache(maxsize=1 << 16)
+def _parse_d_cached(text: str) -> datetime:
+    dt = datetime.fromisoformat(text)
+    if dt.date().isoformat() != text:
+        raise ValueError(f"time data {text!r} does not match format {DATE_FORMAT!r}")
+    return dt
+
+
+@lru_cache(maxsize=1 << 16)
+def _parse_iso_cached(text: str) -> datetime:
+    return datetime.fromisoformat(text)
+
+
 def parse_datetime(text: str) -> datetime:
     """Parse a datetime string in YYYY-MM-DD HH:MM:SS format."""
-    return datetime.strptime(text, DATETIME_FORMAT)
+    return _parse_dt_cached(text)
 
 
 def parse_date(text: str) -> datetime:
     """Parse a date string in YYYY-MM-DD format."""
-    return datetime.strptime(text, DATE_FORMAT)
+    return _parse_d_cached(text)
+
+
+def parse_iso_datetime(text: str) -> datetime:
+    """Parse any ISO 8601 string ``datetime.fromisoformat`` accepts."""
+    return _parse_iso_cached(text)
 
 
 # ---------------------------------------------------------------------------
@@ -100,8 +146,7 @@ def fmt_duration(minutes: float) -> str:
         >>> fmt_duration(95.5)
         '1h 35m'
     """
-    h = int(minutes // 60)
-    m = int(minutes % 60)
+    h, m = divmod(math.floor(minutes), 60)
     return f"{h}h {m}m"
 
 
@@ -113,3 +158,29 @@ def fmt_currency(amount: float) -> str:
         '€9.50'
     """
     return f"€{amount:.2f}"
+
+
+def fmt_duration_batch(minutes: np.ndarray) -> np.ndarray:
+    """Vectorized ``fmt_duration`` over an array (or Series) of minutes.
+
+    Hours and minutes come from one ``np.divmod`` over int64 and the
+    labels are assembled with NumPy string ops, with no Python call per
+    value.
+
+    Example:
+        >>> fmt_duration_batch([95.5, 45]).tolist()
+        ['1h 35m', '0h 45m']
+    """
+    whole = np.floor(np.asarray(minutes, dtype=np.float64)).astype(np.int64)
+    h, m = np.divmod(whole, 60)
+    return np.char.add(np.char.add(h.astype(str), "h "), np.char.add(m.astype(str), "m"))
+
+
+def fmt_currency_batch(amounts: np.ndarray) -> np.ndarray:
+    """Vectorized ``fmt_currency`` over an array (or Series) of amounts.
+
+    Example:
+        >>> fmt_currency_batch([9.5, 0]).tolist()
+        ['€9.50', '€0.00']
+    """
+    return np.char.mod("€%.2f", np.asarray(amounts, dtype=np.float64))
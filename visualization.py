@@ -1,5 +1,5 @@
 """
-Matplotlib and Seaborn visualizations for the CityBike platform.
+Matplotlib visualizations for the CityBike platform.
 
 Creates:
     1. Bar chart — trips per station
@@ -15,63 +15,304 @@ Creates:
 Exports PNG files to output/figures/.
 """
 
-import matplotlib.pyplot as plt
+import contextlib
+import functools
+import math
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+
+import matplotlib
+
+# Charts are only ever written to PNG. Pin the headless Agg backend:
+# otherwise the first full read of rcParams (Axes.bxp does one) resolves
+# the "auto" backend by importing pyplot and probing for a GUI toolkit.
+matplotlib.use("Agg")
+
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+import numpy as np
 import pandas as pd
 from pathlib import Path
-import seaborn as sns
+from PIL import Image
+
+from compat import HAS_SCIPY, coo_matrix
+from numerical import histogram
 
 FIGURES_DIR = Path(__file__).resolve().parent / "output" / "figures"
+DPI = 150
+
+# Resolution of quick-look renders (plot_all(preview=True)): Agg
+# rasterization and PNG encoding both scale with the pixel count, and
+# 100 DPI pushes 2.25x fewer pixels than DPI.
+PREVIEW_DPI = 100
+
+# Resolution of the charts being rendered; set by plot_all(preview=...).
+_dpi = DPI
+
+# Heatmaps with more stations than this are drawn without cell labels.
+HEATMAP_ANNOTATE_MAX_STATIONS = 30
+
+# Split long paths into chunks so Agg never rasterizes one huge path.
+matplotlib.rcParams["agg.path.chunksize"] = 10000
+
+# Trip measures narrowed to float32 by _prepare_trips before plotting.
+_FLOAT32_COLUMNS = ("duration_minutes", "distance_km")
+
+# Station keys dictionary-encoded by _prepare_trips, so per-station counts
+# run over small integer codes.
+_CATEGORY_COLUMNS = ("start_station_id", "end_station_id")
+
+# Reusable figures by figsize, see _get_figure().
+_FIGURE_CACHE: dict[tuple[float, float], Figure] = {}
+
+# Per-key group statistics shared by the charts of one plot_all() run;
+# None outside of it. Values keep their DataFrame alive, so the id() in
+# the key cannot be reused by another frame while cached.
+_GROUP_CACHE: dict[tuple[int, int, str], tuple[pd.DataFrame, pd.DataFrame]] | None = None
+
+# Files written by _save_figure since the last report_saved().
+_saved: list[Path] = []
 
-def _save_figure(fig: plt.Figure, filename: str) -> None:
+def _get_figure(figsize: tuple[float, float]) -> tuple[Figure, Axes]:
+    """Return a cleared constrained-layout figure of *figsize* and a new Axes.
+
+    One figure per size is kept and reused by later charts, so a report
+    pays for each Agg canvas and its pixel buffer once. The figures are
+    created outside pyplot and never registered with its figure manager;
+    the module does not import pyplot at all, so no GUI backend is probed.
+    """
+    fig = _FIGURE_CACHE.get(figsize)
+    if fig is None:
+        fig = _FIGURE_CACHE[figsize] = Figure(figsize=figsize, layout="constrained")
+        FigureCanvasAgg(fig)
+    else:
+        fig.clear()
+    return fig, fig.add_subplot()
+
+
+@functools.cache
+def _figures_dir() -> Path:
+    """Create ``FIGURES_DIR`` on the first save only; later saves skip the mkdir."""
     FIGURES_DIR.mkdir(parents=True, exist_ok=True)
-    filepath = FIGURES_DIR / filename
-    fig.savefig(filepath, dpi=150, bbox_inches="tight")
-    plt.close(fig)
-    print(f"Saved: {filepath}")
+    return FIGURES_DIR
+
+
+def _write_png(image: Image.Image, filepath: Path) -> None:
+    image.save(filepath, "PNG", compress_level=1, optimize=False)
+
+
+class _PNGWriter:
+    """Encodes PNG files on one background thread.
+
+    Pillow releases the GIL while it deflates, so a chart's Agg draw runs
+    alongside the previous chart's encode on another core. Leaving the
+    ``with`` block waits for every pending write and re-raises failures.
+    """
+
+    def __init__(self) -> None:
+        self._pool = ThreadPoolExecutor(max_workers=1)
+        self._writes: list[Future] = []
+
+    def submit(self, image: Image.Image, filepath: Path) -> None:
+        self._writes.append(self._pool.submit(_write_png, image, filepath))
+
+    def __enter__(self) -> "_PNGWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._pool.shutdown()
+        if exc_type is None:
+            for write in self._writes:
+                write.result()
+
+
+def _save_figure(fig: Figure, filename: str, writer: _PNGWriter | None = None) -> None:
+    """Draw *fig* and write it to ``FIGURES_DIR``, through *writer* if given."""
+    filepath = _figures_dir() / filename
+    # Render once on the Agg canvas and hand the raw RGBA buffer to Pillow:
+    # PNG encoding is dominated by DEFLATE, and compress_level=1 trades a
+    # somewhat larger file for far less CPU than savefig's default level.
+    # Figures use the constrained layout, so no bbox_inches="tight" pass.
+    fig.set_dpi(_dpi)
+    fig.canvas.draw()
+    image = Image.frombuffer("RGBA", fig.canvas.get_width_height(), fig.canvas.buffer_rgba())
+    # On an opaque figure background every pixel's alpha is 255: dropping
+    # the channel leaves a quarter less data for DEFLATE to compress.
+    if fig.get_facecolor()[3] == 1.0:
+        image = image.convert("RGB")
+    else:
+        image = image.copy()  # detach from the canvas, which may be reused
+    if writer is None:
+        _write_png(image, filepath)
+    else:
+        writer.submit(image, filepath)
+    _saved.append(filepath)
+
+
+def report_saved() -> None:
+    """Print every chart saved since the last call, in one write."""
+    if _saved:
+        print("\n".join(f"Saved: {path}" for path in _saved))
+        _saved.clear()
+
+
+def _prepare_trips(trips: pd.DataFrame) -> pd.DataFrame:
+    """Return *trips* with a parsed ``start_time`` and an ``hour`` column.
+
+    Float64 measure columns (``_FLOAT32_COLUMNS``) are narrowed to float32,
+    halving the bytes the histograms and group means read; durations and
+    distances need nowhere near float64 precision for a chart.
+    Station id columns (``_CATEGORY_COLUMNS``) become categoricals.
+
+    The derived columns go on a new frame, so the caller's DataFrame is
+    never modified. A frame that is already prepared (e.g. by ``plot_all``)
+    is returned as is, so the conversion happens once per rendering; to
+    render charts one by one, prepare the table once and pass the result.
+    """
+    derived = {
+        column: trips[column].astype("category")
+        for column in _CATEGORY_COLUMNS
+        if column in trips.columns and not isinstance(trips[column].dtype, pd.CategoricalDtype)
+    }
+    if "start_time" in trips.columns:
+        start = trips["start_time"]
+        is_parsed = pd.api.types.is_datetime64_any_dtype(start)
+        if not (is_parsed and "hour" in trips.columns):
+            if not is_parsed:
+                start = pd.to_datetime(start, format="ISO8601", errors="coerce", cache=True)
+            # Cleaned trips (BikeShareSystem.clean_data) already carry the hour
+            derived["start_time"] = start
+            derived["hour"] = (
+                trips["start_hour"] if is_parsed and "start_hour" in trips.columns else start.dt.hour
+            )
+    for column in _FLOAT32_COLUMNS:
+        if column in trips.columns and trips[column].dtype == np.float64:
+            derived[column] = trips[column].astype(np.float32)
+    return trips.assign(**derived) if derived else trips
+
+
+def _group_stats(df: pd.DataFrame, key: str) -> pd.DataFrame:
+    """Trip count and mean duration per *key*, from a single groupby.
+
+    Inside ``plot_all`` the result is cached, so charts grouping by the
+    same key share one pass over the table.
+    """
+    cache_key = (id(df), len(df), key)
+    if _GROUP_CACHE is not None and cache_key in _GROUP_CACHE:
+        return _GROUP_CACHE[cache_key][1]
+
+    aggregations = {"trips": (key, "size")}
+    if "duration_minutes" in df.columns:
+        aggregations["mean_duration"] = ("duration_minutes", "mean")
+    stats = df.groupby(key, observed=True).agg(**aggregations)
+    if _GROUP_CACHE is not None:
+        _GROUP_CACHE[cache_key] = (df, stats)
+    return stats
+
+
+def plot_all(
+    trips: pd.DataFrame,
+    stations: pd.DataFrame,
+    maintenance: pd.DataFrame,
+    preview: bool = False,
+) -> None:
+    """Render every chart, preparing the trips table only once.
+
+    Charts are saved at ``DPI``, or at ``PREVIEW_DPI`` with *preview*.
+    On multi-core machines PNG files are encoded on a background thread
+    while later charts draw; all of them are written when this returns.
+    """
+    global _GROUP_CACHE, _dpi
+    df = _prepare_trips(trips)
+    _GROUP_CACHE = {}
+    _dpi = PREVIEW_DPI if preview else DPI
+    # With one core the thread only adds switching overhead.
+    background = _PNGWriter() if (os.cpu_count() or 1) > 1 else contextlib.nullcontext()
+    try:
+        with background as writer:
+            plot_trips_per_station(df, stations, writer=writer)
+            plot_monthly_trend(df, writer=writer)
+            plot_duration_histogram(df, writer=writer)
+            plot_duration_by_user_type(df, writer=writer)
+            plot_distance_histogram(df, writer=writer)
+            plot_avg_duration_by_hour(df, writer=writer)
+            plot_user_type_share(df, writer=writer)
+            plot_maintenance_cost_by_bike_type(maintenance, writer=writer)
+            plot_top_routes_heatmap(df, writer=writer)
+    finally:
+        _GROUP_CACHE = None
+        _dpi = DPI
+
 
 
 # ---------------------------------------------------------------------------
 # 1. Bar chart — trips per station
 # ---------------------------------------------------------------------------
-def plot_trips_per_station(trips: pd.DataFrame, stations: pd.DataFrame) -> None:
+def plot_trips_per_station(
+    trips: pd.DataFrame, stations: pd.DataFrame, writer: _PNGWriter | None = None
+) -> None:
     if trips.empty or stations.empty or "start_station_id" not in trips.columns:
         return
     
-    counts = trips["start_station_id"].value_counts().head(10).rename_axis("station_id").reset_index(name="trip_count")
-    merged = counts.merge(stations[["station_id", "station_name"]], on="station_id", how="left")
-    merged["station_name"] = merged["station_name"].fillna("Unknown")
-
-    fig, ax = plt.subplots(figsize=(10, 6))
-    bars = ax.barh(merged["station_name"], merged["trip_count"], color="steelblue", edgecolor="navy", linewidth=1.2)
+    # Count over the categorical codes with one bincount, then pick the top
+    # ten with argpartition instead of sorting every station's count. Ties
+    # keep category order. The ten names are plain dict lookups.
+    station_ids = trips["start_station_id"]
+    if not isinstance(station_ids.dtype, pd.CategoricalDtype):
+        station_ids = station_ids.astype("category")
+    codes = station_ids.cat.codes.to_numpy()
+    station_counts = np.bincount(codes[codes >= 0], minlength=len(station_ids.cat.categories))
+    top = np.flatnonzero(station_counts)
+    if top.size > 10:
+        top = top[np.argpartition(-station_counts[top], 9)[:10]]
+    top = top[np.lexsort((top, -station_counts[top]))]
+    counts = station_counts[top]
+    name_map = dict(zip(stations["station_id"].to_numpy(), stations["station_name"].to_numpy()))
+    names = [
+        name_map.get(station_id, "Unknown")
+        for station_id in station_ids.cat.categories[top]
+    ]
+
+    fig, ax = _get_figure((10, 6))
+    ax.barh(names, counts, color="steelblue", edgecolor="navy", linewidth=1.2)
     ax.set_xlabel("Number of Trips", fontweight="bold")
     ax.set_ylabel("Station", fontweight="bold")
     ax.set_title("Top 10 Start Stations by Trip Count", fontweight="bold", pad=15)
     ax.invert_yaxis()
     ax.grid(axis="x", alpha=0.3, linestyle="--")
 
-    for i, (bar, value) in enumerate(zip(bars, merged["trip_count"])):
-        ax.text(value + 1, i, str(int(value)), va="center", fontsize=9)
+    for i, value in enumerate(counts.tolist()):
+        ax.text(value + 1, i, str(value), va="center", fontsize=9)
 
-    _save_figure(fig, "trips_per_station.png")
+    _save_figure(fig, "trips_per_station.png", writer)
 
 
 # ---------------------------------------------------------------------------
 # 2. Line chart — monthly trip trend
 # ---------------------------------------------------------------------------
-def plot_monthly_trend(trips: pd.DataFrame) -> None:
+def plot_monthly_trend(trips: pd.DataFrame, writer: _PNGWriter | None = None) -> None:
     if trips.empty or "start_time" not in trips.columns:
         return
     
-    if not pd.api.types.is_datetime64_any_dtype(trips["start_time"]):
-        trips["start_time"] = pd.to_datetime(trips["start_time"], errors="coerce")
-    
-    monthly = trips.set_index("start_time").resample("ME").size()
-    if monthly.empty:
+    # Months as int64 counts since the epoch (a datetime64[M] cast), then
+    # one bincount from the first month: no Period objects, and months
+    # without trips come out as 0.
+    stamps = _prepare_trips(trips)["start_time"].to_numpy()
+    stamps = stamps[~np.isnat(stamps)]
+    if stamps.size == 0:
         return
-
-    fig, ax = plt.subplots(figsize=(11, 6))
-    ax.plot(monthly.index, monthly.values, marker="o", linewidth=2.5, markersize=8, color="#2E86AB", label="Monthly Trips")
-    ax.fill_between(monthly.index, monthly.values, alpha=0.2, color="#2E86AB")
+    month_keys = stamps.astype("datetime64[M]").astype(np.int64)
+    first = month_keys.min()
+    values = np.bincount(month_keys - first)
+    months = np.arange(first, first + values.size).astype("datetime64[M]").astype("datetime64[D]")
+
+    # One Line2D is one path, and Agg stamps its markers from a single
+    # rasterized glyph, so the line stays cheap even at daily granularity.
+    fig, ax = _get_figure((11, 6))
+    ax.plot(months, values, marker="o", linewidth=2.5, markersize=8, color="#2E86AB", label="Monthly Trips")
+    ax.fill_between(months, values, alpha=0.2, color="#2E86AB")
     ax.set_title("Monthly Trip Trend", fontweight="bold", pad=15)
     ax.set_xlabel("Month", fontweight="bold")
     ax.set_ylabel("Number of Trips", fontweight="bold")
@@ -79,137 +320,200 @@ def plot_monthly_trend(trips: pd.DataFrame) -> None:
     ax.grid(True, alpha=0.3, linestyle="--")
     fig.autofmt_xdate(rotation=45)
 
-    _save_figure(fig, "monthly_trend.png")
+    _save_figure(fig, "monthly_trend.png", writer)
 
 
 # ---------------------------------------------------------------------------
 # 3. Histogram — trip duration distribution
 # ---------------------------------------------------------------------------
-def plot_duration_histogram(trips: pd.DataFrame) -> None:
+def plot_duration_histogram(trips: pd.DataFrame, writer: _PNGWriter | None = None) -> None:
     if trips.empty or "duration_minutes" not in trips.columns:
         return
 
-    durations = trips["duration_minutes"].dropna()
-    if durations.empty:
+    # Work on the one column as a bare float32 array (no copy when it is
+    # already float32), finite values only
+    values = trips["duration_minutes"].to_numpy(dtype=np.float32, na_value=np.nan)
+    values = values[np.isfinite(values)]
+    if values.size == 0:
         return
 
-    fig, ax = plt.subplots(figsize=(9, 6))
-    n, bins, patches = ax.hist(durations, bins=30, alpha=0.75, edgecolor="black", color="#A23B72")
-    
-    # Gradient colors
-    cm = plt.cm.RdYlGn
+    # Bin 0..p99 so a handful of very long trips do not squash the bulk of
+    # the distribution into the first bars; the stats use every trip.
+    median, p99 = np.quantile(values, [0.5, 0.99]).tolist()
+
+    fig, ax = _get_figure((9, 6))
+    # Bin in one compiled pass (numerical.histogram) and draw every bar in
+    # one call with its gradient colour, instead of styling patches.
+    counts, bins = histogram(values, bins=30, range=(0.0, max(p99, 0.0)))
     bin_centers = 0.5 * (bins[:-1] + bins[1:])
-    col = (bin_centers - min(bin_centers)) / (max(bin_centers) - min(bin_centers))
-    for c, p in zip(col, patches):
-        plt.setp(p, 'facecolor', cm(c))
+    span = np.ptp(bin_centers) or 1.0
+    colors = matplotlib.colormaps["RdYlGn"]((bin_centers - bin_centers.min()) / span)
+    ax.bar(bins[:-1], counts, width=np.diff(bins), align="edge",
+           color=colors, alpha=0.75, edgecolor="black")
 
     ax.set_title("Trip Duration Distribution", fontweight="bold", pad=15)
     ax.set_xlabel("Duration (minutes)", fontweight="bold")
     ax.set_ylabel("Frequency", fontweight="bold")
     ax.grid(axis="y", alpha=0.3, linestyle="--")
 
-    stats_text = f"Mean: {durations.mean():.1f} min\nMedian: {durations.median():.1f} min\nStd: {durations.std():.1f} min"
+    stats_text = (
+        f"Mean: {values.mean(dtype=np.float64):.1f} min\nMedian: {median:.1f} min\n"
+        f"Std: {values.std(ddof=1, dtype=np.float64):.1f} min\nP99: {p99:.1f} min"
+    )
     ax.text(0.98, 0.97, stats_text, transform=ax.transAxes, fontsize=9,
             verticalalignment='top', horizontalalignment='right',
             bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
 
-    _save_figure(fig, "duration_histogram.png")
+    _save_figure(fig, "duration_histogram.png", writer)
 
 
 # ---------------------------------------------------------------------------
 # 4. Box plot — duration by user type
 # ---------------------------------------------------------------------------
-def plot_duration_by_user_type(trips: pd.DataFrame) -> None:
+_BOXPROPS = {"facecolor": "#FFB6C1", "alpha": 0.7}
+_MEDIANPROPS = {"color": "red", "linewidth": 2}
+
+
+def _box_stats(values: np.ndarray, label: str) -> dict:
+    """Box statistics of one group, as ``matplotlib.cbook.boxplot_stats``.
+
+    Quartiles, Tukey whiskers (the furthest values within 1.5 IQR of the
+    box, never inside it) and the fliers beyond them, ready for ``ax.bxp``.
+
+    One ``np.partition`` places the order statistics the three quartiles
+    interpolate between (np.quantile's linear method). Everything below
+    the first quartile then sits before it and everything above the third
+    after it, so the whisker and flier scans only read those two tails.
+    """
+    last = values.size - 1
+    positions = [q * last for q in (0.25, 0.5, 0.75)]
+    kth = sorted({k for pos in positions for k in (math.floor(pos), math.ceil(pos))})
+    part = np.partition(values, kth)
+    q1, med, q3 = (
+        part[math.floor(pos)] + (part[math.ceil(pos)] - part[math.floor(pos)]) * (pos - math.floor(pos))
+        for pos in positions
+    )
+    iqr = q3 - q1
+    low = part[:math.floor(positions[0]) + 1]
+    high = part[math.ceil(positions[2]):]
+    whislo = low[low >= q1 - 1.5 * iqr].min(initial=q1)
+    whishi = high[high <= q3 + 1.5 * iqr].max(initial=q3)
+    fliers = np.concatenate((low[low < whislo], high[high > whishi]))
+    return {"label": label, "q1": q1, "med": med, "q3": q3,
+            "whislo": whislo, "whishi": whishi, "fliers": fliers}
+
+
+def plot_duration_by_user_type(trips: pd.DataFrame, writer: _PNGWriter | None = None) -> None:
     if trips.empty or "user_type" not in trips.columns or "duration_minutes" not in trips.columns:
         return
 
-    trips_clean = trips[trips["duration_minutes"].notna()].copy()
-    grouped = trips_clean.groupby("user_type")["duration_minutes"]
-    data = [group.values for _, group in grouped]
-    labels = [name.capitalize() for name, _ in grouped]
-
-    fig, ax = plt.subplots(figsize=(9, 6))
-    bp = ax.boxplot(data, labels=labels, patch_artist=True, widths=0.6,
-                    boxprops=dict(facecolor='#FFB6C1', alpha=0.7),
-                    medianprops=dict(color='red', linewidth=2))
+    # Sort the durations by user-type code once; each group is then a
+    # contiguous slice whose bounds come from one searchsorted. The means
+    # are one np.add.reduceat over the slices, and the box statistics are
+    # computed slice by slice in NumPy.
+    codes, keys = pd.factorize(trips["user_type"], sort=True)
+    durations = trips["duration_minutes"].to_numpy(dtype=np.float32, na_value=np.nan)
+    valid = (codes >= 0) & np.isfinite(durations)
+    codes = codes[valid]
+    order = np.argsort(codes, kind="stable")
+    durations = durations[valid][order]
+    bounds = np.searchsorted(codes[order], np.arange(len(keys) + 1))
+    present = np.flatnonzero(np.diff(bounds))
+    if present.size == 0:
+        return
+    starts, ends = bounds[present], bounds[present + 1]
+    means = np.add.reduceat(durations, starts, dtype=np.float64) / (ends - starts)
+    box_stats = [
+        _box_stats(durations[lo:hi], keys[k].capitalize())
+        for k, lo, hi in zip(present.tolist(), starts.tolist(), ends.tolist())
+    ]
+
+    fig, ax = _get_figure((9, 6))
+    # bxp writes defaults into the props dicts it is given: pass copies
+    bp = ax.bxp(box_stats, patch_artist=True, widths=0.6,
+                boxprops={**_BOXPROPS}, medianprops={**_MEDIANPROPS})
 
     ax.set_title("Trip Duration by User Type", fontweight="bold", pad=15)
     ax.set_xlabel("User Type", fontweight="bold")
     ax.set_ylabel("Duration (minutes)", fontweight="bold")
     ax.grid(axis="y", alpha=0.3, linestyle="--")
 
-    for i, group in enumerate(data, 1):
-        ax.plot(i, group.mean(), 'D', color='darkblue', markersize=6, label='Mean' if i==1 else '')
+    for i, mean in enumerate(means.tolist(), 1):
+        ax.plot(i, mean, 'D', color='darkblue', markersize=6, label='Mean' if i==1 else '')
 
     ax.legend(fontsize=10)
-    _save_figure(fig, "duration_by_user_type.png")
+    _save_figure(fig, "duration_by_user_type.png", writer)
 
 
 # ---------------------------------------------------------------------------
 # 5. Histogram — trip distance distribution
 # ---------------------------------------------------------------------------
-def plot_distance_histogram(trips: pd.DataFrame) -> None:
+def plot_distance_histogram(trips: pd.DataFrame, writer: _PNGWriter | None = None) -> None:
     if trips.empty or "distance_km" not in trips.columns:
         return
 
-    distances = trips["distance_km"].dropna()
-    if distances.empty:
+    distances = trips["distance_km"].to_numpy()
+    distances = distances[np.isfinite(distances)]
+    if distances.size == 0:
         return
 
-    fig, ax = plt.subplots(figsize=(9, 6))
-    ax.hist(distances, bins=30, color="#1f77b4", edgecolor="black", alpha=0.7)
+    fig, ax = _get_figure((9, 6))
+    counts, bins = histogram(distances, bins=30)
+    ax.bar(bins[:-1], counts, width=np.diff(bins), align="edge",
+           color="#1f77b4", edgecolor="black", alpha=0.7)
     ax.set_title("Trip Distance Distribution", fontweight="bold", pad=15)
     ax.set_xlabel("Distance (km)", fontweight="bold")
     ax.set_ylabel("Frequency", fontweight="bold")
     ax.grid(axis="y", alpha=0.3, linestyle="--")
-    _save_figure(fig, "distance_histogram.png")
+    _save_figure(fig, "distance_histogram.png", writer)
 
 
 # ---------------------------------------------------------------------------
 # 6. Line chart — average duration by hour
 # ---------------------------------------------------------------------------
-def plot_avg_duration_by_hour(trips: pd.DataFrame) -> None:
+def plot_avg_duration_by_hour(trips: pd.DataFrame, writer: _PNGWriter | None = None) -> None:
     if trips.empty or "start_time" not in trips.columns or "duration_minutes" not in trips.columns:
         return
 
-    trips["hour"] = trips["start_time"].dt.hour
-    avg_duration = trips.groupby("hour")["duration_minutes"].mean()
+    avg_duration = _group_stats(_prepare_trips(trips), "hour")["mean_duration"]
 
-    fig, ax = plt.subplots(figsize=(10, 5))
+    fig, ax = _get_figure((10, 5))
     ax.plot(avg_duration.index, avg_duration.values, marker="o", color="#2ca02c")
     ax.set_title("Average Trip Duration by Hour", fontweight="bold", pad=15)
     ax.set_xlabel("Hour of Day", fontweight="bold")
     ax.set_ylabel("Average Duration (min)", fontweight="bold")
     ax.grid(True, alpha=0.3, linestyle="--")
-    _save_figure(fig, "avg_duration_by_hour.png")
+    _save_figure(fig, "avg_duration_by_hour.png", writer)
 
 
 # ---------------------------------------------------------------------------
 # 7. Pie chart — user type proportion
 # ---------------------------------------------------------------------------
-def plot_user_type_share(trips: pd.DataFrame) -> None:
+def plot_user_type_share(trips: pd.DataFrame, writer: _PNGWriter | None = None) -> None:
     if trips.empty or "user_type" not in trips.columns:
         return
 
-    counts = trips["user_type"].value_counts()
-    fig, ax = plt.subplots(figsize=(6, 6))
+    counts = _group_stats(trips, "user_type")["trips"].sort_values(ascending=False, kind="stable")
+    fig, ax = _get_figure((6, 6))
     ax.pie(counts, labels=counts.index.str.capitalize(), autopct="%1.1f%%",
            colors=["#1f77b4","#ff7f0e"], startangle=90)
     ax.set_title("User Type Share", fontweight="bold")
-    _save_figure(fig, "user_type_share.png")
+    _save_figure(fig, "user_type_share.png", writer)
 
 
 # ---------------------------------------------------------------------------
 # 8. Bar chart — maintenance cost by bike type
 # ---------------------------------------------------------------------------
-def plot_maintenance_cost_by_bike_type(maintenance: pd.DataFrame) -> None:
+def plot_maintenance_cost_by_bike_type(
+    maintenance: pd.DataFrame, writer: _PNGWriter | None = None
+) -> None:
     if maintenance.empty or "bike_type" not in maintenance.columns:
         return
 
-    maintenance["bike_type"] = maintenance["bike_type"].str.lower().str.strip()
-    costs = maintenance.groupby("bike_type")["cost"].sum().sort_values(ascending=False)
+    bike_type = maintenance["bike_type"].str.lower().str.strip()
+    costs = maintenance["cost"].groupby(bike_type).sum().sort_values(ascending=False)
 
-    fig, ax = plt.subplots(figsize=(7, 5))
+    fig, ax = _get_figure((7, 5))
     bars = ax.bar(costs.index, costs.values, color="#FF7F0E")
     ax.set_title("Maintenance Cost by Bike Type", fontweight="bold")
     ax.set_ylabel("Cost ($)", fontweight="bold")
@@ -219,64 +523,76 @@ def plot_maintenance_cost_by_bike_type(maintenance: pd.DataFrame) -> None:
     for bar, val in zip(bars, costs.values):
         ax.text(bar.get_x() + bar.get_width()/2, val + 5, f"{val:.2f}", ha='center', fontsize=9)
 
-    _save_figure(fig, "maintenance_cost_by_bike_type.png")
+    _save_figure(fig, "maintenance_cost_by_bike_type.png", writer)
 
 
 # ---------------------------------------------------------------------------
 # 9. Heatmap — all routes (start vs end station)
 # ---------------------------------------------------------------------------
-def plot_top_routes_heatmap(trips: pd.DataFrame, n: int = None) -> None:
+def plot_top_routes_heatmap(
+    trips: pd.DataFrame, n: int = None, writer: _PNGWriter | None = None
+) -> None:
     """Heatmap of all or top-n routes by start and end station."""
     if trips.empty or "start_station_id" not in trips.columns or "end_station_id" not in trips.columns:
         return
     
-    routes = (
-        trips.groupby(["start_station_id", "end_station_id"])
-        .size()
-        .reset_index(name="count")
-        .sort_values("count", ascending=False)
-    )
+    routes = trips.groupby(["start_station_id", "end_station_id"], sort=False, observed=True).size()
     
     # If n is None, show all routes; otherwise limit to top n
     if n is not None:
-        routes = routes.head(n)
+        routes = routes.nlargest(n)
     
     if routes.empty:
         return
 
     # Get all unique stations from routes
-    all_stations = sorted(set(routes["start_station_id"].unique()) | set(routes["end_station_id"].unique()))
-    
-    # Create full pivot with all stations to ensure complete matrix
-    pivot = routes.pivot_table(index="start_station_id", columns="end_station_id", values="count", fill_value=0)
-    
-    # Reindex to include all stations
-    pivot = pivot.reindex(index=all_stations, columns=all_stations, fill_value=0)
+    starts = routes.index.get_level_values(0).astype(str)
+    ends = routes.index.get_level_values(1).astype(str)
+    all_stations = sorted(set(starts) | set(ends))
 
-    # Adjust figure size based on number of stations
+    # The counts are already aggregated, one per (start, end) pair: scatter
+    # them straight into a square matrix by station position instead of
+    # reshaping through a DataFrame.
     num_stations = len(all_stations)
+    station_index = pd.Index(all_stations)
+    start_codes = station_index.get_indexer(starts)
+    end_codes = station_index.get_indexer(ends)
+    counts = routes.to_numpy()
+    if HAS_SCIPY:
+        arr = coo_matrix(
+            (counts, (start_codes, end_codes)), shape=(num_stations, num_stations)
+        ).toarray()
+    else:
+        arr = np.zeros((num_stations, num_stations), dtype=counts.dtype)
+        arr[start_codes, end_codes] = counts
+
+    # Adjust figure size based on number of stations
     fig_size = max(10, num_stations * 0.8)
     font_size = max(6, 12 - num_stations // 3)
     
-    fig, ax = plt.subplots(figsize=(fig_size, fig_size))
-    im = ax.imshow(pivot, cmap="YlOrRd", aspect="auto")
+    fig, ax = _get_figure((fig_size, fig_size))
+    im = ax.imshow(arr, cmap="YlOrRd", aspect="auto")
     
     # Add colorbar
     cbar = fig.colorbar(im, ax=ax, label="Trip Count")
     
     # Set ticks and labels
-    ax.set_xticks(range(len(pivot.columns)))
-    ax.set_yticks(range(len(pivot.index)))
-    ax.set_xticklabels(pivot.columns, rotation=45, ha="right", fontsize=font_size)
-    ax.set_yticklabels(pivot.index, fontsize=font_size)
+    ax.set_xticks(range(num_stations))
+    ax.set_yticks(range(num_stations))
+    ax.set_xticklabels(all_stations, rotation=45, ha="right", fontsize=font_size)
+    ax.set_yticklabels(all_stations, fontsize=font_size)
     
-    # Add text annotations for non-zero values
-    for i in range(len(pivot.index)):
-        for j in range(len(pivot.columns)):
-            val = pivot.iloc[i, j]
-            if val > 0:
-                text_color = "white" if val > pivot.values.max() * 0.5 else "black"
-                ax.text(j, i, f"{int(val)}", ha="center", va="center", color=text_color, fontsize=font_size-1, fontweight="bold")
+    # Annotate only the non-zero cells. Each label is its own Text artist,
+    # so large matrices skip them and rely on the colorbar. Labels and
+    # colors are formatted for all cells at once.
+    if num_stations <= HEATMAP_ANNOTATE_MAX_STATIONS:
+        rows, cols = np.nonzero(arr)
+        cell_counts = arr[rows, cols]
+        labels = cell_counts.astype(np.int64).astype(str).tolist()
+        colors = np.where(cell_counts > arr.max() * 0.5, "white", "black").tolist()
+        for i, j, label, color in zip(rows.tolist(), cols.tolist(), labels, colors):
+            ax.text(j, i, label, ha="center", va="center",
+                    color=color, fontsize=font_size-1, fontweight="bold")
 
     ax.set_xlabel("End Station", fontweight="bold", fontsize=11)
     ax.set_ylabel("Start Station", fontweight="bold", fontsize=11)
@@ -290,5 +606,83 @@ def plot_top_routes_heatmap(trips: pd.DataFrame, n: int = None) -> None:
     
     ax.set_title(title, fontweight="bold", fontsize=12, pad=15)
     
-    _save_figure(fig, filename)
+    _save_figure(fig, filename, writer)
 
+
+# ---------------------------------------------------------------------------
+# Parallel rendering
+# ---------------------------------------------------------------------------
+# Chart name -> (plot function, {table: columns it reads}), in argument
+# order. Workers receive only those columns of each table.
+_PLOTS = {
+    "trips_per_station": (
+        plot_trips_per_station,
+        {"trips": ("start_station_id",), "stations": ("station_id", "station_name")},
+    ),
+    "monthly_trend": (plot_monthly_trend, {"trips": ("start_time", "hour")}),
+    "duration_histogram": (plot_duration_histogram, {"trips": ("duration_minutes",)}),
+    "duration_by_user_type": (
+        plot_duration_by_user_type, {"trips": ("user_type", "duration_minutes")}
+    ),
+    "distance_histogram": (plot_distance_histogram, {"trips": ("distance_km",)}),
+    "avg_duration_by_hour": (
+        plot_avg_duration_by_hour, {"trips": ("start_time", "hour", "duration_minutes")}
+    ),
+    "user_type_share": (plot_user_type_share, {"trips": ("user_type",)}),
+    "maintenance_cost_by_bike_type": (
+        plot_maintenance_cost_by_bike_type, {"maintenance": ("bike_type", "cost")}
+    ),
+    "top_routes_heatmap": (
+        plot_top_routes_heatmap, {"trips": ("start_station_id", "end_station_id")}
+    ),
+}
+
+
+def _plot_in_worker(name: str, dpi: int, *tables: pd.DataFrame) -> list[Path]:
+    """Render chart *name* and return the paths it saved."""
+    global _dpi
+    _dpi = dpi
+    plot, _ = _PLOTS[name]
+    plot(*tables)
+    saved = _saved.copy()
+    _saved.clear()
+    return saved
+
+
+def plot_all_parallel(
+    trips: pd.DataFrame,
+    stations: pd.DataFrame,
+    maintenance: pd.DataFrame,
+    max_workers: int | None = None,
+    preview: bool = False,
+) -> None:
+    """Render every chart across a pool of processes.
+
+    Each chart is independent and CPU-bound in Agg, and the GIL keeps
+    threads from drawing in parallel, so charts go to separate processes.
+    Each task is sent only the columns its chart reads (see ``_PLOTS``),
+    so a few columns are pickled per chart instead of whole tables.
+    Worth it on multi-core machines; ``plot_all`` avoids the process
+    start-up cost on small data. *preview* is as for ``plot_all``.
+    Workers send back the paths they saved, for ``report_saved`` here.
+    """
+    sources = {"trips": _prepare_trips(trips), "stations": stations, "maintenance": maintenance}
+    workers = max_workers or min(len(_PLOTS), os.cpu_count() or 1)
+    # Spawned, not forked: forking a parent whose Numba thread pool is
+    # already running (numerical.histogram) deadlocks the children.
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = [
+            pool.submit(
+                _plot_in_worker,
+                name,
+                PREVIEW_DPI if preview else DPI,
+                *(
+                    sources[table][[c for c in columns if c in sources[table].columns]]
+                    for table, columns in tables.items()
+                ),
+            )
+            for name, (_, tables) in _PLOTS.items()
+        ]
+        for future in futures:
+            _saved.extend(future.result())